@@ -0,0 +1,10 @@
+"""Benchmarks for the hot paths of biquaternion_py.
+
+Run all benchmarks and store the results with
+
+    python -m benchmarks run -o results.json
+
+and compare them with a stored baseline with
+
+    python -m benchmarks compare baseline.json results.json
+"""
@@ -0,0 +1,68 @@
+"""Command line interface of the benchmarks."""
+
+import argparse
+import sys
+from .runner import run, compare, load, dump
+from .growth import growth, print_growth
+from .workloads import WORKLOADS
+
+
+def _print_comparison(rows, regressions, threshold):
+    print(f"{'case':30s} {'baseline':>12s} {'current':>12s} {'ratio':>8s}")
+    for case, old, new, ratio in rows:
+        flag = "  REGRESSION" if case in regressions else ""
+        print(f"{case:30s} {old * 1e6:10.1f}us {new * 1e6:10.1f}us {ratio:8.2f}{flag}")
+    if regressions:
+        print(f"{len(regressions)} case(s) slower than {threshold}x the baseline.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("-o", "--output", help="write results to this JSON file")
+    run_parser.add_argument(
+        "-b", "--baseline", help="compare the results with this JSON file"
+    )
+    run_parser.add_argument("-k", "--only", nargs="+", choices=sorted(WORKLOADS))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.2)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--threshold", type=float, default=1.2)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=1.2)
+
+    growth_parser = commands.add_parser(
+        "growth", help="coefficient growth of polynomial division"
+    )
+    growth_parser.add_argument("--degrees", type=int, nargs="+")
+    growth_parser.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+    if args.command == "growth":
+        if args.degrees:
+            print_growth(growth(args.degrees, args.seed))
+        else:
+            print_growth(growth(seed_value=args.seed))
+        return 0
+    if args.command == "run":
+        results = run(args.only, args.repeat, args.min_time, args.seed, verbose=True)
+        if args.output:
+            dump(results, args.output)
+        if not args.baseline:
+            return 0
+        baseline = load(args.baseline)
+    else:
+        baseline, results = load(args.baseline), load(args.results)
+
+    rows, regressions = compare(baseline, results, args.threshold)
+    _print_comparison(rows, regressions, args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Coefficient growth of polynomial division versus the degree.
+
+For every degree a random polynomial with integer coefficients is divided by a
+random quadratic polynomial with integer coefficients and a non real leading
+coefficient, once with `DensePoly.div` and once with the fraction-free
+`DensePoly.pseudo_div`. The size of a coefficient is the number of bits of its
+numerator plus the number of bits of its denominator.
+"""
+
+import sympy as sy
+import biquaternion_py as bq
+from .workloads import seed, _T
+
+
+def _bits(polys):
+    """Maximal size in bits of the rational coefficients of dense polynomials."""
+    out = 0
+    for poly in polys:
+        for quat in poly.coeffs:
+            for val in quat.coeffs:
+                val = sy.Rational(val)
+                out = max(out, val.p.bit_length() + val.q.bit_length())
+    return out
+
+
+def _rand_dense(deg):
+    return bq.DensePoly([bq.rand_bq() for _ in range(deg + 1)], _T)
+
+
+def growth(degrees=(2, 4, 6, 8, 10, 12, 14, 16, 18, 20), seed_value=0):
+    """Coefficient sizes of quotient and remainder for both divisions.
+
+    Returns
+    -------
+    list of tuple
+        Tuples `(degree, bits of div, bits of pseudo_div, bits of scale)`.
+    """
+    rows = []
+    for deg in degrees:
+        seed(seed_value)
+        divisor = _rand_dense(2)
+        poly = _rand_dense(deg)
+        plain = _bits(poly.div(divisor))
+        scale, quot, rem = poly.pseudo_div(divisor)
+        rows.append(
+            (deg, plain, _bits([quot, rem]), _bits([bq.DensePoly([scale], _T)]))
+        )
+    return rows
+
+
+def print_growth(rows):
+    print(f"{'degree':>6s} {'div':>10s} {'pseudo_div':>10s} {'scale':>10s}")
+    for deg, plain, free, scale in rows:
+        print(f"{deg:6d} {plain:10d} {free:10d} {scale:10d}")
@@ -0,0 +1,106 @@
+"""Run the benchmarks and compare results with a baseline."""
+
+import json
+import platform
+import statistics
+import timeit
+import numpy as np
+import sympy as sy
+from .workloads import WORKLOADS, seed
+
+
+def _case_name(name, param):
+    return name if param is None else f"{name}[{param}]"
+
+
+def time_case(func, repeat=5, min_time=0.2):
+    """Time func and return the minimal and median time per call in seconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    times = [val / number for val in timer.repeat(repeat, number)]
+    return {"min": min(times), "median": statistics.median(times), "number": number}
+
+
+def run(names=None, repeat=5, min_time=0.2, seed_value=0, verbose=False):
+    """Run benchmarks.
+
+    Parameters
+    ----------
+    names : list of str, optional
+        Names of the workloads to run.
+        (Default None runs all workloads)
+    repeat : int, optional
+        Number of timing repetitions per case.
+    min_time : float, optional
+        Approximate minimal duration of one repetition in seconds.
+    seed_value : int, optional
+        Seed for the random inputs of all workloads.
+    verbose : bool, optional
+        Print each result as soon as it is available.
+
+    Returns
+    -------
+    dict
+        Dictionary with the metadata of the run and the timings of all cases.
+    """
+    results = {}
+    for name, (setup, params) in WORKLOADS.items():
+        if names and name not in names:
+            continue
+        for param in params:
+            seed(seed_value)
+            result = time_case(setup(param), repeat, min_time)
+            results[_case_name(name, param)] = result
+            if verbose:
+                print(f"{_case_name(name, param):30s} {result['min'] * 1e6:12.1f} us")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "sympy": sy.__version__,
+            "seed": seed_value,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, results, threshold=1.2):
+    """Compare results with a baseline.
+
+    Parameters
+    ----------
+    baseline, results : dict
+        Outputs of `run`.
+    threshold : float, optional
+        Cases, whose minimal time exceeds the one of the baseline by more than
+        this factor, are regressions.
+
+    Returns
+    -------
+    rows : list of tuple
+        Tuples `(case, baseline time, time, ratio)` for all common cases.
+    regressions : list of str
+        Names of the regressed cases.
+    """
+    rows = []
+    regressions = []
+    for case, result in results["results"].items():
+        if case not in baseline["results"]:
+            continue
+        old = baseline["results"][case]["min"]
+        ratio = result["min"] / old
+        rows.append((case, old, result["min"], ratio))
+        if ratio > threshold:
+            regressions.append(case)
+    return rows, regressions
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def dump(results, path):
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
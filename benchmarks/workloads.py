@@ -0,0 +1,142 @@
+"""Seeded workloads for the benchmarks.
+
+Every workload is a function, which takes a parameter (mostly a degree), builds
+its inputs with `biquaternion_py.random_gen` and returns the function to time.
+Workloads are registered in `WORKLOADS` with the `workload` decorator.
+"""
+
+import subprocess
+import sys
+import numpy.random as rand
+import sympy as sy
+import biquaternion_py as bq
+
+WORKLOADS = {}
+
+_T = sy.Symbol("t")
+
+
+def workload(name, params=(None,)):
+    """Register a workload under `name` for all parameters in `params`."""
+
+    def register(func):
+        WORKLOADS[name] = (func, tuple(params))
+        return func
+
+    return register
+
+
+def seed(value):
+    """Seed the random generators used by `biquaternion_py.random_gen`."""
+    rand.seed(value)
+
+
+def motion_poly(deg):
+    """Product of `deg` random linear factors `t - h` with h on Study's quadric."""
+    poly = bq.Poly(1, _T)
+    for _ in range(deg):
+        poly = poly * bq.Poly(_T - (bq.rand_rational() + bq.rand_line()), _T)
+    return poly
+
+
+def bq_poly(deg):
+    """Product of `deg` random linear factors `t - h` with arbitrary h."""
+    poly = bq.Poly(1, _T)
+    for _ in range(deg):
+        poly = poly * bq.Poly(_T - bq.rand_bq(), _T)
+    return poly
+
+
+@workload("bq_mul")
+def bq_mul(_):
+    first, second = bq.rand_bq(), bq.rand_bq()
+    return lambda: first * second
+
+
+@workload("bq_inv")
+def bq_inv(_):
+    quat = bq.rand_bq()
+    return quat.inv
+
+
+@workload("bq_pow", (2, 5, 10))
+def bq_pow(exponent):
+    quat = bq.rand_bq()
+    return lambda: quat**exponent
+
+
+@workload("num_bq_mul")
+def num_bq_mul(_):
+    first = bq.NumBiQuaternion(bq.rand_bq())
+    second = bq.NumBiQuaternion(bq.rand_bq())
+    return lambda: first * second
+
+
+@workload("act_on_points", (1000, 100000))
+def act_on_points(num):
+    quat = bq.rand_rational() + bq.rand_line()
+    points = rand.normal(size=(num, 3))
+    return lambda: bq.act_on_points(quat, points)
+
+
+@workload("poly_mul", (2, 4, 6, 8, 10))
+def poly_mul(deg):
+    first, second = bq_poly(deg // 2), bq_poly(deg - deg // 2)
+    return lambda: first * second
+
+
+@workload("domain_poly_mul", (2, 4, 6, 8, 10))
+def domain_poly_mul(deg):
+    first = bq.DensePoly.from_poly(motion_poly(deg // 2)).to_domain()
+    second = bq.DensePoly.from_poly(motion_poly(deg - deg // 2)).to_domain()
+    return lambda: first * second
+
+
+@workload("poly_div", (2, 4, 6, 8, 10))
+def poly_div(deg):
+    poly = bq_poly(deg)
+    lin = bq.Poly(_T - bq.rand_bq(), _T)
+    return lambda: bq.poly_div(poly, lin, _T, False)
+
+
+@workload("poly_pseudo_div", (2, 4, 6, 8, 10))
+def poly_pseudo_div(deg):
+    poly = bq.DensePoly.from_poly(bq_poly(deg))
+    divisor = bq.DensePoly.from_poly(bq.Poly(bq.rand_bq() * _T - bq.rand_bq(), _T))
+    return lambda: poly.pseudo_div(divisor)
+
+
+@workload("poly_eval", (2, 6, 10))
+def poly_eval(deg):
+    poly = bq_poly(deg)
+    val = bq.rand_rational()
+    return lambda: bq.Poly(poly.poly, _T).eval(val)
+
+
+@workload("is_poly_reduced", (2, 4, 6))
+def is_poly_reduced(deg):
+    poly = motion_poly(deg)
+    return lambda: bq.is_poly_reduced(poly)
+
+
+@workload("irreducible_factors", (2, 3, 4))
+def irreducible_factors(deg):
+    poly = motion_poly(deg)
+    norm = bq.Poly(poly.norm_poly()[0].as_expr(), _T)
+    return lambda: bq.irreducible_factors(norm)
+
+
+@workload("factorize_bq_poly", (2, 3, 4))
+def factorize_bq_poly(deg):
+    poly = motion_poly(deg)
+    return lambda: bq.factorize_bq_poly(poly)
+
+
+@workload("import", ("numeric", "symbolic"))
+def import_time(kind):
+    # Import in a fresh interpreter, which includes its start up time.
+    code = {
+        "numeric": "import biquaternion_py.numeric",
+        "symbolic": "import biquaternion_py; biquaternion_py.BiQuaternion",
+    }[kind]
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True)
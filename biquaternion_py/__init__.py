@@ -1,37 +1,95 @@
-from .biquaternion import (
-    define_algebra,
-    BiQuaternion,
-    II,
-    JJ,
-    KK,
-    EE,
-)
-from .biquat_tools import (
-    point_to_quat,
-    quat_to_point,
-    hom_point_to_quat,
-    quat_to_hom_point,
-    act_on_point,
-    smart_act,
-    inner,
-    outer,
-    fiber_project,
-)
-from .polynomials import Poly, poly_div
-from .poly_tools import (
-    max_real_poly_fact,
-    gcd_conj_pd,
-    is_poly_reduced,
-    factorize_bq_poly,
-    factorize_from_list,
-    split_lin_factor,
-    irreducible_factors,
-    # is_poly_real,
-)
-from .random_gen import rand_bq, rand_line, rand_quat, rand_rational
-from .lines import (
-    pluecker_to_quat,
-    quat_to_pluecker,
-    line_to_pluecker,
-    act_on_line,
-)
+"""Sympy compatible implementation of general biquaternion algebras.
+
+The public names of the submodules are loaded lazily on first access, such that
+sympy is only imported when symbolic features are used. Use
+`biquaternion_py.numeric` for purely numeric calculations without sympy.
+"""
+
+from importlib import import_module
+
+_SUBMODULE_NAMES = {
+    "biquaternion": (
+        "define_algebra",
+        "BiQuaternion",
+        "II",
+        "JJ",
+        "KK",
+        "EE",
+    ),
+    "algebra": ("Algebra", "current_algebra", "use_algebra"),
+    "bq_array": ("BiQuaternionArray",),
+    "num_biquaternion": ("NumBiQuaternion",),
+    "domain": ("DomainBiQuaternion",),
+    "biquat_tools": (
+        "point_to_quat",
+        "quat_to_point",
+        "hom_point_to_quat",
+        "quat_to_hom_point",
+        "act_on_point",
+        "smart_act",
+        "inner",
+        "outer",
+        "fiber_project",
+    ),
+    "matrices": (
+        "to_homogeneous_matrix",
+        "to_rotation_matrix",
+        "from_homogeneous_matrix",
+        "act_on_points",
+    ),
+    "polynomials": ("Poly", "poly_div"),
+    "dense_poly": ("DensePoly",),
+    "compiled": ("lambdify_bq", "clear_lambdify_cache"),
+    "poly_tools": (
+        "max_real_poly_fact",
+        "gcd_conj_pd",
+        "is_poly_reduced",
+        "reduce_poly",
+        "factorize_bq_poly",
+        "factorize_bq_poly_numeric",
+        "all_factorizations",
+        "FactorizationCache",
+        "factorize_from_list",
+        "split_lin_factor",
+        "irreducible_factors",
+        # "is_poly_real",
+    ),
+    "random_gen": ("rand_bq", "rand_line", "rand_quat", "rand_rational"),
+    "lines": (
+        "pluecker_to_quat",
+        "quat_to_pluecker",
+        "line_to_pluecker",
+        "act_on_line",
+        "on_klein_quadric",
+        "pluecker_to_quat_array",
+        "quat_array_to_pluecker",
+        "lines_to_pluecker",
+        "act_on_lines",
+    ),
+}
+
+_LAZY_NAMES = {
+    name: module for module, names in _SUBMODULE_NAMES.items() for name in names
+}
+
+# `define_algebra` rebinds the units, hence they are looked up on every access.
+_UNCACHED_NAMES = {"II", "JJ", "KK", "EE"}
+
+_SUBMODULES = set(_SUBMODULE_NAMES) | {"numeric", "profiling"}
+
+__all__ = list(_LAZY_NAMES) + ["profiling"]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module("." + name, __name__)
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module("." + _LAZY_NAMES[name], __name__), name)
+    if name not in _UNCACHED_NAMES:
+        globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | _SUBMODULES)
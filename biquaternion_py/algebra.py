@@ -0,0 +1,504 @@
+"""Biquaternion algebras with precompiled multiplication tables.
+
+This module implements the algebras of biquaternions as objects. Each algebra
+builds its structure constants once and BiQuaternions can be bound to it.
+The algebra used for unbound BiQuaternions is scoped by a context variable,
+such that threads and asyncio tasks may use different algebras concurrently.
+
+Classes:
+
+    Algebra
+
+Functions:
+
+    current_algebra
+    use_algebra
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+def _mult_table(i_square=-1, j_square=-1, e_square=0):
+    """Generate the multiplication table of the biquaternion basis.
+
+    Parameters
+    ----------
+    i_square : float, sympy.Expr
+        value of II**2
+    j_square : float, sympy.Expr
+        value of JJ**2
+    e_square : float, sympy.Expr
+        value of EE**2
+
+    Returns
+    -------
+    list
+        List of tuples `(left, right, out, factor)` such that the product of the
+        basis elements `left` and `right` is `factor` times the basis element `out`.
+    """
+    a, b, c = i_square, j_square, e_square
+    # Products of the quaternion units 1, i, j, k as (factor, unit).
+    quat = [
+        [(1, 0), (1, 1), (1, 2), (1, 3)],
+        [(1, 1), (a, 0), (1, 3), (a, 2)],
+        [(1, 2), (-1, 3), (b, 0), (-b, 1)],
+        [(1, 3), (-a, 2), (b, 1), (-a * b, 0)],
+    ]
+    table = []
+    for left in range(8):
+        for right in range(8):
+            factor, unit = quat[left % 4][right % 4]
+            eps_pow = left // 4 + right // 4
+            if eps_pow == 2:
+                factor = factor * c
+            table.append((left, right, 4 * (eps_pow % 2) + unit, factor))
+    return table
+
+
+def _to_number(val):
+    """Convert a (sympy) number into a python float or complex."""
+    try:
+        return float(val)
+    except TypeError:
+        return complex(val)
+
+
+class Algebra:
+    """
+    Class implementing a biquaternion algebra.
+
+    The algebra is defined by the squares of its generators II, JJ and EE.
+    Its multiplication table is computed once on creation. Terms of the table
+    that vanish for the given signature are dropped.
+
+    Attributes
+    ----------
+    i_square : float, sympy.Expr
+        value of II**2
+    j_square : float, sympy.Expr
+        value of JJ**2
+    e_square : float, sympy.Expr
+        value of EE**2
+    signature : tuple
+        Tuple `(i_square, j_square, e_square)`.
+    table : tuple
+        Nonzero entries `(left, right, out, factor)` of the multiplication table.
+    products : tuple
+        Nonzero entries `(left, right, factor)` of the table grouped by `out`.
+    II, JJ, KK, EE : BiQuaternion
+        Units of the algebra bound to it.
+
+    Methods
+    -------
+    BiQuaternion(*args):
+        Create a BiQuaternion bound to this algebra.
+    sparse_products(first_mask, second_mask):
+        Entries of `products` for factors with the given nonzero coefficients.
+    numeric_table():
+        Multiplication table with python numbers as factors.
+    sparse_numeric_table(first_mask, second_mask):
+        Entries of `numeric_table()` for factors with given nonzero coefficients.
+    structure_tensor():
+        Structure constants as a `(64, 8)` NumPy array.
+    """
+
+    def __init__(self, i_square=-1, j_square=-1, e_square=0):
+        """Create the algebra and precompute its multiplication table."""
+        self._signature = (i_square, j_square, e_square)
+        self._table = tuple(
+            entry for entry in _mult_table(*self._signature) if entry[3] != 0
+        )
+        self._products = tuple(
+            tuple(
+                (left, right, factor)
+                for left, right, idx, factor in self._table
+                if idx == out
+            )
+            for out in range(8)
+        )
+        self._numeric_table = None
+        self._numeric_signature = None
+        self._tensor = None
+        self._sparse_products = {}
+        self._sparse_numeric_tables = {}
+
+    @property
+    def i_square(self):
+        """Value of II**2."""
+        return self._signature[0]
+
+    @property
+    def j_square(self):
+        """Value of JJ**2."""
+        return self._signature[1]
+
+    @property
+    def e_square(self):
+        """Value of EE**2."""
+        return self._signature[2]
+
+    @property
+    def signature(self):
+        """Tuple `(i_square, j_square, e_square)` defining the algebra."""
+        return self._signature
+
+    @property
+    def table(self):
+        """Nonzero entries `(left, right, out, factor)` of the multiplication table."""
+        return self._table
+
+    @property
+    def products(self):
+        """Nonzero entries `(left, right, factor)` of the table grouped by output."""
+        return self._products
+
+    def __eq__(self, other):
+        if not isinstance(other, Algebra):
+            return NotImplemented
+        return self._signature == other._signature
+
+    def __hash__(self):
+        return hash(self._signature)
+
+    def __repr__(self):
+        return "Algebra({}, {}, {})".format(*map(repr, self._signature))
+
+    def BiQuaternion(self, *args):
+        """Create a BiQuaternion bound to this algebra.
+
+        Parameters
+        ----------
+        *args :
+            Arguments as for `BiQuaternion`.
+
+        Returns
+        -------
+        BiQuaternion
+            BiQuaternion, which is multiplied according to this algebra.
+        """
+        from .biquaternion import BiQuaternion
+
+        obj = BiQuaternion(*args)
+        obj._algebra = self
+        return obj
+
+    @property
+    def II(self):
+        """Unit II of the algebra."""
+        return self.BiQuaternion(0, 1)
+
+    @property
+    def JJ(self):
+        """Unit JJ of the algebra."""
+        return self.BiQuaternion(0, 0, 1)
+
+    @property
+    def KK(self):
+        """Unit KK of the algebra."""
+        return self.BiQuaternion(0, 0, 0, 1)
+
+    @property
+    def EE(self):
+        """Unit EE of the algebra."""
+        return self.BiQuaternion(0, 0, 0, 0, 1)
+
+    def sparse_products(self, first_mask, second_mask):
+        """Entries of `products`, which are not structurally zero.
+
+        Parameters
+        ----------
+        first_mask : int
+            Bitmask of the nonzero coefficients of the left factor.
+        second_mask : int
+            Bitmask of the nonzero coefficients of the right factor.
+
+        Returns
+        -------
+        tuple
+            Entries `(left, right, factor)` of the table grouped by output, where
+            coefficient `left` of the first and `right` of the second factor are
+            nonzero. The result is cached for each pair of masks.
+        """
+        key = (first_mask, second_mask)
+        products = self._sparse_products.get(key)
+        if products is None:
+            products = tuple(
+                tuple(
+                    entry
+                    for entry in terms
+                    if first_mask >> entry[0] & 1 and second_mask >> entry[1] & 1
+                )
+                for terms in self._products
+            )
+            self._sparse_products[key] = products
+        return products
+
+    def sparse_numeric_table(self, first_mask, second_mask):
+        """Entries of `numeric_table()`, which are not structurally zero.
+
+        Parameters
+        ----------
+        first_mask : int
+            Bitmask of the nonzero coefficients of the left factor.
+        second_mask : int
+            Bitmask of the nonzero coefficients of the right factor.
+
+        Returns
+        -------
+        table : tuple
+            Entries `(left, right, out, factor)` of the numeric table, where
+            coefficient `left` of the first and `right` of the second factor are
+            nonzero.
+        out_mask : int
+            Bitmask of the coefficients of the product, which may be nonzero.
+
+        Notes
+        -----
+        The result is cached for each pair of masks.
+        """
+        key = (first_mask, second_mask)
+        entry = self._sparse_numeric_tables.get(key)
+        if entry is None:
+            table = tuple(
+                entry
+                for entry in self.numeric_table()
+                if first_mask >> entry[0] & 1 and second_mask >> entry[1] & 1
+            )
+            out_mask = 0
+            for val in table:
+                out_mask |= 1 << val[2]
+            entry = (table, out_mask)
+            self._sparse_numeric_tables[key] = entry
+        return entry
+
+    def numeric_table(self):
+        """Multiplication table with python numbers as factors.
+
+        Returns
+        -------
+        tuple
+            Nonzero entries `(left, right, out, factor)` of the multiplication table.
+
+        Raises
+        ------
+        TypeError
+            If the signature of the algebra is not numeric.
+        """
+        if self._numeric_table is None:
+            try:
+                self._numeric_table = tuple(
+                    (left, right, idx, _to_number(factor))
+                    for left, right, idx, factor in self._table
+                )
+            except TypeError:
+                raise TypeError("Numeric calculations need a numeric signature.")
+        return self._numeric_table
+
+    def numeric_signature(self):
+        """Signature of the algebra with python numbers.
+
+        Raises
+        ------
+        TypeError
+            If the signature of the algebra is not numeric.
+        """
+        if self._numeric_signature is None:
+            try:
+                self._numeric_signature = tuple(map(_to_number, self._signature))
+            except TypeError:
+                raise TypeError("Numeric calculations need a numeric signature.")
+        return self._numeric_signature
+
+    def structure_tensor(self):
+        """Structure constants of the algebra as a `(64, 8)` array.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array `T`, such that the product of `x` and `y` is the outer product of
+            `x` and `y` flattened to length 64 times `T`.
+
+        Raises
+        ------
+        TypeError
+            If the signature of the algebra is not numeric.
+        """
+        if self._tensor is None:
+            import numpy as np
+
+            table = self.numeric_table()
+            dtype = float
+            if any(isinstance(entry[3], complex) for entry in table):
+                dtype = complex
+            tensor = np.zeros((8, 8, 8), dtype=dtype)
+            for left, right, idx, factor in table:
+                tensor[left, right, idx] = factor
+            self._tensor = tensor.reshape(64, 8)
+        return self._tensor
+
+
+_DEFAULT_ALGEBRA = Algebra()
+_CURRENT_ALGEBRA = ContextVar("biquaternion_algebra", default=None)
+
+
+def _set_default_algebra(algebra):
+    """Set the algebra used, when no algebra is set in the current context."""
+    global _DEFAULT_ALGEBRA
+    _DEFAULT_ALGEBRA = algebra
+
+
+def current_algebra():
+    """Algebra used for BiQuaternions, which are not bound to an algebra.
+
+    Returns
+    -------
+    Algebra
+        Algebra set by `use_algebra` in the current context, or else the algebra
+        set by `define_algebra`.
+    """
+    algebra = _CURRENT_ALGEBRA.get()
+    if algebra is None:
+        return _DEFAULT_ALGEBRA
+    return algebra
+
+
+@contextmanager
+def use_algebra(algebra):
+    """Use `algebra` for unbound BiQuaternions in the current context.
+
+    Parameters
+    ----------
+    algebra : Algebra
+        Algebra to use within the `with` block.
+
+    Notes
+    -----
+    The algebra is stored in a context variable. It is therefore local to the
+    current thread, or asyncio task, and does not affect other ones.
+    """
+    token = _CURRENT_ALGEBRA.set(algebra)
+    try:
+        yield algebra
+    finally:
+        _CURRENT_ALGEBRA.reset(token)
+
+
+def _resolve_algebra(first, second):
+    """Algebra for an operation between objects bound to `first` and `second`."""
+    if first is None:
+        return current_algebra() if second is None else second
+    if second is not None and second != first:
+        raise ValueError("Objects belong to different algebras.")
+    return first
+
+
+def _quadrance_parts(coeffs, signature):
+    """Closed form of the quadrance of a biquaternion.
+
+    Parameters
+    ----------
+    coeffs : sequence
+        The 8 coefficients of a biquaternion. They may be sympy expressions,
+        numbers or NumPy arrays of equal shape.
+    signature : tuple
+        Signature `(i_square, j_square, e_square)` of the algebra.
+
+    Returns
+    -------
+    scal : type(coeffs[0])
+        Scalar part of `x * x.conjugate()`.
+    eps : type(coeffs[0])
+        Epsilon scalar part of `x * x.conjugate()`.
+
+    Notes
+    -----
+    For `x = p + EE * d` the quadrance is
+    `N(p) + e_square * N(d) + EE * (p * d.conjugate() + d * p.conjugate())`,
+    where all summands are scalars. All other coefficients vanish.
+    """
+    a, b, e = signature
+    weights = (1, -a, -b, a * b)
+    scal = 0
+    eps = 0
+    for n, weight in enumerate(weights):
+        scal = scal + weight * coeffs[n] * coeffs[n]
+        eps = eps + 2 * weight * coeffs[n] * coeffs[n + 4]
+    if e != 0:
+        for n, weight in enumerate(weights):
+            scal = scal + e * weight * coeffs[n + 4] * coeffs[n + 4]
+    return scal, eps
+
+
+def _inverse_coeffs(coeffs, signature):
+    """Closed form of the inverse of a biquaternion.
+
+    Parameters
+    ----------
+    coeffs : sequence
+        The 8 coefficients of a biquaternion. They may be sympy expressions,
+        numbers or NumPy arrays of equal shape.
+    signature : tuple
+        Signature `(i_square, j_square, e_square)` of the algebra.
+
+    Returns
+    -------
+    out : list
+        Coefficients of the inverse.
+
+    Raises
+    ------
+    ValueError
+        If the biquaternion (or any of them for arrays) is not invertible.
+
+    Notes
+    -----
+    With the quadrance `A + EE * B` of `x`, the inverse is
+    `(A - EE * B) * x.conjugate() / (A**2 - e_square * B**2)`.
+    """
+    e = signature[2]
+    scal, eps = _quadrance_parts(coeffs, signature)
+    det = scal * scal
+    if e != 0:
+        det = det - e * eps * eps
+    singular = det == 0
+    if singular is True or (hasattr(singular, "any") and singular.any()):
+        raise ValueError("Object is not invertible")
+    conj = [coeffs[0], -coeffs[1], -coeffs[2], -coeffs[3]]
+    conj_dual = [coeffs[4], -coeffs[5], -coeffs[6], -coeffs[7]]
+    primal = [scal * val for val in conj]
+    if e != 0:
+        primal = [val - e * eps * dval for val, dval in zip(primal, conj_dual)]
+    dual = [scal * dval - eps * val for val, dval in zip(conj, conj_dual)]
+    return [val / det for val in primal + dual]
+
+
+def _binary_power(base, exponent, step=None):
+    """Power of `base` for a positive integer exponent by repeated squaring.
+
+    Parameters
+    ----------
+    base :
+        Element of an (associative) algebra.
+    exponent : int
+        Positive exponent.
+    step : function, optional
+        Function applied to each intermediate product, e.g. `sympy.expand`.
+
+    Returns
+    -------
+    type(base)
+        `base**exponent` computed with O(log(exponent)) products.
+    """
+    result = None
+    while True:
+        if exponent & 1:
+            result = base if result is None else result * base
+            if step is not None and result is not base:
+                result = step(result)
+        exponent >>= 1
+        if not exponent:
+            return result
+        base = base * base
+        if step is not None:
+            base = step(base)
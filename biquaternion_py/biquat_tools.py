@@ -3,6 +3,8 @@ Module containing extra generation tools and function for specialized BiQuaterni
 """
 import numpy as np
 from .biquaternion import BiQuaternion, EE
+from .num_biquaternion import NumBiQuaternion
+from .matrices import act_on_points  # noqa: F401
 from .lines import quat_to_pluecker, pluecker_to_quat, act_on_line
 
 
@@ -44,9 +46,10 @@ def smart_act(quat, obj):
     """General purpose function for letting BiQuaternions act on object that detects
     object type.
     """
-    if isinstance(obj, BiQuaternion):
+    if isinstance(obj, (BiQuaternion, NumBiQuaternion)):
         # Detect if it is a line
-        if obj.scal.expand() == 0 and obj.primal() != 0:
+        scal = obj.scal.expand() if isinstance(obj, BiQuaternion) else obj.scal
+        if scal == 0 and obj.primal() != 0:
             return act_on_line(quat, obj)
         return act_on_point(quat, obj)
     elif isinstance(obj, (list, tuple, np.ndarray)):
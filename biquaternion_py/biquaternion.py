@@ -16,12 +16,20 @@ Misc variables:
 
 import numpy as np
 from sympy.core.expr import Expr
-from sympy import sympify, expand
+from sympy import sympify, expand, Add, S
 from .polynomials import Poly
-
-_BQ_I = -1
-_BQ_J = -1
-_BQ_E = 0
+from .profiling import profiled
+from .bq_array import BiQuaternionArray
+from .num_biquaternion import NumBiQuaternion
+from .algebra import (
+    Algebra,
+    current_algebra,
+    _resolve_algebra,
+    _set_default_algebra,
+    _binary_power,
+    _quadrance_parts,
+    _inverse_coeffs,
+)
 
 
 def define_algebra(i_square=-1, j_square=-1, e_square=0):
@@ -48,25 +56,37 @@ def define_algebra(i_square=-1, j_square=-1, e_square=0):
     ei = ie, ej = je, ek = ke
     All objects commute with elements of the chosen base field.
     Mostly this is :math:`\mathbb{R}` or :math:`\mathbb{C}`.
+
+    This sets the algebra for the whole process. Use `use_algebra` to change the
+    algebra only within the current thread or asyncio task, or create
+    BiQuaternions bound to an `Algebra` object.
     """
-    global _BQ_I, _BQ_J, _BQ_E, II, JJ, KK, EE
-    _BQ_I = i_square
-    _BQ_J = j_square
-    _BQ_E = e_square
+    global II, JJ, KK, EE
+    _set_default_algebra(Algebra(i_square, j_square, e_square))
     II = BiQuaternion(*[0, 1, 0, 0, 0, 0, 0, 0])
     JJ = BiQuaternion(*[0, 0, 1, 0, 0, 0, 0, 0])
     KK = BiQuaternion(*[0, 0, 0, 1, 0, 0, 0, 0])
     EE = BiQuaternion(*[0, 0, 0, 0, 1, 0, 0, 0])
 
 
+def _bind(obj, algebra):
+    """Bind BiQuaternion `obj` to `algebra`, unless it is None."""
+    if algebra is not None:
+        obj._algebra = algebra
+    return obj
+
+
 def _sanitize_args(*args):
     """Sanitizes the input of the __new__ method of BiQuaternion."""
     coeffs = [0, 0, 0, 0, 0, 0, 0, 0]
     if len(args) == 1:
         gen = args[0]
         cof = [gen]
-        if isinstance(gen, BiQuaternion):
+        if isinstance(gen, (BiQuaternion, NumBiQuaternion)):
             cof = gen.coeffs
+        elif hasattr(gen, "to_biquaternion"):
+            # Biquaternions of other backends, e.g. DomainBiQuaternion.
+            cof = gen.to_biquaternion().coeffs
         elif isinstance(gen, (list, tuple, np.ndarray)):
             if len(gen) >= 9:
                 raise ValueError("Maximum array length is 8")
@@ -159,11 +179,17 @@ class BiQuaternion(Expr):
         Divide other by BiQuaternion.
     coeff(var, power):
         Rewriting of Expr.coeff to work for BiQuaternions
+    lambdify(args):
+        Compile BiQuaternion into a vectorized NumPy function.
     """
 
     is_commutative = False
     _op_priority = 11.1
+    _algebra = None
+    _mask = None
+    _hom_matrix = None
 
+    @profiled("BiQuaternion.__new__")
     def __new__(cls, *args):
         """Create new instance of BiQuaternion."""
         # Sanitize the arguments
@@ -184,6 +210,35 @@ class BiQuaternion(Expr):
             obj._ek = ek
             return obj
 
+    @property
+    def algebra(self):
+        """Algebra according to which the BiQuaternion is multiplied."""
+        if self._algebra is None:
+            return current_algebra()
+        return self._algebra
+
+    def _clear_cache(self):
+        """Reset cached data derived from the coefficients."""
+        self._mask = None
+        self._hom_matrix = None
+
+    @property
+    def mask(self):
+        """Bitmask of the nonzero coefficients of the BiQuaternion.
+
+        Bit `n` is set, if `coeffs[n]` is not structurally zero.
+        """
+        if self._mask is None:
+            self._mask = sum(1 << n for n, val in enumerate(self.coeffs) if val != 0)
+        return self._mask
+
+    @property
+    def func(self):
+        """Constructor of the BiQuaternion, which preserves the bound algebra."""
+        if self._algebra is None:
+            return BiQuaternion
+        return self._algebra.BiQuaternion
+
     @property
     def scal(self):
         """Value of the scalar part of the instance of BiQuaternion."""
@@ -192,6 +247,7 @@ class BiQuaternion(Expr):
     @scal.setter
     def scal(self, val):
         self._scal = val
+        self._clear_cache()
 
     @property
     def i(self):
@@ -201,6 +257,7 @@ class BiQuaternion(Expr):
     @i.setter
     def i(self, val):
         self._i = val
+        self._clear_cache()
 
     @property
     def j(self):
@@ -210,6 +267,7 @@ class BiQuaternion(Expr):
     @j.setter
     def j(self, val):
         self._j = val
+        self._clear_cache()
 
     @property
     def k(self):
@@ -219,6 +277,7 @@ class BiQuaternion(Expr):
     @k.setter
     def k(self, val):
         self._k = val
+        self._clear_cache()
 
     @property
     def eps(self):
@@ -228,6 +287,7 @@ class BiQuaternion(Expr):
     @eps.setter
     def eps(self, val):
         self._eps = val
+        self._clear_cache()
 
     @property
     def ei(self):
@@ -237,6 +297,7 @@ class BiQuaternion(Expr):
     @ei.setter
     def ei(self, val):
         self._ei = val
+        self._clear_cache()
 
     @property
     def ej(self):
@@ -246,6 +307,7 @@ class BiQuaternion(Expr):
     @ej.setter
     def ej(self, val):
         self._ej = val
+        self._clear_cache()
 
     @property
     def ek(self):
@@ -255,6 +317,7 @@ class BiQuaternion(Expr):
     @ek.setter
     def ek(self, val):
         self._ek = val
+        self._clear_cache()
 
     @property
     def coeffs(self):
@@ -281,81 +344,42 @@ class BiQuaternion(Expr):
         self.ej = val[6]
         self.ek = val[7]
 
+    @profiled("BiQuaternion.__mul__")
     def __mul__(self, other):
         """Multiply BiQuaternion with other."""
         if isinstance(other, BiQuaternion):
+            algebra = _resolve_algebra(self._algebra, other._algebra)
+            first = self.coeffs
+            second = other.coeffs
             out = [
-                -_BQ_E * _BQ_I * _BQ_J * other.coeffs[7] * self.coeffs[7]
-                + _BQ_E * _BQ_I * other.coeffs[5] * self.coeffs[5]
-                + _BQ_E * _BQ_J * other.coeffs[6] * self.coeffs[6]
-                - _BQ_I * _BQ_J * other.coeffs[3] * self.coeffs[3]
-                + _BQ_E * other.coeffs[4] * self.coeffs[4]
-                + _BQ_I * other.coeffs[1] * self.coeffs[1]
-                + _BQ_J * other.coeffs[2] * self.coeffs[2]
-                + other.coeffs[0] * self.coeffs[0],
-                _BQ_E * _BQ_J * other.coeffs[6] * self.coeffs[7]
-                - _BQ_E * _BQ_J * other.coeffs[7] * self.coeffs[6]
-                + _BQ_E * other.coeffs[4] * self.coeffs[5]
-                + _BQ_E * other.coeffs[5] * self.coeffs[4]
-                + _BQ_J * other.coeffs[2] * self.coeffs[3]
-                - _BQ_J * other.coeffs[3] * self.coeffs[2]
-                + other.coeffs[0] * self.coeffs[1]
-                + other.coeffs[1] * self.coeffs[0],
-                -_BQ_E * _BQ_I * other.coeffs[5] * self.coeffs[7]
-                + _BQ_E * _BQ_I * other.coeffs[7] * self.coeffs[5]
-                + _BQ_E * other.coeffs[4] * self.coeffs[6]
-                + _BQ_E * other.coeffs[6] * self.coeffs[4]
-                - _BQ_I * other.coeffs[1] * self.coeffs[3]
-                + _BQ_I * other.coeffs[3] * self.coeffs[1]
-                + other.coeffs[0] * self.coeffs[2]
-                + other.coeffs[2] * self.coeffs[0],
-                _BQ_E * other.coeffs[4] * self.coeffs[7]
-                - _BQ_E * other.coeffs[5] * self.coeffs[6]
-                + _BQ_E * other.coeffs[6] * self.coeffs[5]
-                + _BQ_E * other.coeffs[7] * self.coeffs[4]
-                + other.coeffs[0] * self.coeffs[3]
-                - other.coeffs[1] * self.coeffs[2]
-                + other.coeffs[2] * self.coeffs[1]
-                + other.coeffs[3] * self.coeffs[0],
-                -_BQ_I * _BQ_J * other.coeffs[3] * self.coeffs[7]
-                - _BQ_I * _BQ_J * other.coeffs[7] * self.coeffs[3]
-                + _BQ_I * other.coeffs[1] * self.coeffs[5]
-                + _BQ_I * other.coeffs[5] * self.coeffs[1]
-                + _BQ_J * other.coeffs[2] * self.coeffs[6]
-                + _BQ_J * other.coeffs[6] * self.coeffs[2]
-                + other.coeffs[0] * self.coeffs[4]
-                + other.coeffs[4] * self.coeffs[0],
-                _BQ_J * other.coeffs[2] * self.coeffs[7]
-                - _BQ_J * other.coeffs[3] * self.coeffs[6]
-                + _BQ_J * other.coeffs[6] * self.coeffs[3]
-                - _BQ_J * other.coeffs[7] * self.coeffs[2]
-                + other.coeffs[0] * self.coeffs[5]
-                + other.coeffs[1] * self.coeffs[4]
-                + other.coeffs[4] * self.coeffs[1]
-                + other.coeffs[5] * self.coeffs[0],
-                -_BQ_I * other.coeffs[1] * self.coeffs[7]
-                + _BQ_I * other.coeffs[3] * self.coeffs[5]
-                - _BQ_I * other.coeffs[5] * self.coeffs[3]
-                + _BQ_I * other.coeffs[7] * self.coeffs[1]
-                + other.coeffs[0] * self.coeffs[6]
-                + other.coeffs[2] * self.coeffs[4]
-                + other.coeffs[4] * self.coeffs[2]
-                + other.coeffs[6] * self.coeffs[0],
-                other.coeffs[0] * self.coeffs[7]
-                - other.coeffs[1] * self.coeffs[6]
-                + other.coeffs[2] * self.coeffs[5]
-                + other.coeffs[3] * self.coeffs[4]
-                + other.coeffs[4] * self.coeffs[3]
-                - other.coeffs[5] * self.coeffs[2]
-                + other.coeffs[6] * self.coeffs[1]
-                + other.coeffs[7] * self.coeffs[0],
+                Add(
+                    *[
+                        first[left] * second[right]
+                        if factor == 1
+                        else factor * first[left] * second[right]
+                        for left, right, factor in terms
+                    ]
+                )
+                if terms
+                else S.Zero
+                for terms in algebra.sparse_products(self.mask, other.mask)
             ]
-            return BiQuaternion(*out)
-        elif isinstance(other, Poly):
+            return _bind(BiQuaternion(*out), self._algebra or other._algebra)
+        elif isinstance(other, (Poly, BiQuaternionArray)):
             return other.__rmul__(self)
 
         return self * BiQuaternion(other)
 
+    def _flip_signs(self, flip):
+        """Copy of self with the coefficients selected by bitmask `flip` negated."""
+        mask = self.mask
+        negate = flip & mask
+        out = self.func(
+            *[-val if negate >> n & 1 else val for n, val in enumerate(self.coeffs)]
+        )
+        out._mask = mask
+        return out
+
     def __pos__(self):
         """Positive of itsself.
 
@@ -364,7 +388,7 @@ class BiQuaternion(Expr):
         BiQuaternion
             self
         """
-        return BiQuaternion(self)
+        return self.func(self)
 
     def __neg__(self):
         """Negative of itsself.
@@ -374,7 +398,7 @@ class BiQuaternion(Expr):
         BiQuaternion
             -self
         """
-        return BiQuaternion(*[-self.coeffs[i] for i in range(8)])
+        return self._flip_signs(0b11111111)
 
     def __add__(self, other):
         """Add BiQuaternion to other.
@@ -391,10 +415,11 @@ class BiQuaternion(Expr):
             Sum of self and input parameter
         """
         if isinstance(other, BiQuaternion):
+            _resolve_algebra(self._algebra, other._algebra)
             out = [self.coeffs[i] + other.coeffs[i] for i in range(8)]
-            return BiQuaternion(*out)
+            return _bind(BiQuaternion(*out), self._algebra or other._algebra)
 
-        elif isinstance(other, Poly):
+        elif isinstance(other, (Poly, BiQuaternionArray)):
             return other.__radd__(self)
 
         return self + BiQuaternion(other)
@@ -496,17 +521,16 @@ class BiQuaternion(Expr):
         return result
 
     def __pow__(self, other):
-        """Power function of BiQuaternion."""
+        """Power function of BiQuaternion.
+
+        Integer powers are computed by repeated squaring. For negative exponents
+        the BiQuaternion is inverted only once.
+        """
         if isinstance(other, int):
-            if other >= 0:
-                pw = 1
-                for i in range(other):
-                    pw = pw * self
-            else:
-                pw = 1
-                for i in range(-other):
-                    pw = pw / self
-            return pw
+            if other == 0:
+                return self.func(1)
+            base = self if other > 0 else self.inv()
+            return _binary_power(base, abs(other))
         else:
             raise TypeError(
                 "unsupported operand type(s) for ** or pow(): "
@@ -522,44 +546,26 @@ class BiQuaternion(Expr):
         a (bi-)quaternion.
         This happens in the same fashion as for complex numbers.
         """
-        return BiQuaternion(
-            *[
-                self.coeffs[0],
-                -self.coeffs[1],
-                -self.coeffs[2],
-                -self.coeffs[3],
-                self.coeffs[4],
-                -self.coeffs[5],
-                -self.coeffs[6],
-                -self.coeffs[7],
-            ]
-        )
+        return self._flip_signs(0b11101110)
 
     def eps_conjugate(self):
         """Epsilon conjugation of the biquaternion.
 
         Epsilon conjugation inverts the sign of the dual part of a quaternion
         """
-        return BiQuaternion(
-            *[
-                self.coeffs[0],
-                self.coeffs[1],
-                self.coeffs[2],
-                self.coeffs[3],
-                -self.coeffs[4],
-                -self.coeffs[5],
-                -self.coeffs[6],
-                -self.coeffs[7],
-            ]
-        )
+        return self._flip_signs(0b11110000)
 
+    @profiled("BiQuaternion.quadrance")
     def quadrance(self):
         """Quadrance of a quaternion.
 
         The quadrance of a biquaternion is its norm. It is defined as
         the product of a biquaternion and its conjugate.
+        Only its scalar and epsilon scalar part are nonzero, which are computed
+        directly.
         """
-        return self * (self.conjugate())
+        scal, eps = _quadrance_parts(self.coeffs, self.algebra.signature)
+        return self.func(scal, 0, 0, 0, eps)
 
     def norm(self):
         """Extra mapping of quadrance to the term norm, which is commonly used."""
@@ -574,16 +580,17 @@ class BiQuaternion(Expr):
         """
         return self.conjugate()
 
+    @profiled("BiQuaternion.inv")
     def inv(self):
-        """Inverse of the biquaternion."""
-        quad = self.quadrance()
-        primal = quad.coeffs[0]
-        dual = quad.coeffs[5]
-        s = primal * primal - _BQ_E * dual * dual
-        if s == 0:
-            raise ValueError("Object is not invertible")
-            return
-        return (quad.eps_conjugate() * (1 / s)) * (~self)
+        """Inverse of the biquaternion.
+
+        Notes
+        -----
+        With the quadrance `A + EE * B` the inverse is
+        `(A - EE * B) * self.conjugate() / (A**2 - e_square * B**2)`,
+        which is evaluated in closed form.
+        """
+        return self.func(*_inverse_coeffs(self.coeffs, self.algebra.signature))
 
     def __truediv__(self, other):
         """Division of BiQuaternion by other."""
@@ -608,7 +615,7 @@ class BiQuaternion(Expr):
         factor epsilon.
 
         """
-        return BiQuaternion(*self.coeffs[0:4])
+        return self.func(*self.coeffs[0:4])
 
     def dual(self):
         """Dual part of the dual quaternion.
@@ -623,7 +630,7 @@ class BiQuaternion(Expr):
         factors epsilon.
 
         """
-        return BiQuaternion(*self.coeffs[4:])
+        return self.func(*self.coeffs[4:])
 
     def scalar_part(self):
         """Scalar part of the dual quaternion.
@@ -638,7 +645,7 @@ class BiQuaternion(Expr):
         any of the numbers i, j, or k
 
         """
-        return BiQuaternion([self.coeffs[0], 0, 0, 0, self.coeffs[4], 0, 0, 0])
+        return self.func([self.coeffs[0], 0, 0, 0, self.coeffs[4], 0, 0, 0])
 
     def vector_part(self):
         """Vector part of the dual quaternion.
@@ -653,7 +660,7 @@ class BiQuaternion(Expr):
         the numbers i, j, k.
 
         """
-        return BiQuaternion(*([0] + self.coeffs[1:4] + [0] + self.coeffs[5:]))
+        return self.func(*([0] + self.coeffs[1:4] + [0] + self.coeffs[5:]))
 
     def coeff(self, var, power=1, right=False, _first=True):
         """Rewriting of Expr.coeff to work for BiQuaternions."""
@@ -662,7 +669,7 @@ class BiQuaternion(Expr):
         coeffed = [0, 0, 0, 0, 0, 0, 0, 0]
         for i, val in enumerate(self.coeffs):
             coeffed[i] = expand(val).coeff(var, power, right, _first)
-        return BiQuaternion(coeffed)
+        return self.func(coeffed)
 
     def apply_elementwise(self, func, *args):
         """Apply a function with specified arguments elementwise.
@@ -683,7 +690,26 @@ class BiQuaternion(Expr):
         coeffed = [0, 0, 0, 0, 0, 0, 0, 0]
         for i, val in enumerate(self.coeffs):
             coeffed[i] = func(val, *args)
-        return BiQuaternion(coeffed)
+        return self.func(coeffed)
+
+    def lambdify(self, args=None):
+        """Compile the BiQuaternion into a vectorized NumPy function.
+
+        Parameters
+        ----------
+        args : list of sympy.Symbol, optional
+            Arguments of the resulting function in this order.
+            (Default all free symbols sorted by name.)
+
+        Returns
+        -------
+        function
+            Function returning the coefficients as array of shape `(..., 8)`.
+            See `lambdify_bq` for details.
+        """
+        from .compiled import lambdify_bq
+
+        return lambdify_bq(self, args)
 
 
 II = BiQuaternion(0, 1, 0, 0, 0, 0, 0, 0)
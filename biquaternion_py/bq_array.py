@@ -0,0 +1,333 @@
+"""Vectorized BiQuaternion arithmetic on NumPy arrays.
+
+This module implements a container for many numeric BiQuaternions at once.
+All operations work on whole arrays and broadcast over the leading dimensions.
+
+Classes:
+
+    BiQuaternionArray
+"""
+
+import numpy as np
+from .algebra import (
+    current_algebra,
+    _resolve_algebra,
+    _to_number,
+    _quadrance_parts,
+    _inverse_coeffs,
+)
+
+_CONJ_SIGNS = np.array([1, -1, -1, -1, 1, -1, -1, -1])
+_EPS_CONJ_SIGNS = np.array([1, 1, 1, 1, -1, -1, -1, -1])
+
+
+def _bq_mul(first, second, algebra=None):
+    """Multiply arrays of biquaternion coefficients with broadcasting."""
+    if algebra is None:
+        algebra = current_algebra()
+    first, second = np.broadcast_arrays(first, second)
+    dtype = np.result_type(first, second, algebra.structure_tensor())
+    # Components first and contiguous, such that the 64 products below only
+    # need one temporary of the size of a single component.
+    first = np.ascontiguousarray(np.moveaxis(first, -1, 0), dtype)
+    second = np.ascontiguousarray(np.moveaxis(second, -1, 0), dtype)
+    out = np.zeros(first.shape, dtype)
+    term = np.empty(first.shape[1:], dtype)
+    for left, right, idx, factor in algebra.numeric_table():
+        np.multiply(first[left], second[right], out=term)
+        if factor != 1:
+            term *= factor
+        out[idx] += term
+    return np.moveaxis(out, 0, -1)
+
+
+def _bq_conjugate(coeffs):
+    """Quaternion conjugate of an array of biquaternion coefficients."""
+    return coeffs * _CONJ_SIGNS
+
+
+def _bq_eps_conjugate(coeffs):
+    """Epsilon conjugate of an array of biquaternion coefficients."""
+    return coeffs * _EPS_CONJ_SIGNS
+
+
+def _bq_inv(coeffs, algebra=None):
+    """Inverse of an array of biquaternion coefficients."""
+    if algebra is None:
+        algebra = current_algebra()
+    out = _inverse_coeffs(np.moveaxis(coeffs, -1, 0), algebra.numeric_signature())
+    return np.stack(out, axis=-1)
+
+
+def _as_array(quat):
+    """Convert a (numeric) biquaternion, or array of them, to a BiQuaternionArray."""
+    if isinstance(quat, BiQuaternionArray):
+        return quat
+    if hasattr(quat, "coeffs"):
+        coeffs = [_to_number(val) for val in quat.coeffs]
+        return BiQuaternionArray(coeffs, getattr(quat, "_algebra", None))
+    return BiQuaternionArray(quat)
+
+
+class BiQuaternionArray:
+    """
+    Class implementing arrays of numeric Bi-Quaternions.
+
+    The coefficients are stored as an array of shape `(..., 8)` in the canonical
+    order of `BiQuaternion.coeffs`. Arithmetic broadcasts over the leading
+    dimensions, like for NumPy arrays.
+
+    Attributes
+    ----------
+    data : numpy.ndarray
+        Coefficients of the biquaternions as array of shape `(..., 8)`.
+    shape : tuple
+        Shape of the array of biquaternions, i.e. `data.shape[:-1]`.
+    algebra : Algebra
+        Algebra according to which the biquaternions are multiplied.
+
+    Methods
+    -------
+    from_biquaternions(quats):
+        Create array from a (nested) list of BiQuaternions.
+    to_biquaternions():
+        Convert array to a (nested) list of BiQuaternions.
+    conjugate():
+        Conjugate of all biquaternions.
+    eps_conjugate():
+        Epsilon conjugate of all biquaternions.
+    quadrance():
+        Quadrance of all biquaternions.
+    inv():
+        Inverse of all biquaternions.
+    primal():
+        Primal part of all biquaternions.
+    dual():
+        Dual part of all biquaternions.
+    """
+
+    __array_ufunc__ = None
+
+    def __init__(self, data, algebra=None):
+        """Create new instance of BiQuaternionArray.
+
+        Parameters
+        ----------
+        data : array_like
+            Coefficients of shape `(..., 8)`.
+        algebra : Algebra, optional
+            Algebra to bind the array to.
+            (Default None uses the current algebra for each operation.)
+        """
+        if isinstance(data, BiQuaternionArray):
+            algebra = data._algebra if algebra is None else algebra
+            data = data.data
+        data = np.asarray(data)
+        if data.ndim == 0 or data.shape[-1] != 8:
+            raise ValueError("Coefficient array must have shape (..., 8).")
+        if data.dtype.kind not in "fc":
+            try:
+                data = data.astype(float)
+            except TypeError:
+                data = data.astype(complex)
+        self._data = data
+        self._algebra = algebra
+
+    @property
+    def data(self):
+        """Coefficients of the biquaternions as array of shape `(..., 8)`."""
+        return self._data
+
+    @property
+    def shape(self):
+        """Shape of the array of biquaternions."""
+        return self._data.shape[:-1]
+
+    @property
+    def algebra(self):
+        """Algebra according to which the biquaternions are multiplied."""
+        if self._algebra is None:
+            return current_algebra()
+        return self._algebra
+
+    @classmethod
+    def from_biquaternions(cls, quats, algebra=None):
+        """Create array from a (nested) list of BiQuaternions.
+
+        Parameters
+        ----------
+        quats : list of BiQuaternion
+            (Nested) list of BiQuaternions with numeric coefficients.
+        algebra : Algebra, optional
+            Algebra to bind the array to.
+
+        Returns
+        -------
+        BiQuaternionArray
+        """
+
+        def convert(obj):
+            if isinstance(obj, (list, tuple)):
+                return [convert(val) for val in obj]
+            return [_to_number(val) for val in obj.coeffs]
+
+        return cls(np.array(convert(quats)), algebra)
+
+    def to_biquaternions(self):
+        """Convert array to a (nested) list of BiQuaternions.
+
+        Returns
+        -------
+        list of BiQuaternion
+            Nested list with the same leading shape as the array.
+        """
+        from .biquaternion import BiQuaternion
+
+        new = BiQuaternion if self._algebra is None else self._algebra.BiQuaternion
+
+        def convert(arr):
+            if arr.ndim == 1:
+                return new(*arr.tolist())
+            return [convert(val) for val in arr]
+
+        return convert(self._data)
+
+    def _new(self, data, other=None):
+        """Create array with `data` bound to the algebra of self or other."""
+        algebra = self._algebra
+        if algebra is None:
+            algebra = getattr(other, "_algebra", None)
+        return BiQuaternionArray(data, algebra)
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of a 0-d BiQuaternionArray")
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        # The coefficient axis is kept, explicitly after an Ellipsis in key.
+        if any(val is Ellipsis for val in key):
+            return self._new(self._data[key + (slice(None),)])
+        return self._new(self._data[key + (Ellipsis,)])
+
+    def __iter__(self):
+        if not self.shape:
+            raise TypeError("iteration over a 0-d BiQuaternionArray")
+        return (self._new(val) for val in self._data)
+
+    def __repr__(self):
+        return f"BiQuaternionArray({repr(self._data)})"
+
+    def _coerce(self, other):
+        """Convert other into an array of coefficients, or scalars."""
+        if isinstance(other, BiQuaternionArray):
+            return other.data, True
+        if hasattr(other, "coeffs"):
+            return np.array([_to_number(val) for val in other.coeffs]), True
+        if isinstance(other, np.ndarray):
+            return other[..., None], False
+        return _to_number(other), False
+
+    def _mul_algebra(self, other):
+        """Algebra used to multiply self with other."""
+        return _resolve_algebra(self._algebra, getattr(other, "_algebra", None))
+
+    def __mul__(self, other):
+        """Multiply BiQuaternionArray with other."""
+        coeffs, is_quat = self._coerce(other)
+        if is_quat:
+            algebra = self._mul_algebra(other)
+            return self._new(_bq_mul(self._data, coeffs, algebra), other)
+        return self._new(self._data * coeffs)
+
+    def __rmul__(self, other):
+        """Multiply other with BiQuaternionArray."""
+        coeffs, is_quat = self._coerce(other)
+        if is_quat:
+            algebra = self._mul_algebra(other)
+            return self._new(_bq_mul(coeffs, self._data, algebra), other)
+        return self._new(coeffs * self._data)
+
+    def __add__(self, other):
+        """Add BiQuaternionArray to other."""
+        coeffs, is_quat = self._coerce(other)
+        if not is_quat:
+            scalar = np.zeros(
+                np.shape(coeffs)[:-1] + (8,), dtype=np.result_type(coeffs)
+            )
+            scalar[..., 0:1] = coeffs
+            coeffs = scalar
+        return self._new(self._data + coeffs, other)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return self._new(-self._data)
+
+    def __pos__(self):
+        return self._new(self._data.copy())
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __truediv__(self, other):
+        """Division of BiQuaternionArray by other."""
+        coeffs, is_quat = self._coerce(other)
+        if is_quat:
+            return self * self._new(coeffs, other).inv()
+        return self._new(self._data / coeffs)
+
+    def __rtruediv__(self, other):
+        """Divide other by BiQuaternionArray."""
+        return other * self.inv()
+
+    def __invert__(self):
+        return self.conjugate()
+
+    def conjugate(self):
+        """Conjugate of all biquaternions in the array."""
+        return self._new(_bq_conjugate(self._data))
+
+    def eps_conjugate(self):
+        """Epsilon conjugate of all biquaternions in the array."""
+        return self._new(_bq_eps_conjugate(self._data))
+
+    def quadrance(self):
+        """Quadrance of all biquaternions in the array."""
+        signature = self.algebra.numeric_signature()
+        scal, eps = _quadrance_parts(np.moveaxis(self._data, -1, 0), signature)
+        out = np.zeros(np.shape(scal) + (8,), dtype=np.result_type(scal, eps))
+        out[..., 0] = scal
+        out[..., 4] = eps
+        return self._new(out)
+
+    def norm(self):
+        """Extra mapping of quadrance to the term norm, which is commonly used."""
+        return self.quadrance()
+
+    def inv(self):
+        """Inverse of all biquaternions in the array."""
+        return self._new(_bq_inv(self._data, self.algebra))
+
+    def primal(self):
+        """Primal part of all biquaternions in the array."""
+        out = np.zeros_like(self._data)
+        out[..., 0:4] = self._data[..., 0:4]
+        return self._new(out)
+
+    def dual(self):
+        """Dual part of all biquaternions in the array.
+
+        Notes
+        -----
+        As for `BiQuaternion.dual` the dual part is returned without the factor
+        epsilon.
+        """
+        out = np.zeros_like(self._data)
+        out[..., 0:4] = self._data[..., 4:8]
+        return self._new(out)
@@ -0,0 +1,114 @@
+"""Compile symbolic BiQuaternions into fast numerical functions.
+
+This module turns the eight coefficient expressions of a BiQuaternion, or of a
+polynomial with BiQuaternion coefficients, into a single NumPy function. Common
+subexpressions are eliminated once, such that repeated evaluation is cheap.
+
+Functions:
+
+    lambdify_bq
+    clear_lambdify_cache
+"""
+
+import numpy as np
+from sympy import lambdify, sympify
+
+_CACHE_SIZE = 128
+_LAMBDIFY_CACHE = {}
+
+
+def _coeff_exprs(expr):
+    """Coefficient expressions, their free symbols and default arguments of expr.
+
+    The default arguments are the indeterminates of a Poly followed by the
+    remaining free symbols sorted by name.
+    """
+    from .polynomials import Poly
+
+    if isinstance(expr, Poly):
+        indets = tuple(expr.indets)
+        expr = expr.poly
+    else:
+        indets = ()
+    if hasattr(expr, "coeffs"):
+        coeffs = tuple(sympify(val) for val in expr.coeffs)
+    else:
+        coeffs = (sympify(expr),) + (sympify(0),) * 7
+    symbols = set().union(*(val.free_symbols for val in coeffs))
+    indets += tuple(sorted(symbols.difference(indets), key=str))
+    return coeffs, symbols, indets
+
+
+def _vectorize(func, nargs):
+    """Wrap a lambdified function to return arrays of shape `(..., 8)`."""
+
+    def evaluate(*vals):
+        if len(vals) != nargs:
+            raise TypeError(f"Expected {nargs} arguments, got {len(vals)}.")
+        vals = [np.asarray(val) for val in vals]
+        out = np.broadcast_arrays(*vals, *func(*vals))[nargs:]
+        return np.stack(out, axis=-1)
+
+    return evaluate
+
+
+def lambdify_bq(expr, args=None):
+    """Compile a symbolic BiQuaternion into a vectorized NumPy function.
+
+    Parameters
+    ----------
+    expr : BiQuaternion, Poly
+        BiQuaternion with symbolic coefficients, or polynomial with BiQuaternion
+        coefficients.
+    args : list of sympy.Symbol, optional
+        Arguments of the resulting function in this order. They have to
+        include all free symbols of `expr`.
+        (Default uses the indeterminates of a Poly followed by all other free
+        symbols sorted by name.)
+
+    Returns
+    -------
+    function
+        Function taking one array like per argument. The arguments are broadcast
+        against each other and the result is an array of shape `(..., 8)` with
+        the coefficients of `expr` in the canonical order.
+
+    Raises
+    ------
+    ValueError
+        If `args` misses a free symbol of `expr`.
+
+    Notes
+    -----
+    Common subexpressions of all eight coefficients are eliminated once. The
+    compiled functions are cached with respect to the coefficients of `expr` and
+    the order of `args`.
+
+    Examples
+    --------
+    >>> t = sympy.Symbol("t")
+    >>> func = lambdify_bq(Poly(t * II + EE, t))
+    >>> func(np.linspace(0, 1, 1000)).shape
+    (1000, 8)
+    """
+    coeffs, symbols, indets = _coeff_exprs(expr)
+    if args is not None:
+        indets = tuple(sympify(arg) for arg in args)
+        missing = symbols.difference(indets)
+        if missing:
+            names = ", ".join(sorted(map(str, missing)))
+            raise ValueError(f"Free symbols {names} are not among the arguments.")
+    key = (coeffs, indets)
+    func = _LAMBDIFY_CACHE.pop(key, None)
+    if func is None:
+        func = _vectorize(lambdify(indets, coeffs, "numpy", cse=True), len(indets))
+        if len(_LAMBDIFY_CACHE) >= _CACHE_SIZE:
+            del _LAMBDIFY_CACHE[next(iter(_LAMBDIFY_CACHE))]
+    # Reinsert to mark as most recently used.
+    _LAMBDIFY_CACHE[key] = func
+    return func
+
+
+def clear_lambdify_cache():
+    """Remove all compiled functions from the cache of `lambdify_bq`."""
+    _LAMBDIFY_CACHE.clear()
@@ -0,0 +1,532 @@
+"""Univariate polynomials with a dense list of BiQuaternion coefficients.
+
+`Poly` stores a polynomial as one sympy expression, such that degree and
+coefficients have to be recovered by expanding the whole expression. This module
+implements univariate polynomials, which store their coefficients as list indexed
+by the degree instead.
+
+Classes:
+
+    DensePoly
+"""
+
+import numpy as np
+from functools import reduce
+from operator import add
+from sympy import Add, Rational, S, expand, igcd, ilcm, sympify
+from sympy import Poly as SymPoly
+from sympy.polys.constructor import construct_domain
+from .algebra import _binary_power
+from .biquaternion import BiQuaternion
+from .num_biquaternion import NumBiQuaternion
+from .domain import DomainBiQuaternion
+from .polynomials import Poly, _eval_poly, _eval_poly_array, _numeric_coeffs
+
+
+def _as_coeff(val):
+    """Convert val to a BiQuaternion, unless it already is a biquaternion."""
+    if isinstance(val, (BiQuaternion, NumBiQuaternion, DomainBiQuaternion)):
+        return val
+    return BiQuaternion(val)
+
+
+def _strip(coeffs):
+    """Remove vanishing leading coefficients, but keep at least one."""
+    end = len(coeffs)
+    while end > 1 and coeffs[end - 1].mask == 0:
+        end -= 1
+    return coeffs[:end]
+
+
+def _sum(quats):
+    """Sum of a non empty list of biquaternions with expanded coefficients."""
+    if not all(isinstance(quat, BiQuaternion) for quat in quats):
+        return reduce(add, quats)
+    coeffs = [quat.coeffs for quat in quats]
+    return quats[0].func(*[expand(Add(*vals)) for vals in zip(*coeffs)])
+
+
+def _content(quats):
+    """Positive rational content of biquaternions with rational coefficients.
+
+    The content is the gcd of the numerators divided by the lcm of the
+    denominators of all coefficients. It is 1, if any coefficient is not
+    rational.
+    """
+    numer, denom = 0, 1
+    for quat in quats:
+        if isinstance(quat, BiQuaternion):
+            for val in quat.coeffs:
+                val = sympify(val)
+                if not val.is_Rational:
+                    return S.One
+                numer, denom = igcd(numer, val.p), ilcm(denom, val.q)
+        elif isinstance(quat, DomainBiQuaternion) and (
+            quat.domain.is_ZZ or quat.domain.is_QQ
+        ):
+            domain = quat.domain
+            for val in quat.coeffs:
+                numer = igcd(numer, int(domain.numer(val)))
+                denom = ilcm(denom, int(domain.denom(val)))
+        else:
+            return S.One
+    if numer == 0:
+        return S.One
+    return Rational(numer, denom)
+
+
+def _scale(quats, factor):
+    """Multiply biquaternions with a central factor.
+
+    Products with biquaternion factors are expanded, while products with
+    rational numbers are evaluated by sympy anyway.
+    """
+    if getattr(factor, "is_Rational", False):
+        return [quat * factor for quat in quats]
+    return [_sum([factor * quat]) for quat in quats]
+
+
+class DensePoly:
+    """
+    Class implementing univariate polynomials with BiQuaternion coefficients.
+
+    The coefficients are stored as list in ascending order of the degree, i.e.
+    the polynomial is $sum_n coeffs[n] t^n$ with the indeterminate $t$ written
+    right of the coefficients. Instances are immutable.
+
+    Attributes
+    ----------
+    coeffs : list of BiQuaternion
+        Coefficients in ascending order of the degree.
+    indet : sympy.Symbol
+        Indeterminate of the polynomial.
+
+    Methods
+    -------
+    from_poly(poly, indet):
+        Create DensePoly from a univariate Poly.
+    to_poly():
+        Convert to Poly.
+    to_domain(domain):
+        Convert the coefficients to DomainBiQuaternions.
+    deg():
+        Degree of the polynomial.
+    lcoeff():
+        Leading coefficient of the polynomial.
+    coeff(power):
+        Coefficient of `indet**power`.
+    eval(val, right):
+        Evaluate polynomial at val.
+    div(other, right):
+        Polynomial division with remainder.
+    pseudo_div(other, right):
+        Fraction-free pseudo-division with remainder.
+    exquo(other, right):
+        Exact polynomial division.
+    primitive():
+        Content and primitive part of the polynomial.
+    conjugate():
+        Coefficientwise conjugate of the polynomial.
+    eps_conjugate():
+        Coefficientwise epsilon conjugate of the polynomial.
+    norm():
+        Product of polynomial and its conjugate.
+    """
+
+    def __init__(self, coeffs, indet):
+        """Create new instance of DensePoly.
+
+        Parameters
+        ----------
+        coeffs : list
+            Coefficients in ascending order of the degree. Entries, which are not
+            BiQuaternions, NumBiQuaternions or DomainBiQuaternions, are converted
+            to BiQuaternions.
+        indet : sympy.Symbol, str
+            Indeterminate of the polynomial.
+        """
+        coeffs = [_as_coeff(val) for val in coeffs]
+        if not coeffs:
+            coeffs = [BiQuaternion(0)]
+        self._coeffs = _strip(coeffs)
+        self._indet = sympify(indet)
+
+    def _new(self, coeffs):
+        """Create DensePoly in the same indeterminate without converting coeffs."""
+        obj = object.__new__(DensePoly)
+        obj._coeffs = _strip(coeffs)
+        obj._indet = self._indet
+        return obj
+
+    @classmethod
+    def from_poly(cls, poly, indet=None):
+        """Create DensePoly from a univariate Poly.
+
+        Parameters
+        ----------
+        poly : Poly
+            Polynomial with BiQuaternion coefficients.
+        indet : sympy.Symbol, optional
+            Indeterminate with respect to which to collect the coefficients.
+            (Default `poly.indets[0]`)
+
+        Returns
+        -------
+        DensePoly
+        """
+        if indet is None:
+            indet = poly.indets[0]
+        expr = poly.poly if isinstance(poly, Poly) else poly
+        new = expr.func if isinstance(expr, BiQuaternion) else BiQuaternion
+        # Collect each coefficient of the BiQuaternion with a single expansion.
+        parts = [
+            SymPoly(val, indet).all_coeffs()[::-1] for val in BiQuaternion(expr).coeffs
+        ]
+        deg = max(len(part) for part in parts)
+        parts = [part + [0] * (deg - len(part)) for part in parts]
+        return cls([new(*vals) for vals in zip(*parts)], indet)
+
+    def to_poly(self):
+        """Convert to Poly.
+
+        Returns
+        -------
+        Poly
+        """
+        coeffs = [BiQuaternion(val).coeffs for val in self._coeffs]
+        powers = [self._indet**n for n in range(len(coeffs))]
+        last = self._coeffs[-1]
+        new = last.func if isinstance(last, BiQuaternion) else BiQuaternion
+        expr = new(
+            *[
+                Add(*[val * power for val, power in zip(vals, powers)])
+                for vals in zip(*coeffs)
+            ]
+        )
+        return Poly(expr, self._indet)
+
+    def to_domain(self, domain=None):
+        """Convert the coefficients to DomainBiQuaternions.
+
+        Parameters
+        ----------
+        domain : sympy.polys.domains.Domain, optional
+            Domain of the coefficients.
+            (Default None constructs the smallest domain containing the
+            coefficients of all BiQuaternions.)
+
+        Returns
+        -------
+        DensePoly
+            Polynomial, whose arithmetic runs on the ground types of the domain.
+        """
+        if domain is None:
+            coeffs = [val for quat in self._coeffs for val in BiQuaternion(quat).coeffs]
+            domain, _ = construct_domain(coeffs, extension=True)
+        return self._new(
+            [DomainBiQuaternion(val, domain=domain) for val in self._coeffs]
+        )
+
+    @property
+    def coeffs(self):
+        """Coefficients in ascending order of the degree."""
+        return list(self._coeffs)
+
+    @property
+    def indet(self):
+        """Indeterminate of the polynomial."""
+        return self._indet
+
+    def deg(self):
+        """Degree of the polynomial."""
+        return len(self._coeffs) - 1
+
+    def lcoeff(self):
+        """Leading coefficient of the polynomial."""
+        return self._coeffs[-1]
+
+    def coeff(self, power):
+        """Coefficient of `indet**power`."""
+        if 0 <= power < len(self._coeffs):
+            return self._coeffs[power]
+        return self._coeffs[0] * 0
+
+    def eval(self, val, right=True):
+        """Evaluate polynomial at val by Horner's scheme.
+
+        Parameters
+        ----------
+        val : number, BiQuaternion, numpy.ndarray
+            Value of the indeterminate. For an array of real values the
+            coefficients of all results are returned as array of shape `(..., 8)`.
+        right : bool (optional, default = True)
+            Should polynomial be evaluated assuming the indeterminate is right of
+            the coefficients.
+        """
+        if isinstance(val, np.ndarray):
+            out = _eval_poly_array(_numeric_coeffs(self._coeffs), [val])
+            return np.broadcast_to(out, val.shape + (8,)).copy()
+        return _eval_poly(self._coeffs, [val], right)
+
+    def _check_indet(self, other):
+        if self._indet != other._indet:
+            raise ValueError("Polynomials have different indeterminates.")
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return self._new([-val for val in self._coeffs])
+
+    def __add__(self, other):
+        """Add DensePoly to other."""
+        if isinstance(other, DensePoly):
+            self._check_indet(other)
+            short, long = sorted((self._coeffs, other._coeffs), key=len)
+            coeffs = [a + b for a, b in zip(short, long)] + long[len(short) :]
+            return self._new(coeffs)
+        elif isinstance(other, Poly):
+            return NotImplemented
+        return self._new([self._coeffs[0] + other] + self._coeffs[1:])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        """Multiply DensePoly with other.
+
+        Products of two polynomials are computed as convolution of the
+        coefficient lists, preserving the order of the factors.
+        """
+        if isinstance(other, DensePoly):
+            self._check_indet(other)
+            products = [[] for _ in range(len(self._coeffs) + len(other._coeffs) - 1)]
+            for n, first in enumerate(self._coeffs):
+                if first.mask == 0:
+                    continue
+                for m, second in enumerate(other._coeffs):
+                    if second.mask != 0:
+                        products[n + m].append(first * second)
+            zero = self._coeffs[0] * 0
+            return self._new([_sum(prods) if prods else zero for prods in products])
+        elif isinstance(other, Poly):
+            return NotImplemented
+        return self._new([val * other for val in self._coeffs])
+
+    def __rmul__(self, other):
+        """Multiply other with DensePoly."""
+        return self._new([other * val for val in self._coeffs])
+
+    def div(self, other, right=True):
+        """Polynomial division with remainder by other.
+
+        Parameters
+        ----------
+        other : DensePoly
+            Polynomial by which to divide. Its leading coefficient has to be
+            invertible.
+        right : bool (optional, default = True)
+            Should right division be used.
+
+        Returns
+        -------
+        quotient : DensePoly
+        remainder : DensePoly
+            Polynomials with `self = other * quotient + remainder` for
+            `right = True` and `self = quotient * other + remainder` otherwise.
+            The degree of `remainder` is smaller than the degree of `other`.
+
+        Notes
+        -----
+        Each step only updates the coefficients affected by the current leading
+        term, so dividing by a linear polynomial takes O(deg) coefficient
+        operations.
+        """
+        self._check_indet(other)
+        deg = other.deg()
+        divisor = other._coeffs
+        lead_inv = divisor[-1].inv()
+        rem = list(self._coeffs)
+        zero = self._coeffs[0] * 0
+        quot = [zero] * max(len(rem) - deg, 1)
+        for k in range(len(rem) - deg - 1, -1, -1):
+            top = rem[k + deg]
+            if top.mask == 0:
+                continue
+            if right:
+                fact = lead_inv * top
+                quot[k] = fact
+                for n in range(deg):
+                    rem[k + n] = _sum([rem[k + n], -(divisor[n] * fact)])
+            else:
+                fact = top * lead_inv
+                quot[k] = fact
+                for n in range(deg):
+                    rem[k + n] = _sum([rem[k + n], -(fact * divisor[n])])
+        # The top coefficients cancel by construction and are not computed.
+        return self._new(quot), self._new(rem[:deg] if deg else [zero])
+
+    def primitive(self):
+        """Content and primitive part of the polynomial.
+
+        Returns
+        -------
+        content : sympy.Rational
+            Positive rational content of all coefficients, see `pseudo_div`.
+        primitive : DensePoly
+            Polynomial `self / content` with coprime integer coefficients.
+        """
+        content = _content(self._coeffs)
+        if content == 1:
+            return content, self
+        return content, self._new(_scale(self._coeffs, 1 / content))
+
+    def pseudo_div(self, other, right=True):
+        """Fraction-free pseudo-division with remainder by other.
+
+        Parameters
+        ----------
+        other : DensePoly
+            Polynomial by which to divide. Its leading coefficient has to be
+            invertible.
+        right : bool (optional, default = True)
+            Should right division be used.
+
+        Returns
+        -------
+        scale :
+            Central biquaternion, i.e. with only scalar and epsilon scalar part.
+        quotient : DensePoly
+        remainder : DensePoly
+            Polynomials with `scale * self = other * quotient + remainder` for
+            `right = True` and `scale * self = quotient * other + remainder`
+            otherwise. The degree of `remainder` is smaller than the degree of
+            `other`.
+
+        Notes
+        -----
+        Instead of the inverse of the leading coefficient `lead` of `other`,
+        each step multiplies with `lead.conjugate()` and scales all intermediate
+        coefficients with the central norm `lead * lead.conjugate()` (or with
+        `lead` itself, if it is real). For rational coefficients the content is
+        removed after every step, such that the coefficients stay coprime
+        integers. Their size still grows with the degree, but slower than with
+        `div`.
+        """
+        self._check_indet(other)
+        deg = other.deg()
+        divisor = other._coeffs
+        lead = divisor[-1]
+        if lead.mask == 1:
+            mult, norm = None, lead
+        else:
+            mult, norm = lead.conjugate(), lead.quadrance()
+        if norm.mask == 0:
+            raise ValueError("Leading coefficient is not invertible.")
+        unit = norm == 1
+
+        content, prim = self.primitive()
+        rem = list(prim._coeffs)
+        scale = _sum([(self._coeffs[0] * 0 + 1) * (1 / content)])
+        zero = self._coeffs[0] * 0
+        quot = [zero] * max(len(rem) - deg, 1)
+        for k in range(len(rem) - deg - 1, -1, -1):
+            top = rem[k + deg]
+            if top.mask == 0:
+                continue
+            if mult is None:
+                fact = top
+            else:
+                fact = mult * top if right else top * mult
+            if not unit:
+                rem = _scale(rem[: k + deg], norm)
+                quot = _scale(quot, norm)
+                scale = _sum([norm * scale])
+            quot[k] = fact
+            for n in range(deg):
+                prod = divisor[n] * fact if right else fact * divisor[n]
+                rem[k + n] = _sum([rem[k + n], -prod])
+            content = _content(rem[: k + deg] + quot)
+            if content != 1:
+                rem = _scale(rem[: k + deg], 1 / content)
+                quot = _scale(quot, 1 / content)
+                scale = _sum([scale * (1 / content)])
+        return scale, self._new(quot), self._new(rem[:deg] if deg else [zero])
+
+    def exquo(self, other, right=True):
+        """Exact polynomial division by other.
+
+        The quotient is computed with `pseudo_div` and divided by the scale
+        only once at the end.
+
+        Parameters
+        ----------
+        other : DensePoly
+            Polynomial by which to divide. Its leading coefficient has to be
+            invertible.
+        right : bool (optional, default = True)
+            Should right division be used.
+
+        Returns
+        -------
+        DensePoly
+            Quotient with `self = other * quotient` for `right = True` and
+            `self = quotient * other` otherwise.
+
+        Raises
+        ------
+        ValueError
+            If the division has a nonzero remainder.
+        """
+        scale, quot, rem = self.pseudo_div(other, right)
+        if any(val.mask != 0 for val in rem._coeffs):
+            raise ValueError("Polynomial division is not exact.")
+        return self._new(_scale(quot._coeffs, scale.inv()))
+
+    def __pow__(self, other):
+        """Power of polynomial for non negative integer exponents."""
+        if not isinstance(other, int) or other < 0:
+            raise TypeError(
+                "unsupported operand type(s) for ** or pow(): "
+                + str(type(self))
+                + " and "
+                + str(type(other))
+            )
+        if other == 0:
+            return self._new([self._coeffs[0] * 0 + 1])
+        return _binary_power(self, other)
+
+    def __eq__(self, other):
+        """Test equality of two polynomials."""
+        if not isinstance(other, DensePoly):
+            return NotImplemented
+        return (
+            self._indet == other._indet
+            and len(self._coeffs) == len(other._coeffs)
+            and all(a == b for a, b in zip(self._coeffs, other._coeffs))
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"DensePoly({repr(self._coeffs)}, {repr(self._indet)})"
+
+    def primal(self):
+        return self._new([val.primal() for val in self._coeffs])
+
+    def dual(self):
+        return self._new([val.dual() for val in self._coeffs])
+
+    def conjugate(self):
+        return self._new([val.conjugate() for val in self._coeffs])
+
+    def eps_conjugate(self):
+        return self._new([val.eps_conjugate() for val in self._coeffs])
+
+    def norm(self):
+        return self * self.conjugate()
@@ -0,0 +1,486 @@
+"""Calculate with BiQuaternions over exact sympy domains.
+
+`BiQuaternion` stores its coefficients as sympy expressions, so every sum and
+product builds and canonicalizes expression trees. This module implements a
+BiQuaternion class, which stores its coefficients as elements of a sympy polys
+domain, such as `ZZ`, `QQ`, `QQ<sqrt(2)>` or `QQ[t]`. Arithmetic then runs on
+the ground types of the domain and conversion to sympy expressions only takes
+place in `to_biquaternion`.
+
+Classes:
+
+    DomainBiQuaternion
+"""
+
+from sympy import sympify
+from sympy.polys.constructor import construct_domain
+from sympy.polys.polyerrors import CoercionFailed
+from .algebra import (
+    current_algebra,
+    _resolve_algebra,
+    _binary_power,
+    _quadrance_parts,
+    _inverse_coeffs,
+)
+from .biquaternion import BiQuaternion
+from .polynomials import Poly
+
+# Multiplication tables with factors converted into a domain, keyed by
+# (algebra, domain, first mask, second mask).
+_DOMAIN_PRODUCTS = {}
+
+
+def _domain_products(algebra, domain, first_mask, second_mask):
+    """`algebra.sparse_products` with the factors as elements of `domain`."""
+    key = (algebra, domain, first_mask, second_mask)
+    products = _DOMAIN_PRODUCTS.get(key)
+    if products is None:
+        products = tuple(
+            tuple(
+                (
+                    left,
+                    right,
+                    None if factor == 1 else domain.from_sympy(sympify(factor)),
+                )
+                for left, right, factor in terms
+            )
+            for terms in algebra.sparse_products(first_mask, second_mask)
+        )
+        _DOMAIN_PRODUCTS[key] = products
+    return products
+
+
+def _convert(coeffs, source, target):
+    """Convert a tuple of elements of `source` to elements of `target`."""
+    if source == target:
+        return coeffs
+    return tuple(target.convert_from(val, source) for val in coeffs)
+
+
+class DomainBiQuaternion:
+    """
+    Class implementing Bi-Quaternions with coefficients in a sympy domain.
+
+    Domain Bi-Quaternions are represented as
+    $a + II b + JJ c + KK d + EE (w + II x + JJ y + KK z)$
+    with elements of a sympy polys domain as coefficients.
+    Instances are immutable.
+
+    Attributes
+    ----------
+    coeffs : list
+        coefficients of the quaternion as domain elements in the canonical order.
+    domain : sympy.polys.domains.Domain
+        Domain of the coefficients.
+    scal, i, j, k, eps, ei, ej, ek :
+        Coefficients of the Bi-Quaternion, as for `BiQuaternion`.
+
+    Methods
+    -------
+    from_biquaternion(quat, domain):
+        Create a DomainBiQuaternion from a BiQuaternion.
+    to_biquaternion():
+        Convert to a symbolic BiQuaternion.
+    to_poly(*indets):
+        Convert to a Poly.
+    convert(domain):
+        Convert the coefficients to another domain.
+    conjugate():
+        Conjugate of this instance of DomainBiQuaternion.
+    eps_conjugate():
+        Epsilon conjugation of the biquaternion.
+    quadrance():
+        Quadrance of a quaternion.
+    inv():
+        Inverse of the biquaternion.
+    primal():
+        Primal part of the dual quaternion.
+    dual():
+        Dual part of the dual quaternion.
+    """
+
+    __slots__ = ("_coeffs", "_domain", "_algebra", "_mask")
+
+    def __init__(self, *args, domain=None, algebra=None):
+        """Create new instance of DomainBiQuaternion.
+
+        Parameters
+        ----------
+        *args :
+            Coefficients as for `BiQuaternion`.
+        domain : sympy.polys.domains.Domain, optional
+            Domain of the coefficients.
+            (Default None constructs the smallest domain containing all
+            coefficients, algebraic extensions included.)
+        algebra : Algebra, optional
+            Algebra to bind the biquaternion to.
+            (Default None uses the current algebra for each operation.)
+        """
+        if algebra is None and len(args) == 1:
+            algebra = getattr(args[0], "_algebra", None)
+        coeffs = [sympify(val) for val in BiQuaternion(*args).coeffs]
+        if domain is None:
+            domain, coeffs = construct_domain(coeffs, extension=True)
+        else:
+            coeffs = [domain.from_sympy(val) for val in coeffs]
+        self._coeffs = tuple(coeffs)
+        self._domain = domain
+        self._algebra = algebra
+        self._mask = None
+
+    @classmethod
+    def _from_tuple(cls, coeffs, domain, algebra=None):
+        """Create instance from a tuple of 8 domain elements without any checks."""
+        obj = object.__new__(cls)
+        obj._coeffs = coeffs
+        obj._domain = domain
+        obj._algebra = algebra
+        obj._mask = None
+        return obj
+
+    def _new(self, coeffs, other=None, domain=None):
+        """Create instance from `coeffs` bound to the algebra of self or other."""
+        algebra = self._algebra
+        if algebra is None:
+            algebra = getattr(other, "_algebra", None)
+        if domain is None:
+            domain = self._domain
+        return DomainBiQuaternion._from_tuple(coeffs, domain, algebra)
+
+    def _with_mask(self, coeffs):
+        """Create instance from `coeffs` with the same nonzero pattern as self."""
+        out = self._new(coeffs)
+        out._mask = self.mask
+        return out
+
+    def _unify(self, other):
+        """Coefficients of self and other in their common domain."""
+        if self._domain == other._domain:
+            return self._coeffs, other._coeffs, self._domain
+        domain = self._domain.unify(other._domain)
+        return (
+            _convert(self._coeffs, self._domain, domain),
+            _convert(other._coeffs, other._domain, domain),
+            domain,
+        )
+
+    def _coerce(self, other):
+        """Convert a scalar or BiQuaternion to a DomainBiQuaternion."""
+        try:
+            return DomainBiQuaternion(other, domain=self._domain)
+        except CoercionFailed:
+            return DomainBiQuaternion(other)
+
+    @property
+    def mask(self):
+        """Bitmask of the nonzero coefficients of the DomainBiQuaternion.
+
+        Bit `n` is set, if `coeffs[n]` is nonzero. Products only compute the
+        coefficients, which are not zero due to the masks of their factors.
+        """
+        if self._mask is None:
+            mask = 0
+            for n, val in enumerate(self._coeffs):
+                if val:
+                    mask |= 1 << n
+            self._mask = mask
+        return self._mask
+
+    @property
+    def algebra(self):
+        """Algebra according to which the biquaternion is multiplied."""
+        if self._algebra is None:
+            return current_algebra()
+        return self._algebra
+
+    @property
+    def domain(self):
+        """Domain of the coefficients."""
+        return self._domain
+
+    @classmethod
+    def from_biquaternion(cls, quat, domain=None):
+        """Create a DomainBiQuaternion from a BiQuaternion or Poly.
+
+        Parameters
+        ----------
+        quat : BiQuaternion, Poly
+            Biquaternion, whose coefficients are elements of the domain. The
+            coefficients of a Poly become elements of a polynomial ring, such as
+            `QQ[t]`.
+        domain : sympy.polys.domains.Domain, optional
+            Domain of the coefficients.
+            (Default None constructs the smallest domain containing all
+            coefficients.)
+
+        Returns
+        -------
+        DomainBiQuaternion
+        """
+        if isinstance(quat, Poly):
+            quat = quat.poly
+        return cls(quat, domain=domain, algebra=getattr(quat, "_algebra", None))
+
+    def to_biquaternion(self):
+        """Convert to a symbolic BiQuaternion.
+
+        Returns
+        -------
+        BiQuaternion
+        """
+        coeffs = [self._domain.to_sympy(val) for val in self._coeffs]
+        if self._algebra is not None:
+            return self._algebra.BiQuaternion(*coeffs)
+        return BiQuaternion(*coeffs)
+
+    def to_poly(self, *indets):
+        """Convert to a Poly in `indets`.
+
+        Parameters
+        ----------
+        *indets : sympy.Symbol
+            Indeterminates of the polynomial.
+            (Default are the generators of a polynomial domain.)
+
+        Returns
+        -------
+        Poly
+        """
+        if not indets:
+            indets = getattr(self._domain, "symbols", ())
+        return Poly(self.to_biquaternion(), *indets)
+
+    def convert(self, domain):
+        """Convert the coefficients to another domain.
+
+        Parameters
+        ----------
+        domain : sympy.polys.domains.Domain
+
+        Returns
+        -------
+        DomainBiQuaternion
+        """
+        coeffs = _convert(self._coeffs, self._domain, domain)
+        return self._new(coeffs, domain=domain)
+
+    @property
+    def coeffs(self):
+        """Coefficients describing an instance of DomainBiQuaternion."""
+        return list(self._coeffs)
+
+    @property
+    def scal(self):
+        """Value of the scalar part of the instance of DomainBiQuaternion."""
+        return self._coeffs[0]
+
+    @property
+    def i(self):
+        """Value of the II part of the instance of DomainBiQuaternion."""
+        return self._coeffs[1]
+
+    @property
+    def j(self):
+        """Value of the JJ part of the instance of DomainBiQuaternion."""
+        return self._coeffs[2]
+
+    @property
+    def k(self):
+        """Value of the KK part of the instance of DomainBiQuaternion."""
+        return self._coeffs[3]
+
+    @property
+    def eps(self):
+        """Value of the eps part of the instance of DomainBiQuaternion."""
+        return self._coeffs[4]
+
+    @property
+    def ei(self):
+        """Value of the eps*II part of the instance of DomainBiQuaternion."""
+        return self._coeffs[5]
+
+    @property
+    def ej(self):
+        """Value of the eps*JJ part of the instance of DomainBiQuaternion."""
+        return self._coeffs[6]
+
+    @property
+    def ek(self):
+        """Value of the eps*KK part of the instance of DomainBiQuaternion."""
+        return self._coeffs[7]
+
+    def __mul__(self, other):
+        """Multiply DomainBiQuaternion with other."""
+        if isinstance(other, DomainBiQuaternion):
+            first, second, domain = self._unify(other)
+            algebra = _resolve_algebra(self._algebra, other._algebra)
+            zero = domain.zero
+            out = []
+            for terms in _domain_products(algebra, domain, self.mask, other.mask):
+                val = zero
+                for left, right, factor in terms:
+                    if factor is None:
+                        val += first[left] * second[right]
+                    else:
+                        val += factor * first[left] * second[right]
+                out.append(val)
+            return self._new(tuple(out), other, domain)
+        elif isinstance(other, BiQuaternion):
+            return self.to_biquaternion() * other
+        elif isinstance(other, Poly):
+            return NotImplemented
+        return self * self._coerce(other)
+
+    def __rmul__(self, other):
+        """Multiply other with DomainBiQuaternion."""
+        if isinstance(other, BiQuaternion):
+            return other * self.to_biquaternion()
+        return self._coerce(other) * self
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return self._with_mask(tuple(-val for val in self._coeffs))
+
+    def __add__(self, other):
+        """Add DomainBiQuaternion to other."""
+        if isinstance(other, DomainBiQuaternion):
+            _resolve_algebra(self._algebra, other._algebra)
+            first, second, domain = self._unify(other)
+            return self._new(tuple(a + b for a, b in zip(first, second)), other, domain)
+        elif isinstance(other, BiQuaternion):
+            return self.to_biquaternion() + other
+        elif isinstance(other, Poly):
+            return NotImplemented
+        return self + self._coerce(other)
+
+    def __radd__(self, other):
+        """Add other to DomainBiQuaternion."""
+        if isinstance(other, BiQuaternion):
+            return other + self.to_biquaternion()
+        return self + other
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return other + (-self)
+
+    def __eq__(self, other):
+        """Test equality of two biquaternions."""
+        if not isinstance(other, DomainBiQuaternion):
+            try:
+                other = self._coerce(other)
+            except (TypeError, ValueError, CoercionFailed):
+                return NotImplemented
+        first, second, _ = self._unify(other)
+        return first == second
+
+    def __hash__(self):
+        return hash((self._domain, self._coeffs))
+
+    def __repr__(self):
+        return (
+            "DomainBiQuaternion("
+            + ", ".join(str(self._domain.to_sympy(val)) for val in self._coeffs)
+            + f", domain={self._domain})"
+        )
+
+    def __str__(self):
+        return str(self.to_biquaternion())
+
+    def __pow__(self, other):
+        """Power function of DomainBiQuaternion.
+
+        Integer powers are computed by repeated squaring. For negative exponents
+        the DomainBiQuaternion is inverted only once.
+        """
+        if isinstance(other, int):
+            if other == 0:
+                one = self._domain.one
+                zero = self._domain.zero
+                return self._new((one,) + (zero,) * 7)
+            base = self if other > 0 else self.inv()
+            return _binary_power(base, abs(other))
+        else:
+            raise TypeError(
+                "unsupported operand type(s) for ** or pow(): "
+                + str(type(self))
+                + " and "
+                + str(type(other))
+            )
+
+    def _signature(self, domain):
+        return tuple(domain.from_sympy(sympify(val)) for val in self.algebra.signature)
+
+    def conjugate(self):
+        """Conjugate of this instance of DomainBiQuaternion."""
+        c = self._coeffs
+        return self._with_mask((c[0], -c[1], -c[2], -c[3], c[4], -c[5], -c[6], -c[7]))
+
+    def eps_conjugate(self):
+        """Epsilon conjugation of the biquaternion."""
+        c = self._coeffs
+        return self._with_mask((c[0], c[1], c[2], c[3], -c[4], -c[5], -c[6], -c[7]))
+
+    def quadrance(self):
+        """Quadrance of a quaternion."""
+        domain = self._domain
+        scal, eps = _quadrance_parts(self._coeffs, self._signature(domain))
+        zero = domain.zero
+        return self._new(
+            (domain.convert(scal), zero, zero, zero, domain.convert(eps)) + (zero,) * 3
+        )
+
+    def norm(self):
+        """Extra mapping of quadrance to the term norm, which is commonly used."""
+        return self.quadrance()
+
+    def __invert__(self):
+        return self.conjugate()
+
+    def inv(self):
+        """Inverse of the biquaternion.
+
+        The coefficients of the inverse lie in the field of fractions of the
+        domain, e.g. `QQ` for `ZZ`.
+        """
+        domain = self._domain
+        if not domain.is_Field:
+            domain = domain.get_field()
+        coeffs = _convert(self._coeffs, self._domain, domain)
+        coeffs = _inverse_coeffs(coeffs, self._signature(domain))
+        return self._new(tuple(coeffs), domain=domain)
+
+    def __truediv__(self, other):
+        """Division of DomainBiQuaternion by other."""
+        if isinstance(other, BiQuaternion):
+            return self.to_biquaternion() / other
+        if not isinstance(other, DomainBiQuaternion):
+            other = self._coerce(other)
+        return self * other.inv()
+
+    def __rtruediv__(self, other):
+        """Divide other by DomainBiQuaternion."""
+        return other * self.inv()
+
+    def primal(self):
+        """Primal part of the dual quaternion."""
+        return self._new(self._coeffs[0:4] + (self._domain.zero,) * 4)
+
+    def dual(self):
+        """Dual part of the dual quaternion."""
+        return self._new(self._coeffs[4:] + (self._domain.zero,) * 4)
+
+    def scalar_part(self):
+        """Scalar part of the dual quaternion."""
+        c = self._coeffs
+        zero = self._domain.zero
+        return self._new((c[0], zero, zero, zero, c[4], zero, zero, zero))
+
+    def vector_part(self):
+        """Vector part of the dual quaternion."""
+        c = self._coeffs
+        zero = self._domain.zero
+        return self._new((zero,) + c[1:4] + (zero,) + c[5:])
@@ -1,6 +1,8 @@
 """Module for line creation, representation and manipulation."""
 import numpy as np
-from .biquaternion import BiQuaternion
+from .bq_array import BiQuaternionArray, _as_array
+
+_PLUECKER_SIGNS = np.array([1, 1, 1, -1, -1, -1])
 
 
 def quat_to_pluecker(quat):
@@ -14,14 +16,142 @@ def quat_to_pluecker(quat):
 def pluecker_to_quat(coord):
     """Generate BiQuaternion reperesentation of a line with specified
     Pluecker coordinates."""
+    from .biquaternion import BiQuaternion
+
     return BiQuaternion([0, *coord[0:3], 0, *[-coord[i + 3] for i in range(3)]])
 
 
 def line_to_pluecker(direction, point):
     """Generate Pluecker coordinates for a line with given direction through a point."""
-    return [*direction, -np.cross(direction, point)]
+    return [*direction, *(-np.cross(direction, point))]
 
 
 def act_on_line(quaternion, lin):
     """Let a BiQuaternion act on a line."""
     return quaternion * lin * quaternion.conjugate()
+
+
+def on_klein_quadric(coords, atol=1e-10):
+    """Check if Pluecker coordinates fulfill the Pluecker identity.
+
+    Parameters
+    ----------
+    coords : array_like
+        Array of shape `(..., 6)` of Pluecker coordinates.
+    atol : float, optional
+        Tolerance for the Pluecker identity relative to the product of the norms of
+        direction and moment.
+        (Default 1e-10)
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array, which is True where the coordinates describe a line, i.e.
+        they lie on the Klein quadric and do not vanish.
+    """
+    coords = np.asarray(coords)
+    direction = coords[..., 0:3]
+    moment = coords[..., 3:6]
+    identity = np.abs(np.sum(direction * moment, axis=-1))
+    scale = np.linalg.norm(direction, axis=-1) * np.linalg.norm(moment, axis=-1)
+    return (identity <= atol * scale) & np.any(direction != 0, axis=-1)
+
+
+def pluecker_to_quat_array(coords):
+    """Generate BiQuaternion representations of lines with given Pluecker coordinates.
+
+    Parameters
+    ----------
+    coords : array_like
+        Array of shape `(..., 6)` of Pluecker coordinates.
+
+    Returns
+    -------
+    BiQuaternionArray
+        Array of shape `(...)` of the lines as biquaternions.
+    """
+    coords = np.asarray(coords)
+    out = np.zeros(coords.shape[:-1] + (8,), dtype=np.result_type(coords, 1.0))
+    out[..., 1:4] = coords[..., 0:3]
+    out[..., 5:8] = -coords[..., 3:6]
+    return BiQuaternionArray(out)
+
+
+def quat_array_to_pluecker(quats, atol=1e-10):
+    """Generate Pluecker coordinates from an array of BiQuaternions.
+
+    Parameters
+    ----------
+    quats : BiQuaternionArray, array_like
+        Array of shape `(...)` of biquaternions, or their coefficients of
+        shape `(..., 8)`.
+    atol : float, optional
+        Tolerance relative to the largest coefficient of each biquaternion, below
+        which coefficients are considered to vanish.
+        (Default 1e-10)
+
+    Returns
+    -------
+    coords : numpy.ndarray
+        Array of shape `(..., 6)` of Pluecker coordinates.
+    valid : numpy.ndarray
+        Boolean array, which is False where the biquaternion does not describe a
+        line.
+    """
+    data = _as_array(quats).data
+    coords = data[..., [1, 2, 3, 5, 6, 7]] * _PLUECKER_SIGNS
+    scale = np.abs(data).max(axis=-1)
+    valid = np.abs(data[..., [0, 4]]).max(axis=-1) <= atol * scale
+    valid &= on_klein_quadric(coords, atol)
+    return coords, valid
+
+
+def lines_to_pluecker(directions, points):
+    """Generate Pluecker coordinates for lines with given directions through points.
+
+    Parameters
+    ----------
+    directions : array_like
+        Array of shape `(..., 3)` of directions of the lines.
+    points : array_like
+        Array of shape `(..., 3)` of points on the lines.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape `(..., 6)` of Pluecker coordinates.
+    """
+    directions, points = np.broadcast_arrays(directions, points)
+    return np.concatenate([directions, -np.cross(directions, points)], axis=-1)
+
+
+def act_on_lines(quat, coords, atol=1e-10):
+    """Let one or many BiQuaternions act on an array of lines.
+
+    Parameters
+    ----------
+    quat : BiQuaternion, NumBiQuaternion, BiQuaternionArray
+        Transformation(s) which act on the lines. Arrays of transformations
+        broadcast against the lines.
+    coords : array_like
+        Array of shape `(..., 6)` of Pluecker coordinates.
+    atol : float, optional
+        Tolerance relative to the largest coefficient of each image, below which
+        coefficients are considered to vanish.
+        (Default 1e-10)
+
+    Returns
+    -------
+    coords : numpy.ndarray
+        Array of shape `(..., 6)` of Pluecker coordinates of the transformed lines.
+    valid : numpy.ndarray
+        Boolean array, which is False where the image is not a valid line.
+
+    Notes
+    -----
+    This is the vectorized version of `act_on_line`, followed by
+    `quat_to_pluecker`.
+    """
+    quat = _as_array(quat)
+    image = quat * pluecker_to_quat_array(coords) * quat.conjugate()
+    return quat_array_to_pluecker(image, atol)
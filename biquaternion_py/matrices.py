@@ -0,0 +1,232 @@
+"""Conversion between BiQuaternions and matrices.
+
+This module converts BiQuaternions, which act on points by `act_on_point`, into
+4x4 homogeneous transformation matrices and back. All functions work on arrays
+of poses.
+
+Functions:
+
+    to_homogeneous_matrix
+    to_rotation_matrix
+    from_homogeneous_matrix
+    act_on_points
+"""
+
+import numpy as np
+from .bq_array import (
+    BiQuaternionArray,
+    _as_array,
+    _bq_mul,
+    _bq_conjugate,
+    _bq_eps_conjugate,
+)
+
+# Homogeneous basis points [w, x, y, z] as biquaternions.
+_BASIS_POINTS = np.zeros((4, 8))
+_BASIS_POINTS[[0, 1, 2, 3], [0, 5, 6, 7]] = 1
+
+
+def _homogeneous_matrix(quat):
+    """Compute homogeneous matrices of a BiQuaternionArray."""
+    data = quat.data[..., None, :]
+    algebra = quat.algebra
+    images = _bq_mul(
+        _bq_mul(_bq_eps_conjugate(data), _BASIS_POINTS, algebra),
+        _bq_conjugate(data),
+        algebra,
+    )
+    # Column n of the matrix is the image of the n-th basis point.
+    return np.swapaxes(images[..., [0, 5, 6, 7]], -1, -2)
+
+
+def to_homogeneous_matrix(quat):
+    """Homogeneous 4x4 matrix of the transformation described by a BiQuaternion.
+
+    Parameters
+    ----------
+    quat : BiQuaternion, NumBiQuaternion, BiQuaternionArray
+        Transformation(s) acting on points as in `act_on_point`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape `(..., 4, 4)`. It maps homogeneous coordinates `[w, x, y, z]`
+        of a point to the homogeneous coordinates of its image.
+
+    Notes
+    -----
+    The matrix is not normalized, i.e. just like `act_on_point` it contains the
+    factor `quat.quadrance()` for biquaternions on Study's quadric.
+    For single BiQuaternions and NumBiQuaternions the matrix is cached on the
+    instance and returned as a read only array.
+    """
+    if isinstance(quat, BiQuaternionArray) or not hasattr(quat, "coeffs"):
+        return _homogeneous_matrix(_as_array(quat))
+
+    algebra = quat.algebra
+    cached = quat._hom_matrix
+    if cached is not None and cached[0] == algebra:
+        return cached[1]
+    matrix = _homogeneous_matrix(_as_array(quat))
+    matrix.flags.writeable = False
+    quat._hom_matrix = (algebra, matrix)
+    return matrix
+
+
+def to_rotation_matrix(quat):
+    """Rotation matrix of the transformation described by a BiQuaternion.
+
+    Parameters
+    ----------
+    quat : BiQuaternion, NumBiQuaternion, BiQuaternionArray
+        Transformation(s) acting on points as in `act_on_point`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape `(..., 3, 3)` of the rotational parts.
+    """
+    matrix = to_homogeneous_matrix(quat)
+    return matrix[..., 1:, 1:] / matrix[..., :1, :1]
+
+
+def act_on_points(quat, points, atol=1e-10):
+    """Let one or many BiQuaternions act on an array of points.
+
+    Parameters
+    ----------
+    quat : BiQuaternion, NumBiQuaternion, BiQuaternionArray
+        Transformation(s) which act on the points. Arrays of transformations
+        broadcast against the points.
+    points : array_like
+        Array of shape `(..., 3)` of point coordinates, or of shape `(..., 4)` of
+        homogeneous coordinates `[w, x, y, z]`.
+    atol : float, optional
+        Tolerance relative to the largest coordinate of each image, below which
+        the homogenizing coordinate is considered to vanish.
+        (Default 1e-10)
+
+    Returns
+    -------
+    coords : numpy.ndarray
+        Coordinates of the transformed points with the same layout as `points`.
+        Cartesian coordinates of invalid images are `nan`.
+    valid : numpy.ndarray
+        Boolean array, which is False where the image is not a valid point.
+
+    Notes
+    -----
+    This is the vectorized version of `act_on_point`, followed by `quat_to_point`
+    or `quat_to_hom_point`. Instead of raising an error, invalid images are
+    reported by `valid`. The points are transformed by a single matrix product
+    with `to_homogeneous_matrix(quat)`, which is cached for single BiQuaternions.
+    """
+    points = np.asarray(points)
+    if points.shape[-1] not in (3, 4):
+        raise ValueError("Points must have shape (..., 3) or (..., 4).")
+    if points.shape[-1] == 3:
+        hom = np.concatenate([np.ones(points.shape[:-1] + (1,)), points], axis=-1)
+    else:
+        hom = points
+
+    matrix = to_homogeneous_matrix(quat)
+    if matrix.ndim == 2:
+        image = hom @ matrix.T
+    else:
+        image = (matrix @ hom[..., None])[..., 0]
+
+    valid = np.any(image != 0, axis=-1)
+    if points.shape[-1] == 4:
+        return image, valid
+
+    valid &= np.abs(image[..., 0]) > atol * np.abs(image).max(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coords = image[..., 1:] / image[..., :1]
+    coords[~valid] = np.nan
+    return coords, valid
+
+
+def _rotation_to_quat(rot):
+    """Unit quaternions of an array of rotation matrices (Shepperd's method)."""
+    trace = np.trace(rot, axis1=-2, axis2=-1)
+    diag = np.diagonal(rot, axis1=-2, axis2=-1)
+    # Choose the numerically most stable of the four possible formulas.
+    case = np.argmax(np.concatenate([trace[..., None], diag], axis=-1), axis=-1)
+    quat = np.empty(rot.shape[:-2] + (4,))
+
+    r = rot
+    candidates = [
+        np.stack(
+            [
+                1 + trace,
+                r[..., 2, 1] - r[..., 1, 2],
+                r[..., 0, 2] - r[..., 2, 0],
+                r[..., 1, 0] - r[..., 0, 1],
+            ],
+            axis=-1,
+        ),
+        np.stack(
+            [
+                r[..., 2, 1] - r[..., 1, 2],
+                1 + 2 * r[..., 0, 0] - trace,
+                r[..., 0, 1] + r[..., 1, 0],
+                r[..., 0, 2] + r[..., 2, 0],
+            ],
+            axis=-1,
+        ),
+        np.stack(
+            [
+                r[..., 0, 2] - r[..., 2, 0],
+                r[..., 0, 1] + r[..., 1, 0],
+                1 + 2 * r[..., 1, 1] - trace,
+                r[..., 1, 2] + r[..., 2, 1],
+            ],
+            axis=-1,
+        ),
+        np.stack(
+            [
+                r[..., 1, 0] - r[..., 0, 1],
+                r[..., 0, 2] + r[..., 2, 0],
+                r[..., 1, 2] + r[..., 2, 1],
+                1 + 2 * r[..., 2, 2] - trace,
+            ],
+            axis=-1,
+        ),
+    ]
+    for n, candidate in enumerate(candidates):
+        quat[case == n] = candidate[case == n]
+    return quat / np.linalg.norm(quat, axis=-1, keepdims=True)
+
+
+def from_homogeneous_matrix(matrix):
+    """BiQuaternions describing the transformations of homogeneous matrices.
+
+    Parameters
+    ----------
+    matrix : array_like
+        Array of shape `(..., 4, 4)` of homogeneous matrices acting on coordinates
+        `[w, x, y, z]`. The matrices may be scaled by a nonzero factor.
+
+    Returns
+    -------
+    BiQuaternionArray
+        Array of shape `(...)` of normalized dual quaternions on Study's quadric,
+        such that `to_homogeneous_matrix` reproduces the normalized matrices.
+
+    Notes
+    -----
+    This assumes the algebra of dual quaternions, i.e. `define_algebra()`.
+    The rotational part of each matrix has to be a rotation matrix after
+    normalization.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    matrix = matrix / matrix[..., :1, :1]
+    primal = np.zeros(matrix.shape[:-2] + (8,))
+    primal[..., 0:4] = _rotation_to_quat(matrix[..., 1:, 1:])
+    translation = np.zeros(matrix.shape[:-2] + (8,))
+    translation[..., 1:4] = matrix[..., 1:, 0]
+    # With translation t the dual part is d = -t * p / 2.
+    dual = -_bq_mul(translation, primal) / 2
+    out = primal
+    out[..., 4:8] = dual[..., 0:4]
+    return BiQuaternionArray(out)
@@ -0,0 +1,395 @@
+"""Calculate with numeric BiQuaternions.
+
+This module implements a lightweight BiQuaternion class for purely numeric
+calculations. It offers the same arithmetic as `BiQuaternion`, but stores the
+coefficients as a tuple of python numbers and never constructs sympy objects.
+
+Classes:
+
+    NumBiQuaternion
+"""
+
+import sys
+from numbers import Number
+from .algebra import (
+    current_algebra,
+    _resolve_algebra,
+    _to_number,
+    _binary_power,
+    _quadrance_parts,
+    _inverse_coeffs,
+)
+
+
+def _sanitize_args(*args):
+    """Sanitizes the input of the constructor of NumBiQuaternion."""
+    coeffs = [0.0] * 8
+    if len(args) == 1:
+        gen = args[0]
+        cof = [gen]
+        if hasattr(gen, "coeffs"):
+            cof = gen.coeffs
+        elif isinstance(gen, (list, tuple)) or hasattr(gen, "__array__"):
+            if len(gen) >= 9:
+                raise ValueError("Maximum array length is 8")
+            cof = gen
+    else:
+        if len(args) >= 9:
+            raise ValueError("Maximum array length is 8")
+        cof = args
+
+    for i, val in enumerate(cof):
+        try:
+            coeffs[i] = _to_number(val)
+        except TypeError:
+            raise TypeError("Coefficients of NumBiQuaternion have to be numeric.")
+
+    return tuple(coeffs)
+
+
+class NumBiQuaternion:
+    """
+    Class implementing numeric Bi-Quaternions.
+
+    Numeric Bi-Quaternions are represented as
+    $a + II b + JJ c + KK d + EE (w + II x + JJ y + KK z)$
+    with python floats (or complex numbers) as coefficients.
+    Instances are immutable.
+
+    Attributes
+    ----------
+    coeffs : list
+        coefficients of the quaternion as a list in the canonical order.
+    scal, i, j, k, eps, ei, ej, ek : float
+        Coefficients of the Bi-Quaternion, as for `BiQuaternion`.
+
+    Methods
+    -------
+    from_biquaternion(quat):
+        Create a NumBiQuaternion from a BiQuaternion.
+    to_biquaternion():
+        Convert to a symbolic BiQuaternion.
+    conjugate():
+        Conjugate of this instance of NumBiQuaternion.
+    eps_conjugate():
+        Epsilon conjugation of the biquaternion.
+    quadrance():
+        Quadrance of a quaternion.
+    inv():
+        Inverse of the biquaternion.
+    primal():
+        Primal part of the dual quaternion.
+    dual():
+        Dual part of the dual quaternion.
+    """
+
+    __slots__ = ("_coeffs", "_algebra", "_mask", "_hom_matrix")
+
+    def __init__(self, *args, algebra=None):
+        """Create new instance of NumBiQuaternion.
+
+        Parameters
+        ----------
+        *args :
+            Coefficients as for `BiQuaternion`.
+        algebra : Algebra, optional
+            Algebra to bind the biquaternion to.
+            (Default None uses the current algebra for each operation.)
+        """
+        self._coeffs = _sanitize_args(*args)
+        self._algebra = algebra
+        self._mask = None
+        self._hom_matrix = None
+
+    @classmethod
+    def _from_tuple(cls, coeffs, algebra=None):
+        """Create instance from a tuple of 8 numbers without any checks."""
+        obj = object.__new__(cls)
+        obj._coeffs = coeffs
+        obj._algebra = algebra
+        obj._mask = None
+        obj._hom_matrix = None
+        return obj
+
+    def _new(self, coeffs, other=None):
+        """Create instance from `coeffs` bound to the algebra of self or other."""
+        algebra = self._algebra
+        if algebra is None:
+            algebra = getattr(other, "_algebra", None)
+        return NumBiQuaternion._from_tuple(coeffs, algebra)
+
+    def _with_mask(self, coeffs):
+        """Create instance from `coeffs` with the same nonzero pattern as self."""
+        out = self._new(coeffs)
+        out._mask = self.mask
+        return out
+
+    @property
+    def mask(self):
+        """Bitmask of the nonzero coefficients of the NumBiQuaternion.
+
+        Bit `n` is set, if `coeffs[n]` may be nonzero. Products only compute
+        the coefficients, which are not zero due to the masks of their factors.
+        """
+        if self._mask is None:
+            c = self._coeffs
+            self._mask = (
+                (c[0] != 0)
+                | (c[1] != 0) << 1
+                | (c[2] != 0) << 2
+                | (c[3] != 0) << 3
+                | (c[4] != 0) << 4
+                | (c[5] != 0) << 5
+                | (c[6] != 0) << 6
+                | (c[7] != 0) << 7
+            )
+        return self._mask
+
+    @property
+    def algebra(self):
+        """Algebra according to which the biquaternion is multiplied."""
+        if self._algebra is None:
+            return current_algebra()
+        return self._algebra
+
+    @classmethod
+    def from_biquaternion(cls, quat):
+        """Create a NumBiQuaternion from a BiQuaternion with numeric coefficients.
+
+        Parameters
+        ----------
+        quat : BiQuaternion
+
+        Returns
+        -------
+        NumBiQuaternion
+        """
+        return cls(quat.coeffs, algebra=quat._algebra)
+
+    def to_biquaternion(self):
+        """Convert to a symbolic BiQuaternion.
+
+        Returns
+        -------
+        BiQuaternion
+        """
+        if self._algebra is not None:
+            return self._algebra.BiQuaternion(*self._coeffs)
+        from .biquaternion import BiQuaternion
+
+        return BiQuaternion(*self._coeffs)
+
+    @property
+    def coeffs(self):
+        """Coefficients describing an instance of NumBiQuaternion."""
+        return list(self._coeffs)
+
+    @property
+    def scal(self):
+        """Value of the scalar part of the instance of NumBiQuaternion."""
+        return self._coeffs[0]
+
+    @property
+    def i(self):
+        """Value of the II part of the instance of NumBiQuaternion."""
+        return self._coeffs[1]
+
+    @property
+    def j(self):
+        """Value of the JJ part of the instance of NumBiQuaternion."""
+        return self._coeffs[2]
+
+    @property
+    def k(self):
+        """Value of the KK part of the instance of NumBiQuaternion."""
+        return self._coeffs[3]
+
+    @property
+    def eps(self):
+        """Value of the eps part of the instance of NumBiQuaternion."""
+        return self._coeffs[4]
+
+    @property
+    def ei(self):
+        """Value of the eps*II part of the instance of NumBiQuaternion."""
+        return self._coeffs[5]
+
+    @property
+    def ej(self):
+        """Value of the eps*JJ part of the instance of NumBiQuaternion."""
+        return self._coeffs[6]
+
+    @property
+    def ek(self):
+        """Value of the eps*KK part of the instance of NumBiQuaternion."""
+        return self._coeffs[7]
+
+    def _is_symbolic(self, other):
+        # Symbolic BiQuaternions only exist, if their module is imported. Looking
+        # it up avoids importing sympy for purely numeric calculations.
+        module = sys.modules.get(__package__ + ".biquaternion")
+        return module is not None and isinstance(other, module.BiQuaternion)
+
+    def __mul__(self, other):
+        """Multiply NumBiQuaternion with other."""
+        if isinstance(other, NumBiQuaternion):
+            first = self._coeffs
+            second = other._coeffs
+            algebra = _resolve_algebra(self._algebra, other._algebra)
+            out = [0.0] * 8
+            table, out_mask = algebra.sparse_numeric_table(self.mask, other.mask)
+            for left, right, idx, factor in table:
+                out[idx] += factor * first[left] * second[right]
+            out = self._new(tuple(out), other)
+            out._mask = out_mask
+            return out
+        elif self._is_symbolic(other):
+            return self.to_biquaternion() * other
+        elif isinstance(other, Number):
+            other = _to_number(other)
+            return self._new(tuple(val * other for val in self._coeffs))
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """Multiply other with NumBiQuaternion."""
+        if isinstance(other, Number):
+            return self * other
+        elif self._is_symbolic(other):
+            return other * self.to_biquaternion()
+        return NotImplemented
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return self._with_mask(tuple(-val for val in self._coeffs))
+
+    def __add__(self, other):
+        """Add NumBiQuaternion to other."""
+        if isinstance(other, NumBiQuaternion):
+            _resolve_algebra(self._algebra, other._algebra)
+            return self._new(
+                tuple(a + b for a, b in zip(self._coeffs, other._coeffs)), other
+            )
+        elif self._is_symbolic(other):
+            return self.to_biquaternion() + other
+        elif isinstance(other, Number):
+            return self._new((self._coeffs[0] + _to_number(other),) + self._coeffs[1:])
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return other + (-self)
+
+    def __eq__(self, other):
+        """Test equality of two biquaternions."""
+        if hasattr(other, "coeffs"):
+            othercoeff = other.coeffs
+        else:
+            try:
+                othercoeff = NumBiQuaternion(other).coeffs
+            except (TypeError, ValueError):
+                return NotImplemented
+        return all(val == othercoeff[i] for i, val in enumerate(self._coeffs))
+
+    def __hash__(self):
+        return hash(self._coeffs)
+
+    def __repr__(self):
+        return "NumBiQuaternion(" + ", ".join(map(repr, self._coeffs)) + ")"
+
+    def __str__(self):
+        c = self._coeffs
+        return (
+            f"(( {c[0]} ) + ( {c[1]} ) * i + ( {c[2]} ) * j + ( {c[3]} ) * k)"
+            f" + eps * (( {c[4]} ) + ( {c[5]} ) * i + ( {c[6]} ) * j"
+            f" + ( {c[7]} ) * k)"
+        )
+
+    def __pow__(self, other):
+        """Power function of NumBiQuaternion.
+
+        Integer powers are computed by repeated squaring. For negative exponents
+        the NumBiQuaternion is inverted only once.
+        """
+        if isinstance(other, int):
+            if other == 0:
+                return NumBiQuaternion(1, algebra=self._algebra)
+            base = self if other > 0 else self.inv()
+            return _binary_power(base, abs(other))
+        else:
+            raise TypeError(
+                "unsupported operand type(s) for ** or pow(): "
+                + str(type(self))
+                + " and "
+                + str(type(other))
+            )
+
+    def conjugate(self):
+        """Conjugate of this instance of NumBiQuaternion."""
+        c = self._coeffs
+        return self._with_mask((c[0], -c[1], -c[2], -c[3], c[4], -c[5], -c[6], -c[7]))
+
+    def eps_conjugate(self):
+        """Epsilon conjugation of the biquaternion."""
+        c = self._coeffs
+        return self._with_mask((c[0], c[1], c[2], c[3], -c[4], -c[5], -c[6], -c[7]))
+
+    def quadrance(self):
+        """Quadrance of a quaternion."""
+        scal, eps = _quadrance_parts(self._coeffs, self.algebra.numeric_signature())
+        return self._new((scal, 0.0, 0.0, 0.0, eps, 0.0, 0.0, 0.0))
+
+    def norm(self):
+        """Extra mapping of quadrance to the term norm, which is commonly used."""
+        return self.quadrance()
+
+    def __invert__(self):
+        return self.conjugate()
+
+    def inv(self):
+        """Inverse of the biquaternion."""
+        signature = self.algebra.numeric_signature()
+        return self._new(tuple(_inverse_coeffs(self._coeffs, signature)))
+
+    def __truediv__(self, other):
+        """Division of NumBiQuaternion by other."""
+        if isinstance(other, NumBiQuaternion):
+            return self * other.inv()
+        elif self._is_symbolic(other):
+            return self.to_biquaternion() / other
+        elif isinstance(other, Number):
+            return self * (1 / _to_number(other))
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        """Divide other by NumBiQuaternion."""
+        return other * self.inv()
+
+    def primal(self):
+        """Primal part of the dual quaternion."""
+        return self._new(self._coeffs[0:4] + (0.0,) * 4)
+
+    def dual(self):
+        """Dual part of the dual quaternion."""
+        return self._new(self._coeffs[4:] + (0.0,) * 4)
+
+    def scalar_part(self):
+        """Scalar part of the dual quaternion."""
+        c = self._coeffs
+        return self._new((c[0], 0.0, 0.0, 0.0, c[4], 0.0, 0.0, 0.0))
+
+    def vector_part(self):
+        """Vector part of the dual quaternion."""
+        c = self._coeffs
+        return self._new((0.0,) + c[1:4] + (0.0,) + c[5:])
+
+    def apply_elementwise(self, func, *args):
+        """Apply a function with specified arguments elementwise."""
+        return NumBiQuaternion(
+            *[func(val, *args) for val in self._coeffs], algebra=self._algebra
+        )
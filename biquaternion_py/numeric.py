@@ -0,0 +1,51 @@
+"""Numeric entry point of biquaternion_py.
+
+This module collects the purely numeric parts of the package. Neither it, nor
+any module it imports, imports sympy, which keeps the start up of worker
+processes and command line tools fast. Symbolic BiQuaternions are still
+available from `biquaternion_py` and mix with the numeric classes.
+
+Classes:
+
+    Algebra
+    BiQuaternionArray
+    NumBiQuaternion
+"""
+
+from .algebra import Algebra, current_algebra, use_algebra
+from .bq_array import BiQuaternionArray
+from .num_biquaternion import NumBiQuaternion
+from .matrices import (
+    to_homogeneous_matrix,
+    to_rotation_matrix,
+    from_homogeneous_matrix,
+    act_on_points,
+)
+from .lines import (
+    line_to_pluecker,
+    on_klein_quadric,
+    pluecker_to_quat_array,
+    quat_array_to_pluecker,
+    lines_to_pluecker,
+    act_on_lines,
+)
+from . import profiling
+
+__all__ = [
+    "Algebra",
+    "current_algebra",
+    "use_algebra",
+    "BiQuaternionArray",
+    "NumBiQuaternion",
+    "to_homogeneous_matrix",
+    "to_rotation_matrix",
+    "from_homogeneous_matrix",
+    "act_on_points",
+    "line_to_pluecker",
+    "on_klein_quadric",
+    "pluecker_to_quat_array",
+    "quat_array_to_pluecker",
+    "lines_to_pluecker",
+    "act_on_lines",
+    "profiling",
+]
@@ -1,10 +1,63 @@
 """Extra functions for polynomials."""
 
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+import warnings
+from collections import OrderedDict
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from .biquaternion import BiQuaternion
-from .polynomials import poly_div, Poly
+from .dense_poly import DensePoly
+from .polynomials import Poly, _numeric_coeffs
+from .algebra import Algebra, current_algebra, use_algebra
+from .bq_array import BiQuaternionArray, _as_array, _bq_mul, _bq_conjugate, _bq_inv
+from .profiling import profiled
 import sympy as sy
 
 
+def _coeff_polys(poly):
+    """Coefficients of a univariate BiQuaternion polynomial as sympy polys.
+
+    All 8 coefficients are converted in one pass to dense polynomials over a
+    common field, such that their gcds are monic.
+    """
+    if len(poly.indets) != 1:
+        raise ValueError("Only univariate polynomials are supported.")
+    if not isinstance(poly.poly, BiQuaternion):
+        raise ValueError(
+            "Only polynomials with coefficients in "
+            + "the BiQuaternions are supported."
+        )
+    polys, _ = sy.parallel_poly_from_expr(
+        poly.poly.coeffs, poly.indets[0], field=True, extension=True
+    )
+    return polys
+
+
+@profiled("real_gcd")
+def _real_gcd(polys):
+    """Monic gcd of sympy polys, which stops as soon as it is constant.
+
+    Returns None, if all polys vanish.
+    """
+    polys = sorted((val for val in polys if not val.is_zero), key=sy.Poly.degree)
+    if not polys:
+        return None
+    gcd = polys[0].monic()
+    for val in polys[1:]:
+        if gcd.degree() == 0:
+            break
+        gcd = gcd.gcd(val)
+    return gcd
+
+
+def _as_expr(gcd):
+    return sy.S.Zero if gcd is None else gcd.as_expr()
+
+
 def max_real_poly_fact(poly):
     """Calculate maximal real polynomial factor of the BiQuaternionpolynomial `poly`.
 
@@ -15,24 +68,48 @@ def max_real_poly_fact(poly):
 
     Returns
     -------
-    gcd : Poly
-        Maximal real factor of `poly`
+    gcd : sympy.Expr
+        Maximal real factor of `poly`, normalized to be monic.
     """
-    if len(poly.indets) != 1:
-        raise ValueError("Only univariate polynomials are supported.")
-    if not isinstance(poly.poly, BiQuaternion):
-        raise ValueError(
-            "Only polynomials with coefficients in "
-            + "the BiQuaternions are supported."
-        )
+    return _as_expr(_real_gcd(_coeff_polys(poly)))
 
-    polys = [val for val in poly.poly.coeffs]
 
-    gcd = 0
+def reduce_poly(poly):
+    """Divide the maximal real polynomial factor out of `poly`.
 
-    for val in polys:
-        gcd = sy.gcd(gcd, val)
-    return gcd
+    Parameters
+    ----------
+    poly : Poly
+        Polynomial which to reduce.
+
+    Returns
+    -------
+    gcd : sympy.Expr
+        Maximal real factor of `poly` as returned by `max_real_poly_fact`.
+    reduced : Poly
+        Polynomial with `poly = gcd * reduced`, which has no real polynomial
+        factor of positive degree.
+    """
+    polys = _coeff_polys(poly)
+    gcd = _real_gcd(polys)
+    if gcd is None or gcd.degree() == 0:
+        return _as_expr(gcd), poly
+    quat = poly.poly.func(*[val.exquo(gcd).as_expr() for val in polys])
+    return gcd.as_expr(), Poly(quat, *poly.indets)
+
+
+def _primal_products(first, second, algebra):
+    """Coefficients of the product of two quaternions with sympy poly entries."""
+    out = []
+    for terms in algebra.sparse_products(0b1111, 0b1111)[:4]:
+        val = None
+        for left, right, factor in terms:
+            term = first[left] * second[right]
+            if factor != 1:
+                term = term * factor
+            val = term if val is None else val + term
+        out.append(val)
+    return out
 
 
 def gcd_conj_pd(poly):
@@ -46,25 +123,28 @@ def gcd_conj_pd(poly):
 
     Returns
     -------
-    gcd : Poly
+    gcd : sympy.Expr
+        Monic gcd.
 
+    Notes
+    -----
+    The coefficients are converted to sympy polys only once. The products are
+    only computed, if the maximal real factor `c` of the primal part is not
+    constant already.
     """
-    c = max_real_poly_fact(poly.primal())
-    primal = (poly * (1 / c)).poly.primal()
-    dual = poly.poly.dual()
-
-    primal_dual_conj = (primal * dual.conjugate()).coeffs[0:4]
-    primal_conj_dual = (primal.conjugate() * dual).coeffs[0:4]
-
-    gcd = sy.gcd(c, primal_dual_conj[0])
+    polys = _coeff_polys(poly)
+    c = _real_gcd(polys[:4])
+    if c is None or c.degree() == 0:
+        return _as_expr(c)
+    primal = [val.exquo(c) for val in polys[:4]]
+    dual = polys[4:]
+    primal_conj = [primal[0]] + [-val for val in primal[1:]]
+    dual_conj = [dual[0]] + [-val for val in dual[1:]]
 
-    for i in range(3):
-        gcd = sy.gcd(gcd, primal_dual_conj[i + 1])
-
-    for val in primal_conj_dual:
-        gcd = sy.gcd(gcd, val)
-
-    return gcd
+    algebra = poly.poly.algebra
+    products = _primal_products(primal, dual_conj, algebra)
+    products += _primal_products(primal_conj, dual, algebra)
+    return _as_expr(_real_gcd([c] + products))
 
 
 def is_poly_reduced(poly):
@@ -83,7 +163,8 @@ def is_poly_reduced(poly):
     Notes
     -----
     A polynomial is called reduced, if the primal and dual part have no common
-    real factor. [1]_
+    real factor. [1]_ This is the case, if the maximal real factor of all
+    coefficients is constant.
 
     .. [1] Z. Li, J. Schicho, H.-P. Schröcker,
        The rational motion of minimal dual quaternion degree with prescribed trajectory,
@@ -94,12 +175,137 @@ def is_poly_reduced(poly):
        ISSN 0167-8396,
        https://doi.org/10.1016/j.cagd.2015.10.002.
     """
-    return (
-        sy.gcd(max_real_poly_fact(poly.primal()), max_real_poly_fact(poly.dual())) == 1
+    gcd = _real_gcd(_coeff_polys(poly))
+    return gcd is not None and gcd.degree() == 0
+
+
+@profiled("real_factors")
+def _real_factors(factor, tol=None):
+    """Split a sympy poly, irreducible over its domain, into real factors.
+
+    Returns monic linear factors for the real roots and monic quadratic factors
+    for pairs of complex conjugate roots. Factors of degree three or more are
+    split with radicals, if their coefficients are real radical expressions,
+    and with `CRootOf` instances otherwise. For `tol` not None these factors
+    are approximated by factors with rational coefficients instead.
+    """
+    var = factor.gen
+    if factor.degree() <= 1:
+        return [factor.monic()]
+    if factor.degree() == 2:
+        if factor.discriminant() < 0:
+            return [factor.monic()]
+        return [sy.Poly(var - root, var) for root in factor.all_roots()]
+    if tol is not None:
+        return _approx_real_factors(factor, tol)
+
+    num_real = factor.count_roots()
+    radicals = list(sy.roots(factor))
+    # Radicals of complex numbers, as in the casus irreducibilis, do not
+    # simplify to real coefficients.
+    if len(radicals) == factor.degree() and not any(
+        val.base.has(sy.I) and not val.exp.is_integer
+        for root in radicals
+        for val in root.atoms(sy.Pow)
+    ):
+        return _pair_radicals(var, radicals, num_real)
+
+    # The real roots come first and conjugates of `CRootOf` are exact.
+    roots = factor.all_roots()
+    out = [sy.Poly(var - root, var) for root in roots[:num_real]]
+    complexes = roots[num_real:]
+    while complexes:
+        first = complexes.pop(0)
+        second = first.conjugate()
+        complexes.remove(second)
+        out.append(_quadratic_factor(var, first, second))
+    return out
+
+
+def _pair_radicals(var, roots, num_real):
+    """Real factors from radical roots of which `num_real` are real.
+
+    The roots are classified by their numeric values: the real roots have the
+    smallest imaginary parts and every root in the upper half plane is paired
+    with the nearest conjugate of a root in the lower half plane.
+    """
+    values = [complex(sy.N(root, 30)) for root in roots]
+    order = sorted(range(len(roots)), key=lambda n: abs(values[n].imag))
+    out = [sy.Poly(var - roots[n], var) for n in order[:num_real]]
+    lower = [n for n in order[num_real:] if values[n].imag < 0]
+    for n in order[num_real:]:
+        if values[n].imag > 0:
+            conj = min(lower, key=lambda m: abs(values[m] - values[n].conjugate()))
+            lower.remove(conj)
+            out.append(_quadratic_factor(var, roots[n], roots[conj]))
+    return out
+
+
+def _quadratic_factor(var, first, second):
+    """Monic quadratic sympy poly with roots first and second."""
+    return sy.Poly.from_list(
+        [1, -sy.expand(first + second), sy.expand(first * second)], var
     )
 
 
-def irreducible_factors(poly, domain=None):
+def _approx_real_factors(factor, tol):
+    """Real factors with rational coefficients approximating those of `factor`.
+
+    The roots are computed numerically and rounded to decimal rationals. The
+    precision is doubled until the real roots are separated from the complex
+    ones and the coefficients of the product of the factors differ from those
+    of the monic `factor` by less than `tol`.
+    """
+    var = factor.gen
+    monic = factor.monic()
+    num_real = factor.count_roots()
+    digits = 15
+    while True:
+        roots = [_to_rational(root) for root in monic.nroots(digits, digits + 50)]
+        real = [root for root in roots if root.is_real]
+        upper = [root for root in roots if not root.is_real and sy.im(root) > 0]
+        if len(real) == num_real and 2 * len(upper) + len(real) == len(roots):
+            out = [sy.Poly(var - root, var) for root in real]
+            # The quadratic factor is built from one root of each conjugate
+            # pair, which keeps its coefficients real.
+            for root in upper:
+                re, im = root.as_real_imag()
+                out.append(sy.Poly(var**2 - 2 * re * var + re**2 + im**2, var))
+            diff = monic - sy.prod(out)
+            if all(abs(coeff) < tol for coeff in diff.all_coeffs()):
+                return out
+        digits *= 2
+
+
+def _to_rational(val):
+    """Convert a numeric sympy root to a (complex) decimal rational."""
+    re, im = val.as_real_imag()
+    return sy.Rational(str(re)) + sy.I * sy.Rational(str(im))
+
+
+def _numeric_real_factors(poly):
+    """Real factors with multiplicities of a sympy poly from numeric roots.
+
+    The square-free decomposition is computed for the rational version of
+    `poly`, since gcds of floating point polynomials are unreliable. The
+    numeric roots are then calculated for each square-free factor.
+    """
+    var = poly.gen
+    out = []
+    for sqf_factor, mult in poly.set_domain(sy.QQ).sqf_list()[1]:
+        for root in sqf_factor.set_domain(poly.domain).nroots():
+            re, im = root.as_real_imag()
+            if im == 0:
+                out.append((sy.Poly(var - re, var), mult))
+            elif im > 0:
+                out.append(
+                    (sy.Poly(var**2 - 2 * re * var + re**2 + im**2, var), mult)
+                )
+    return out
+
+
+@profiled("irreducible_factors")
+def irreducible_factors(poly, domain=None, multiplicities=False, tol=None):
     """Calculate the irreducible factors of a polynomial.
 
     Parameters
@@ -109,36 +315,52 @@ def irreducible_factors(poly, domain=None):
     domain : string, optional
         Domain over which to calculate the irreducible factors.
         (Default None lets sympy decide which domain to use.)
+    multiplicities : bool, optional
+        Return each distinct factor once together with its multiplicity.
+        (Default False repeats factors according to their multiplicity.)
+    tol : float, optional
+        Approximate irreducible factors of degree three or more by factors with
+        rational coefficients, such that the coefficients of their product are
+        correct up to `tol`.
+        (Default None splits them exactly.)
 
     Returns
     -------
+    lcoeff :
+        Leading coefficient of `poly`.
     out : array of Poly
-        List of irreducible factors.
+        List of monic irreducible real factors, which are linear or quadratic.
+        For `multiplicities = True` a list of tuples `(factor, multiplicity)`.
 
     Notes
     -----
-    If the irreducible factors are not calculated correctly this might be an issue
-    of sympy assuming to much about the domain. Chaning this to "QQ" or "RR"
+    The polynomial is decomposed into square-free factors, which are factorized
+    over their domain (usually `QQ`). Factors of degree larger than two are
+    split further into factors, whose coefficients are radicals or sums and
+    products of `CRootOf` instances. Computations with the latter are slow, in
+    which case `tol` trades exactness for rational coefficients. For inexact
+    domains such as "RR" the square-free factors are split by numeric roots.
     """
     var = poly.indets[0]
-    t = sy.Symbol(var.name, real=True)
-    poly1 = Poly(poly.poly.subs({var: t}), t)
     if domain:
-        factors = sy.polys.polyroots.root_factors(poly1.poly, t, domain=domain)
+        sym_poly = sy.Poly(poly.poly, var, domain=domain)
     else:
-        factors = sy.polys.polyroots.root_factors(poly1.poly, t)
-    out = []
-    for i, val in enumerate(factors):
-        if val.is_real:
-            out = out + [val]
-        else:
-            for j, val2 in enumerate(factors[i:]):
-                if val == val2.conjugate():
-                    out = out + [sy.expand(val * val2)]
-                    factors.pop(i + j)
-
-    for i, val in enumerate(out):
-        out[i] = Poly(val.subs({t: var}), var)
+        sym_poly = sy.Poly(poly.poly, var)
+
+    if sym_poly.domain.is_Exact:
+        factors = []
+        for sqf_factor, mult in sym_poly.sqf_list()[1]:
+            for factor, _ in sqf_factor.factor_list()[1]:
+                factors += [(val, mult) for val in _real_factors(factor, tol)]
+    else:
+        factors = _numeric_real_factors(sym_poly)
+
+    if multiplicities:
+        out = [(Poly(factor.as_expr(), var), mult) for factor, mult in factors]
+    else:
+        out = [
+            Poly(factor.as_expr(), var) for factor, mult in factors for _ in range(mult)
+        ]
     return poly.lcoeff(var), out
 
 
@@ -165,11 +387,24 @@ def split_lin_factor(poly, norm):
         raise ValueError("Poly and norm must have the same indeterminates.")
 
     indet = poly.indets[0]
-    _, rem = poly_div(poly, norm, indet, False)
-    root = -(rem.poly.coeff(indet, 1).inv()) * rem.poly.coeff(indet, 0)
-    lin_fact = Poly(indet - root, indet)
-    quot, _ = poly_div(poly, lin_fact, indet, False)
-    return quot, lin_fact
+    quot, root = _split_lin_factor_dense(
+        DensePoly.from_poly(poly, indet), DensePoly.from_poly(norm, indet)
+    )
+    return quot.to_poly(), Poly(indet - root, indet)
+
+
+@profiled("split_lin_factor")
+def _split_lin_factor_dense(poly, norm):
+    """Quotient and root `h` of the linear factor `t - h` with norm `norm`.
+
+    Both divisions are fraction-free pseudo-divisions, see `DensePoly.pseudo_div`.
+    """
+    # The root does not depend on the central scale of the pseudo-remainder.
+    _, _, rem = poly.pseudo_div(norm, False)
+    root = -(rem.coeff(1).inv()) * rem.coeff(0)
+    one = root * 0 + 1
+    scale, quot, _ = poly.pseudo_div(poly._new([-root, one]), False)
+    return quot * scale.inv(), root
 
 
 def factorize_from_list(poly, factors):
@@ -189,17 +424,19 @@ def factorize_from_list(poly, factors):
     """
     if len(poly.indets) != 1:
         raise ValueError("Only univariate polynomials supported.")
+    indet = poly.indets[0]
     out = []
-    poly0 = poly
+    # The quotients stay dense, such that every factor is converted only once.
+    poly0 = DensePoly.from_poly(poly, indet)
     for i, val in enumerate(factors[::-1]):
         if poly.indets != val.indets:
             raise ValueError("Poly and factor must have the same indeterminates.")
-        poly0, lin_fact = split_lin_factor(poly0, val)
-        out = [lin_fact] + out
+        poly0, root = _split_lin_factor_dense(poly0, DensePoly.from_poly(val, indet))
+        out = [Poly(indet - root, indet)] + out
     return out
 
 
-def factorize_bq_poly(poly, domain=None):
+def factorize_bq_poly(poly, domain=None, tol=None):
     """Factorize Biquaternion polynomial into linear factors.
 
     Parameters
@@ -209,15 +446,482 @@ def factorize_bq_poly(poly, domain=None):
     domain : string, optional
         Domain over which to calculate the irreducible factors.
         (Default None lets sympy decide which domain to use.)
+    tol : float, optional
+        Tolerance of approximated irreducible factors, see
+        `irreducible_factors`.
+        (Default None computes the factors exactly.)
     Returns
     -------
     factors : array of Poly
         Array of linear factors of `poly` associated to the order of the factors
     given by irreducible_factors.
     """
-    norm = poly.norm()
+    scal, _ = poly.norm_poly()
     # if not is_poly_real(norm):
     #     raise ValueError("Norm must be a real polynomial.")
-    norm = Poly(norm.poly.scal, *norm.indets)
-    _, factors = irreducible_factors(norm, domain)
+    norm = Poly(scal.as_expr(), *poly.indets)
+    _, factors = irreducible_factors(norm, domain, tol=tol)
     return factorize_from_list(poly, factors)
+
+
+def _distinct(factors):
+    """Indices of the first occurrences of the distinct entries of factors."""
+    out = []
+    for n, factor in enumerate(factors):
+        if all(factor != factors[m] for m in out):
+            out.append(n)
+    return out
+
+
+def _factorization_tree(poly, factors, suffix):
+    """Generate factorizations of `poly * suffix` for all orderings of factors.
+
+    The linear factors are split off from the right, such that all orderings
+    sharing the rightmost factors reuse the same quotient.
+    """
+    if not factors:
+        yield suffix
+        return
+    for n in _distinct(factors):
+        quot, lin_fact = split_lin_factor(poly, factors[n])
+        rest = factors[:n] + factors[n + 1 :]
+        yield from _factorization_tree(quot, rest, [lin_fact] + suffix)
+
+
+def _factorization_subtree(poly, factors, index, signature):
+    """All factorizations of poly with `factors[index]` as rightmost factor."""
+    with use_algebra(Algebra(*signature)):
+        quot, lin_fact = split_lin_factor(poly, factors[index])
+        rest = factors[:index] + factors[index + 1 :]
+        return list(_factorization_tree(quot, rest, [lin_fact]))
+
+
+def all_factorizations(poly, factors=None, max_workers=None):
+    """Generate all factorizations of a BiQuaternion polynomial.
+
+    Parameters
+    ----------
+    poly : Poly
+        Polynomial which to factorize.
+    factors : array of Poly, optional
+        Irreducible factors of the norm polynomial of `poly`.
+        (Default None computes them with `irreducible_factors`.)
+    max_workers : int, optional
+        Number of worker processes.
+        (Default None uses the number of processors. With 1 no process pool is
+        started.)
+
+    Yields
+    ------
+    list of Poly
+        Linear factors of `poly`, as returned by `factorize_from_list`, for
+        every distinct ordering of `factors`.
+
+    Notes
+    -----
+    The orderings are traversed as a tree, such that orderings with common
+    rightmost factors share the quotients of the divisions. The subtrees of the
+    different rightmost factors are distributed to a process pool and yielded
+    as soon as they are completed, hence in no particular order.
+    """
+    if factors is None:
+        scal, _ = poly.norm_poly()
+        norm = Poly(scal.as_expr(), *poly.indets)
+        _, factors = irreducible_factors(norm)
+    factors = list(factors)
+    roots = _distinct(factors)
+    if max_workers == 1 or len(roots) < 2:
+        yield from _factorization_tree(poly, factors, [])
+        return
+
+    signature = current_algebra().signature
+    executor = ProcessPoolExecutor(max_workers)
+    futures = [
+        executor.submit(_factorization_subtree, poly, factors, n, signature)
+        for n in roots
+    ]
+    try:
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+def _numeric_poly_coeffs(poly):
+    """Coefficient array of shape `(..., deg + 1, 8)` in ascending order."""
+    if isinstance(poly, Poly):
+        if len(poly.indets) != 1:
+            raise ValueError("Only univariate polynomials supported.")
+        return np.array(_numeric_coeffs(poly.all_indet_coeffs(poly.indets[0])))
+    return _as_array(poly).data
+
+
+def _numeric_poly_mul(first, second, algebra):
+    """Product of coefficient arrays of biquaternion polynomials."""
+    prods = _bq_mul(first[..., :, None, :], second[..., None, :, :], algebra)
+    num = second.shape[-2]
+    out = np.zeros(prods.shape[:-3] + (first.shape[-2] + num - 1, 8), prods.dtype)
+    for n in range(first.shape[-2]):
+        out[..., n : n + num, :] += prods[..., n, :, :]
+    return out
+
+
+def _real_roots_pairs(norm, deg):
+    """Pair roots of monic real polynomials to `deg` real quadratic factors.
+
+    Returns the coefficients `lin`, `const` of the factors `t**2 + lin*t + const`
+    as arrays of shape `(..., deg)`.
+    """
+    # Eigenvalues of the companion matrices are the roots of the norm polynomials.
+    size = 2 * deg
+    companion = np.zeros(norm.shape[:-1] + (size, size))
+    companion[..., 0, :] = -norm[..., -2::-1]
+    companion[..., np.arange(1, size), np.arange(size - 1)] = 1
+    roots = np.linalg.eigvals(companion)
+    # The deg roots with the largest imaginary parts lie in the upper half plane.
+    # Real roots have even multiplicity and are split evenly by the sorting.
+    roots = np.take_along_axis(roots, np.argsort(roots.imag, axis=-1), axis=-1)
+    lower, upper = roots[..., :deg], roots[..., deg:]
+    first, second = _match_conjugates(upper, lower)
+    lin, const = -(first + second), first * second
+    scale = 1 + np.abs(lin) + np.abs(const)
+    if np.any(np.abs(lin.imag) + np.abs(const.imag) > 1e-6 * scale):
+        warnings.warn(
+            "Roots of the norm polynomial could not be paired to complex "
+            "conjugates, the factorization is inaccurate.",
+            RuntimeWarning,
+        )
+    return lin.real, const.real
+
+
+def _match_conjugates(upper, lower):
+    """Reorder `lower` such that `lower[..., n]` is closest to `upper[..., n]*`.
+
+    The pairs are chosen greedily by increasing distance, which does not depend
+    on the imaginary parts of different pairs being distinct.
+    """
+    deg = upper.shape[-1]
+    dist = np.abs(upper[..., :, None] - lower[..., None, :].conj())
+    index = np.zeros(upper.shape, dtype=int)
+    batch = np.indices(upper.shape[:-1])
+    for _ in range(deg):
+        flat = np.argmin(dist.reshape(upper.shape[:-1] + (deg * deg,)), axis=-1)
+        row, col = np.divmod(flat, deg)
+        index[(*batch, row)] = col
+        dist[(*batch, row)] = np.inf
+        dist[(*batch, slice(None), col)] = np.inf
+    return upper, np.take_along_axis(lower, index, axis=-1)
+
+
+def factorize_bq_poly_numeric(poly):
+    """Factorize BiQuaternion polynomials into linear factors in float arithmetic.
+
+    Parameters
+    ----------
+    poly : Poly, BiQuaternionArray, array_like
+        Univariate polynomial, or coefficients of polynomials as array of shape
+        `(..., deg + 1, 8)` in ascending order of the degree. The leading
+        coefficient has to be invertible.
+
+    Returns
+    -------
+    lead : BiQuaternionArray
+        Leading coefficients of shape `(...)`.
+    roots : BiQuaternionArray
+        Array of shape `(..., deg)` of biquaternions `h_1, ..., h_deg`, such that
+        `poly = lead * (t - h_1) * ... * (t - h_deg)`.
+    residual : numpy.ndarray
+        Largest absolute difference between the coefficients of `poly` and of the
+        reconstructed product, relative to the largest coefficient of `poly`.
+
+    Notes
+    -----
+    This mirrors `factorize_bq_poly`, but computes the roots of the norm
+    polynomial as eigenvalues of its companion matrix and splits off the linear
+    factors with float arithmetic. Quadratic factors of the norm polynomial are
+    obtained by pairing complex conjugate roots. All polynomials of a batch are
+    factorized at once.
+    """
+    coeffs = _numeric_poly_coeffs(poly)
+    algebra = current_algebra()
+    deg = coeffs.shape[-2] - 1
+    lead = coeffs[..., -1, :]
+    monic = _bq_mul(_bq_inv(lead, algebra)[..., None, :], coeffs, algebra)
+
+    roots = np.zeros(coeffs.shape[:-2] + (deg, 8), dtype=coeffs.dtype)
+    if deg > 0:
+        norm = _numeric_poly_mul(monic, _bq_conjugate(monic), algebra)[..., 0].real
+        lin, const = _real_roots_pairs(norm, deg)
+        rest = monic
+        for k in range(deg - 1, -1, -1):
+            # Remainder of the division by t**2 + lin*t + const.
+            rem = rest.copy()
+            for n in range(rem.shape[-2] - 1, 1, -1):
+                rem[..., n - 1, :] -= lin[..., k, None] * rem[..., n, :]
+                rem[..., n - 2, :] -= const[..., k, None] * rem[..., n, :]
+            root = -_bq_mul(_bq_inv(rem[..., 1, :], algebra), rem[..., 0, :], algebra)
+            roots[..., k, :] = root
+            # Division rest = quot * (t - root), the remainder vanishes.
+            quot = np.zeros(rest.shape[:-2] + (rest.shape[-2] - 1, 8), rest.dtype)
+            quot[..., -1, :] = rest[..., -1, :]
+            for n in range(quot.shape[-2] - 1, 0, -1):
+                quot[..., n - 1, :] = rest[..., n, :] + _bq_mul(
+                    quot[..., n, :], root, algebra
+                )
+            rest = quot
+
+    product = lead[..., None, :]
+    for k in range(deg):
+        lin_fact = np.zeros(roots.shape[:-2] + (2, 8), dtype=roots.dtype)
+        lin_fact[..., 0, :] = -roots[..., k, :]
+        lin_fact[..., 1, 0] = 1
+        product = _numeric_poly_mul(product, lin_fact, algebra)
+    residual = np.abs(product - coeffs).max(axis=(-2, -1)) / np.abs(coeffs).max(
+        axis=(-2, -1)
+    )
+    return BiQuaternionArray(lead), BiQuaternionArray(roots), residual
+
+
+# Indeterminate of the canonical forms. As a Dummy it cannot clash with a
+# symbol in the coefficients.
+_CANONICAL_INDET = sy.Dummy("t")
+
+
+def _cache_key(kind, coeffs, domain):
+    """Hash identifying a cached computation on canonical coefficients."""
+    text = sy.srepr((kind, current_algebra().signature, domain, tuple(coeffs)))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _canonical_bq_poly(poly):
+    """Monic version of univariate `poly` in the canonical indeterminate."""
+    if len(poly.indets) != 1:
+        raise ValueError("Only univariate polynomials supported.")
+    dense = DensePoly.from_poly(poly)
+    lead_inv = dense.lcoeff().inv()
+    coeffs = [
+        (lead_inv * val).apply_elementwise(sy.expand) for val in dense.coeffs[:-1]
+    ]
+    return DensePoly(coeffs + [1], _CANONICAL_INDET)
+
+
+def _canonical_real_poly(poly):
+    """Monic version of univariate real `poly` in the canonical indeterminate."""
+    if len(poly.indets) != 1:
+        raise ValueError("Only univariate polynomials supported.")
+    coeffs = sy.Poly(poly.poly, poly.indets[0]).monic().all_coeffs()
+    return coeffs, Poly(sy.Poly(coeffs, _CANONICAL_INDET).as_expr(), _CANONICAL_INDET)
+
+
+def _bq_coeff_lists(polys):
+    """Coefficients of BiQuaternion polys in the canonical indeterminate."""
+    return [DensePoly.from_poly(val, _CANONICAL_INDET).coeffs for val in polys]
+
+
+def _real_coeff_lists(polys):
+    """Coefficients of real polys in the canonical indeterminate."""
+    return [sy.Poly(val.poly, _CANONICAL_INDET).all_coeffs() for val in polys]
+
+
+class FactorizationCache:
+    """
+    Cache for factorizations of polynomials.
+
+    Polynomials are identified by their canonical form, i.e. the monic
+    polynomial obtained by multiplying with the inverse of the leading
+    coefficient from the left. Hence scalar multiples and renamed polynomials
+    share their entries. The cache stores the coefficients of the results, which
+    are converted to polynomials in the indeterminate of the argument.
+
+    Results are kept in a LRU cache in memory and optionally in a sqlite
+    database on disk, which persists across processes. The cache may be shared
+    between threads, concurrent misses of the same polynomial are computed by
+    each thread.
+
+    Attributes
+    ----------
+    stats : dict
+        Number of `hits` in memory, `disk_hits`, `misses` and the current `size`
+        and `disk_size` of the cache.
+
+    Methods
+    -------
+    factorize_bq_poly(poly, domain):
+        Cached version of `factorize_bq_poly`.
+    irreducible_factors(poly, domain):
+        Cached version of `irreducible_factors`.
+    clear():
+        Remove all entries.
+    """
+
+    def __init__(self, maxsize=128, path=None, disk_maxsize=10000):
+        """Create new instance of FactorizationCache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximal number of entries kept in memory.
+            (Default 128)
+        path : str, optional
+            Path of the sqlite database. The database is created if necessary.
+            (Default None disables the on disk cache.)
+        disk_maxsize : int, optional
+            Maximal number of entries in the database. The least recently used
+            entries are evicted first.
+            (Default 10000)
+        """
+        self._maxsize = maxsize
+        self._disk_maxsize = disk_maxsize
+        self._memory = OrderedDict()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._db = None
+        # Guards the LRU order, the statistics and the database connection,
+        # which is shared between threads.
+        self._lock = threading.Lock()
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS factorizations "
+                "(key TEXT PRIMARY KEY, value BLOB, used REAL)"
+            )
+            self._db.commit()
+
+    @property
+    def stats(self):
+        """Hit and miss statistics and size of the cache."""
+        with self._lock:
+            disk_size = 0
+            if self._db is not None:
+                disk_size = self._db.execute(
+                    "SELECT COUNT(*) FROM factorizations"
+                ).fetchone()[0]
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "size": len(self._memory),
+                "disk_size": disk_size,
+            }
+
+    def clear(self):
+        """Remove all entries from memory and disk, and reset the statistics."""
+        with self._lock:
+            self._memory.clear()
+            self._hits = self._disk_hits = self._misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM factorizations")
+                self._db.commit()
+
+    def close(self):
+        """Close the connection to the database."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key, value):
+        """Store value in memory, the lock has to be held."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._maxsize:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key, compute):
+        """Return cached value for key, or compute and store it.
+
+        The lock is released during the computation, such that other threads
+        can use the cache meanwhile.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._hits += 1
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM factorizations WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._disk_hits += 1
+                    self._db.execute(
+                        "UPDATE factorizations SET used = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                    self._db.commit()
+                    value = pickle.loads(row[0])
+                    self._remember(key, value)
+                    return value
+            self._misses += 1
+
+        value = compute()
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO factorizations VALUES (?, ?, ?)",
+                    (key, pickle.dumps(value), time.time()),
+                )
+                self._db.execute(
+                    "DELETE FROM factorizations WHERE key IN (SELECT key FROM "
+                    "factorizations ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                    (self._disk_maxsize,),
+                )
+                self._db.commit()
+        return value
+
+    def factorize_bq_poly(self, poly, domain=None):
+        """Cached version of `factorize_bq_poly`.
+
+        Parameters
+        ----------
+        poly : Poly
+            Univariate polynomial which to factorize.
+        domain : string, optional
+            Domain over which to calculate the irreducible factors.
+
+        Returns
+        -------
+        factors : array of Poly
+            Array of linear factors of `poly`, as returned by
+            `factorize_bq_poly`.
+        """
+        canonical = _canonical_bq_poly(poly)
+        coeffs = [tuple(val.coeffs) for val in canonical.coeffs]
+        key = _cache_key("factorize_bq_poly", coeffs, domain)
+        factors = self._lookup(
+            key,
+            lambda: _bq_coeff_lists(factorize_bq_poly(canonical.to_poly(), domain)),
+        )
+        var = poly.indets[0]
+        return [DensePoly(val, var).to_poly() for val in factors]
+
+    def irreducible_factors(self, poly, domain=None):
+        """Cached version of `irreducible_factors`.
+
+        Parameters
+        ----------
+        poly : Poly
+            Univariate real polynomial.
+        domain : string, optional
+            Domain over which to calculate the irreducible factors.
+
+        Returns
+        -------
+        lcoeff :
+            Leading coefficient of `poly`.
+        out : array of Poly
+            List of irreducible factors.
+        """
+        coeffs, canonical = _canonical_real_poly(poly)
+        key = _cache_key("irreducible_factors", coeffs, domain)
+        factors = self._lookup(
+            key, lambda: _real_coeff_lists(irreducible_factors(canonical, domain)[1])
+        )
+        var = poly.indets[0]
+        return poly.lcoeff(var), [
+            Poly(sy.Poly(val, var).as_expr(), var) for val in factors
+        ]
@@ -1,9 +1,16 @@
 """Implementation of polynomial class and associated functions."""
 
-from sympy import expand, Pow, Expr, sympify, Symbol
+import numpy as np
+from sympy import Pow, Expr, sympify, Symbol, parallel_poly_from_expr
+from sympy import expand as _sympy_expand
 from numpy import ndarray
+from .algebra import current_algebra, _binary_power, _to_number, _quadrance_parts
+from .profiling import profiled
 
+expand = profiled("sympy.expand")(_sympy_expand)
 
+
+@profiled("polynomials._max_pow")
 def _max_pow(expr, indet):
     """Find the maximal power of indet in expr.
 
@@ -112,18 +119,54 @@ def _terms(poly):
     return term_arr
 
 
+def _is_zero(expr):
+    """Test whether an expanded expression or BiQuaternion vanishes."""
+    if hasattr(expr, "coeffs"):
+        return all(val == 0 for val in expr.coeffs)
+    return expr == 0
+
+
+def _copy_coeffs(coeffs):
+    """Copy nested list of coefficients, without copying the coefficients."""
+    if isinstance(coeffs, list):
+        return [_copy_coeffs(val) for val in coeffs]
+    return coeffs
+
+
 def _eval_poly(coeffs, vals, right=True):
-    """Helper function to evaluate polynomial defined by `coeffs` at `vals`."""
+    """Helper function to evaluate polynomial defined by `coeffs` at `vals`.
+
+    The polynomial is evaluated by Horner's scheme. For `right = True` the
+    values are multiplied from the right, otherwise from the left.
+    """
     out = 0
-    for i, val in enumerate(coeffs):
+    for val in reversed(coeffs):
         if isinstance(val, list):
-            temp = _eval_poly(val, vals[1:], right)
-        else:
-            temp = val
+            val = _eval_poly(val, vals[1:], right)
         if right:
-            out += temp * (vals[0] ** i)
+            out = out * vals[0] + val
         else:
-            out += (vals[0] ** i) * temp
+            out = vals[0] * out + val
+    return out
+
+
+def _numeric_coeffs(coeffs):
+    """Convert nested list of coefficients to nested list of arrays of shape (8,)."""
+    from .biquaternion import BiQuaternion
+
+    if isinstance(coeffs, list):
+        return [_numeric_coeffs(val) for val in coeffs]
+    return np.array([_to_number(val) for val in BiQuaternion(coeffs).coeffs])
+
+
+def _eval_poly_array(coeffs, vals):
+    """Evaluate numeric coefficients at arrays of (real) values by Horner's scheme."""
+    val = vals[0][..., None]
+    out = 0
+    for coeff in reversed(coeffs):
+        if isinstance(coeff, list):
+            coeff = _eval_poly_array(coeff, vals[1:])
+        out = out * val + coeff
     return out
 
 
@@ -172,6 +215,14 @@ class Poly(Expr):
         obj = Expr.__new__(cls, poly, *indets)
         obj._poly = poly
         obj._indets = indets
+        # Lazily computed metadata, see `_lead`.
+        obj._degs = {}
+        obj._lcoeffs = {}
+        obj._indet_coeffs = {}
+        obj._expanded = None
+        obj._term_cache = None
+        obj._coeff_cache = None
+        obj._numeric_cache = None
         return obj
 
     @property
@@ -182,22 +233,56 @@ class Poly(Expr):
     def indets(self):
         return self._indets
 
+    def expanded(self):
+        """Expanded expression of the polynomial, computed only once."""
+        if self._expanded is None:
+            self._expanded = expand(self.poly)
+        return self._expanded
+
     def deg(self, var):
-        return _max_pow(self.poly, var)
+        if var not in self._degs:
+            self._degs[var] = _max_pow(self.expanded(), var)
+        return self._degs[var]
+
+    def _lead(self, var):
+        """Cached degree and leading coefficient with respect to var, or None."""
+        if var in self._degs and var in self._lcoeffs:
+            return self._degs[var], self._lcoeffs[var]
+        return None
+
+    def _set_lead(self, var, deg, lcoeff):
+        """Store degree and leading coefficient derived from other polynomials."""
+        self._degs[var] = deg
+        self._lcoeffs[var] = lcoeff
 
     def __pos__(self):
         return Poly(self.poly, *self.indets)
 
     def __neg__(self):
-        return Poly(-self.poly, *self.indets)
+        out = Poly(-self.poly, *self.indets)
+        for var in self._lcoeffs:
+            if var in self._degs:
+                out._set_lead(var, self._degs[var], -self._lcoeffs[var])
+        return out
 
+    @profiled("Poly.__mul__")
     def __mul__(self, other):
         if isinstance(other, Poly):
-            return Poly(
+            out = Poly(
                 expand(self.poly * other.poly),
                 *self.indets,
                 *set(other.indets).difference(set(self.indets)),
             )
+            # deg(a * b) = deg(a) + deg(b), unless the product of the leading
+            # coefficients vanishes.
+            for var in set(self._lcoeffs).intersection(other._lcoeffs):
+                first, second = self._lead(var), other._lead(var)
+                if first is None or second is None:
+                    continue
+                lcoeff = expand(first[1] * second[1])
+                if not _is_zero(lcoeff):
+                    out._set_lead(var, first[0] + second[0], lcoeff)
+            return out
         else:
             return Poly(expand(self.poly * sympify(other)), *self.indets)
 
@@ -213,11 +298,17 @@ class Poly(Expr):
 
     def __add__(self, other):
         if isinstance(other, Poly):
-            return Poly(
+            out = Poly(
                 expand(self.poly + other.poly),
                 *self.indets,
                 *set(other.indets).difference(set(self.indets)),
             )
+            # The leading term of the summand of higher degree is unaffected.
+            for var in set(self._lcoeffs).intersection(other._lcoeffs):
+                first, second = self._lead(var), other._lead(var)
+                if first is not None and second is not None and first[0] != second[0]:
+                    out._set_lead(var, *max(first, second, key=lambda val: val[0]))
+            return out
         else:
             return Poly(expand(self.poly + sympify(other)), *self.indets)
 
@@ -229,6 +320,23 @@ class Poly(Expr):
     def __rsub__(self, other):
         return other + (-self)
 
+    def __pow__(self, other):
+        """Power of polynomial for non negative integer exponents.
+
+        The power is computed by repeated squaring. Only the O(log(other))
+        intermediate products are expanded.
+        """
+        if not isinstance(other, int) or other < 0:
+            raise TypeError(
+                "unsupported operand type(s) for ** or pow(): "
+                + str(type(self))
+                + " and "
+                + str(type(other))
+            )
+        if other == 0:
+            return Poly(1, *self.indets)
+        return Poly(_binary_power(self.poly, other, expand), *self.indets)
+
     def __repr__(self):
         return f"Poly({repr(self.poly)},{repr(self.indets)})"
 
@@ -236,7 +344,7 @@ class Poly(Expr):
         return f"Poly({self.poly},{self.indets})"
 
     def __eq__(self, other):
-        return self.poly.expand() == other.poly.expand() and set(self.indets) == set(
+        return self.expanded() == other.expanded() and set(self.indets) == set(
             other.indets
         )
 
@@ -257,13 +365,43 @@ class Poly(Expr):
     def norm(self):
         return self * self.conjugate()
 
+    @profiled("Poly.norm_poly")
+    def norm_poly(self):
+        """Scalar parts of the norm polynomial `self * self.conjugate()`.
+
+        Returns
+        -------
+        scal : sympy.Poly
+            Real scalar part of the norm in the indeterminates of the polynomial.
+        eps : sympy.Poly
+            Epsilon scalar part of the norm, which vanishes for polynomials on
+            Study's quadric.
+
+        Notes
+        -----
+        All other coefficients of the norm vanish. Both parts are computed as
+        weighted sums of squares of the coefficient polynomials in the algebra
+        of the polynomial, without forming the full product.
+        """
+        coeffs = getattr(self.poly, "coeffs", None)
+        if coeffs is None:
+            coeffs = [self.poly] + [0] * 7
+        algebra = getattr(self.poly, "algebra", None) or current_algebra()
+        # The signature is converted along, as it may contain parameters.
+        polys, _ = parallel_poly_from_expr(
+            list(coeffs) + list(algebra.signature), *self.indets
+        )
+        return _quadrance_parts(polys[:8], polys[8:])
+
     def coeff(self, var, power=1, right=False, _first=True):
         """Coefficient of polynomial with respect to `var**(power)`."""
-        return expand(self.poly).coeff(var, power, right, _first)
+        return self.expanded().coeff(var, power, right, _first)
 
     def lcoeff(self, var):
         """Leading coefficient of polynomial with respect to `var`."""
-        return expand(self.poly).coeff(var, _max_pow(self.poly, var))
+        if var not in self._lcoeffs:
+            self._lcoeffs[var] = self.expanded().coeff(var, self.deg(var))
+        return self._lcoeffs[var]
 
     def all_indet_coeffs(self, indet):
         """Compute all coefficients with respect to var.
@@ -278,12 +416,18 @@ class Poly(Expr):
         list of BiQuaternions
             List of coefficients for powers of indet in ascending order.
         """
-        return _all_indet_coeffs(self.poly, indet)
+        if indet not in self._indet_coeffs:
+            coeffs = _all_indet_coeffs(self.poly, indet)
+            self._indet_coeffs[indet] = coeffs
+            self._degs.setdefault(indet, len(coeffs) - 1)
+        return list(self._indet_coeffs[indet])
 
     def all_coeffs(self):
         """Compute all coefficients in ascending order of all variables
         in given order as nested list."""
-        return _all_coeffs(self.poly, self.indets)
+        if self._coeff_cache is None:
+            self._coeff_cache = _all_coeffs(self.poly, self.indets)
+        return _copy_coeffs(self._coeff_cache)
 
     def eval(self, vals, right=True):
         """Evaluate polynomial for variables set as in val.
@@ -298,20 +442,66 @@ class Poly(Expr):
 
         Returns
         -------
-        type(val)
+        type(val), numpy.ndarray
+            If any of the values is a numpy.ndarray, the polynomial is evaluated
+            at all (broadcast) values at once and the coefficients of the results
+            are returned as array of shape `(..., 8)`.
+
+        Notes
+        -----
+        The polynomial is evaluated by Horner's scheme. The coefficients are
+        computed only once per polynomial.
         """
         if not isinstance(vals, list):
             if isinstance(vals, tuple):
                 vals = list(vals)
             else:
                 vals = [vals]
-        return _eval_poly(self.all_coeffs(), vals, right)
+        if any(isinstance(val, ndarray) for val in vals):
+            return self._eval_array(vals)
+        if self._coeff_cache is None:
+            self._coeff_cache = _all_coeffs(self.poly, self.indets)
+        return _eval_poly(self._coeff_cache, vals, right)
+
+    def _eval_array(self, vals):
+        """Evaluate numeric polynomial at arrays of real values."""
+        vals = np.broadcast_arrays(*vals)
+        if self._numeric_cache is None:
+            self._numeric_cache = _numeric_coeffs(self.all_coeffs())
+        out = _eval_poly_array(self._numeric_cache, vals)
+        shape = vals[0].shape + (8,)
+        if np.shape(out) != shape:
+            out = np.broadcast_to(out, shape).copy()
+        return out
 
     def terms(self):
-        return _terms(self)
+        if self._term_cache is None:
+            self._term_cache = _terms(self)
+        return list(self._term_cache)
+
+    def lambdify(self, args=None):
+        """Compile the polynomial into a vectorized NumPy function.
+
+        Parameters
+        ----------
+        args : list of sympy.Symbol, optional
+            Arguments of the resulting function in this order.
+            (Default `self.indets` followed by all other free symbols of the
+            coefficients sorted by name.)
+
+        Returns
+        -------
+        function
+            Function returning the BiQuaternion coefficients of the polynomial
+            as array of shape `(..., 8)`. See `lambdify_bq` for details.
+        """
+        from .compiled import lambdify_bq
 
+        return lambdify_bq(self, args)
 
-def poly_div(poly_1, poly_2, var, right=True):
+
+@profiled("poly_div")
+def poly_div(poly_1, poly_2, var, right=True, fraction_free=False):
     """Polynomial division with remainder of poly_1 and poly_2 with respect to var.
 
     Parameters
@@ -324,6 +514,11 @@ def poly_div(poly_1, poly_2, var, right=True):
         Variable with respect to which to divide.
     right : (optional, default = True) bool
         Should right division be used.
+    fraction_free : (optional, default = False) bool
+        Divide with `DensePoly.pseudo_div`, which keeps the intermediate
+        coefficients free of fractions and reduces their growth, and divide by
+        the accumulated scale only once at the end. Only supported for
+        polynomials in `var` alone.
 
     Returns
     -------
@@ -332,12 +527,39 @@ def poly_div(poly_1, poly_2, var, right=True):
     remainder : Poly
         Remainder of division
 
+    Raises
+    ------
+    ValueError
+        If `fraction_free` is set and the polynomials contain indeterminates
+        other than `var`.
+
     Notes
     -----
     This function produces polynomials `quotient` and `remainder` such that
     poly_1 = poly_2 * quotient + remainder for `right = True`
     poly_1 = quotient * poly_2 + remainder for `right = False`
+
+    Univariate polynomials in `var` are divided on their coefficient lists with
+    `DensePoly.div`, which requires the leading coefficient of `poly_2` to be
+    invertible.
     """
+    univariate = set(poly_1.indets) | set(poly_2.indets) == {var}
+    if fraction_free and not univariate:
+        raise ValueError("Fraction-free division requires polynomials in var only.")
+    if univariate:
+        from .dense_poly import DensePoly
+
+        dividend = DensePoly.from_poly(poly_1, var)
+        divisor = DensePoly.from_poly(poly_2, var)
+        if fraction_free:
+            scale, quotient, remainder = dividend.pseudo_div(divisor, right)
+            # The scale is central, so it can be divided out from either side.
+            inv = scale.inv()
+            quotient, remainder = quotient * inv, remainder * inv
+        else:
+            quotient, remainder = dividend.div(divisor, right)
+        return quotient.to_poly(), remainder.to_poly()
+
     init_lead_coeff = poly_2.lcoeff(var)
 
     if right:
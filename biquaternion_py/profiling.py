@@ -0,0 +1,141 @@
+"""Count and time internal operations.
+
+Selected internal operations, such as the construction and multiplication of
+BiQuaternions, the expansion of polynomials or the sympy gcd computations, are
+instrumented with `profiled`. While profiling is enabled, the number of calls
+and their total duration are recorded per operation. While it is disabled, the
+instrumentation only costs one check of a global flag per call.
+
+Functions:
+
+    profile
+    enable
+    disable
+    reset
+    get_stats
+    summary
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+_ENABLED = False
+# Maps names of operations to lists [count, total time].
+_STATS = {}
+
+
+def profiled(name):
+    """Decorator recording calls of the decorated function under `name`.
+
+    The recorded time includes the time of all nested calls, so timings of
+    operations calling each other overlap.
+    """
+
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                entry = _STATS.get(name)
+                if entry is None:
+                    entry = _STATS[name] = [0, 0.0]
+                entry[0] += 1
+                entry[1] += perf_counter() - start
+
+        return wrapper
+
+    return decorate
+
+
+def enable():
+    """Start recording instrumented operations."""
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable():
+    """Stop recording instrumented operations."""
+    global _ENABLED
+    _ENABLED = False
+
+
+def reset():
+    """Remove all recorded statistics."""
+    _STATS.clear()
+
+
+def get_stats():
+    """Recorded statistics.
+
+    Returns
+    -------
+    dict
+        Maps the names of the operations to dictionaries with the number of
+        calls `count` and their total duration `time` in seconds.
+    """
+    return {
+        name: {"count": count, "time": total} for name, (count, total) in _STATS.items()
+    }
+
+
+def summary(stats=None):
+    """Table of statistics sorted by total time.
+
+    Parameters
+    ----------
+    stats : dict, optional
+        Statistics as returned by `get_stats`.
+        (Default None uses the currently recorded statistics.)
+
+    Returns
+    -------
+    str
+    """
+    if stats is None:
+        stats = get_stats()
+    lines = [f"{'operation':32s} {'calls':>10s} {'total [s]':>12s} {'per call':>12s}"]
+    for name, entry in sorted(stats.items(), key=lambda item: -item[1]["time"]):
+        count, total = entry["count"], entry["time"]
+        lines.append(
+            f"{name:32s} {count:10d} {total:12.6f} {total / max(count, 1):12.3e}"
+        )
+    return "\n".join(lines)
+
+
+@contextmanager
+def profile():
+    """Record instrumented operations within a with block.
+
+    Yields
+    ------
+    dict
+        Dictionary, which is filled with the statistics of the operations called
+        within the block (see `get_stats`) when the block is left.
+
+    Examples
+    --------
+    >>> with profile() as stats:
+    ...     factorize_bq_poly(poly)
+    >>> print(summary(stats))
+    """
+    global _ENABLED
+    was_enabled = _ENABLED
+    before = get_stats()
+    out = {}
+    _ENABLED = True
+    try:
+        yield out
+    finally:
+        _ENABLED = was_enabled
+        for name, entry in get_stats().items():
+            old = before.get(name, {"count": 0, "time": 0.0})
+            if entry["count"] > old["count"]:
+                out[name] = {
+                    "count": entry["count"] - old["count"],
+                    "time": entry["time"] - old["time"],
+                }
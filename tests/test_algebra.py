@@ -0,0 +1,59 @@
+import biquaternion_py as bq
+import numpy.testing as nt
+import sympy as sy
+from concurrent.futures import ThreadPoolExecutor
+
+split = bq.Algebra(1, -1, 0)
+elliptic = bq.Algebra(-1, -1, -1)
+
+
+def test_table():
+    assert len(bq.Algebra().table) == 48
+    assert len(elliptic.table) == 64
+    assert bq.Algebra(0, 0, 0).signature == (0, 0, 0)
+
+
+def test_bound_units():
+    assert split.II * split.II == 1
+    assert split.JJ * split.JJ == -1
+    assert split.II * split.JJ == split.KK
+    assert elliptic.EE * elliptic.EE == -1
+    assert (split.II * bq.JJ).algebra == split
+
+
+def test_binding_is_preserved():
+    t = sy.Symbol("t")
+    x = split.BiQuaternion([1 + t, t**2, 0, 3])
+    assert sy.expand(x).algebra == split
+    assert (-x).algebra == split
+    assert x.conjugate().algebra == split
+    assert (x + 1).algebra == split
+
+
+def test_different_algebras():
+    with nt.assert_raises(ValueError):
+        split.II * elliptic.II
+
+
+def test_use_algebra():
+    assert bq.current_algebra() == bq.Algebra()
+    with bq.use_algebra(split) as algebra:
+        assert algebra is split
+        assert bq.II * bq.II == 1
+        assert bq.NumBiQuaternion(0, 1) * bq.NumBiQuaternion(0, 1) == 1
+        nt.assert_array_equal(
+            (bq.BiQuaternionArray([0, 1, 0, 0, 0, 0, 0, 0]) * bq.II).data,
+            [1, 0, 0, 0, 0, 0, 0, 0],
+        )
+    assert bq.II * bq.II == -1
+
+
+def test_threads():
+    def square(algebra):
+        with bq.use_algebra(algebra):
+            return [(bq.EE * bq.EE).scal for _ in range(20)]
+
+    with ThreadPoolExecutor(2) as pool:
+        elliptic_res, dual_res = pool.map(square, [elliptic, bq.Algebra()])
+    assert set(elliptic_res) == {-1}
+    assert set(dual_res) == {0}
@@ -197,3 +197,45 @@ def test_elementwise():
     b = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
     b = b.apply_elementwise(lambda x: x**2)
     assert b == bq.BiQuaternion([1, 4, 9, 16, 25, 36, 49, 64])
+
+
+def test_mask():
+    b = bq.BiQuaternion([1, 0, 3, 0, 0, x1, 0, 0])
+    assert b.mask == 0b00100101
+    b.k = 4
+    assert b.mask == 0b00101101
+    assert b.conjugate().mask == b.mask
+    assert bq.point_to_quat([0, 0, x1]).mask == 0b10000001
+
+
+def test_sparse_multiplication():
+    point = bq.point_to_quat([y1, y2, y3])
+    line = bq.pluecker_to_quat([y1, y2, y3, y4, y5, y6])
+    for sparse in [point, line, bq.BiQuaternion([x1, x2]), bq.EE]:
+        dense = bq.BiQuaternion([val + y8 - y8 for val in sparse.coeffs])
+        dense._mask = 0b11111111
+        assert (x * sparse).expand() == (x * dense).expand()
+        assert (sparse * x).expand() == (dense * x).expand()
+    assert (bq.II * bq.JJ).mask == 0b00001000
+
+
+def test_binary_powers():
+    b = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    assert b**0 == 1
+    assert b**13 == b**6 * b**7
+    assert b**-5 == (b.inv()) ** 5
+
+
+def test_closed_form_quadrance():
+    algebra = bq.Algebra(y1, y2, y3)
+    z = algebra.BiQuaternion(x.coeffs)
+    assert z.quadrance().expand() == (z * z.conjugate()).expand()
+    w = algebra.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    assert (w * w.inv()).apply_elementwise(sy.cancel) == 1
+
+
+def test_inverse_elliptic():
+    algebra = bq.Algebra(-1, -1, -1)
+    z = algebra.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    assert z * z.inv() == 1
+    assert z.inv() * z == 1
@@ -1,4 +1,5 @@
 import biquaternion_py as bq
+import numpy as np
 import numpy.testing as nt
 
 
@@ -25,3 +26,38 @@ def test_quat_to_hom_point():
     assert bq.quat_to_hom_point(bq.hom_point_to_quat(a)) == a
     with nt.assert_raises(ValueError):
         bq.quat_to_hom_point(bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8]))
+
+
+def test_act_on_points():
+    quat = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    quat = bq.fiber_project(quat)
+    points = np.array([[1, 2, 3], [0, 0, 0], [-4, 0.5, 2]])
+    coords, valid = bq.act_on_points(quat, points)
+    expected = [
+        [
+            float(val)
+            for val in bq.quat_to_point(bq.act_on_point(quat, bq.point_to_quat(p)))
+        ]
+        for p in points.tolist()
+    ]
+    assert valid.all()
+    nt.assert_allclose(coords, expected)
+
+    hom, valid = bq.act_on_points(quat, np.hstack([2 * np.ones((3, 1)), 2 * points]))
+    assert valid.all()
+    nt.assert_allclose(hom[:, 1:] / hom[:, :1], expected)
+
+
+def test_act_on_points_invalid():
+    coords, valid = bq.act_on_points(
+        bq.BiQuaternion([0, 0, 0, 0, 5, 6, 7, 8]), [[1, 2, 3]]
+    )
+    assert not valid[0]
+    assert np.isnan(coords).all()
+
+
+def test_act_on_points_broadcasting():
+    poses = bq.BiQuaternionArray([[1, 0, 0, 0, 0, 1, 0, 0], [0, 0, 0, 1, 0, 0, 0, 0]])
+    coords, valid = bq.act_on_points(poses[:, None], np.eye(3))
+    assert coords.shape == (2, 3, 3)
+    nt.assert_allclose(coords[1], [[-1, 0, 0], [0, -1, 0], [0, 0, 1]])
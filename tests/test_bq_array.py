@@ -0,0 +1,116 @@
+import biquaternion_py as bq
+import numpy as np
+import numpy.testing as nt
+import pytest
+import sympy as sy
+
+rng = np.random.default_rng(1)
+data_x = rng.integers(-5, 5, (4, 8))
+data_y = rng.integers(-5, 5, (4, 8))
+x = bq.BiQuaternionArray(data_x)
+y = bq.BiQuaternionArray(data_y)
+
+
+def _as_floats(quats):
+    return np.array([[float(c) for c in q.coeffs] for q in quats])
+
+
+def test_conversion():
+    quats = x.to_biquaternions()
+    assert quats[1] == bq.BiQuaternion(*data_x[1])
+    nt.assert_array_equal(bq.BiQuaternionArray.from_biquaternions(quats).data, data_x)
+
+
+def test_multiplication():
+    expected = [a * b for a, b in zip(x.to_biquaternions(), y.to_biquaternions())]
+    nt.assert_array_equal((x * y).data, _as_floats(expected))
+
+
+def test_mixed_multiplication():
+    b = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    nt.assert_array_equal(
+        (b * x).data, _as_floats([b * a for a in x.to_biquaternions()])
+    )
+    nt.assert_array_equal(
+        (x * b).data, _as_floats([a * b for a in x.to_biquaternions()])
+    )
+    nt.assert_array_equal((2 * x).data, 2 * data_x)
+
+
+def test_broadcasting():
+    grid = bq.BiQuaternionArray(data_x[:, None, :]) * y
+    assert grid.shape == (4, 4)
+    nt.assert_array_equal(grid[2, 3].data, (x[2] * y[3]).data)
+
+
+def test_indexing():
+    grid = bq.BiQuaternionArray(data_x[:, None, :]) * y
+    nt.assert_array_equal(grid[..., 0].data, grid.data[:, 0])
+    nt.assert_array_equal(grid[1, ...].data, grid.data[1])
+    nt.assert_array_equal(grid[:, 1:].data, grid.data[:, 1:])
+    assert [val.shape for val in x] == [()] * 4
+    with pytest.raises(TypeError):
+        iter(x[0])
+    with pytest.raises(TypeError):
+        len(x[0])
+
+
+def test_addition():
+    nt.assert_array_equal((x + y).data, data_x + data_y)
+    nt.assert_array_equal((x - y).data, data_x - data_y)
+    nt.assert_array_equal((x + 1).data[:, 0], data_x[:, 0] + 1)
+    nt.assert_array_equal((1 - x).data[:, 1:], -data_x[:, 1:])
+
+
+def test_conjugation():
+    nt.assert_array_equal(
+        x.conjugate().data, _as_floats([~a for a in x.to_biquaternions()])
+    )
+    nt.assert_array_equal(
+        x.eps_conjugate().data,
+        _as_floats([a.eps_conjugate() for a in x.to_biquaternions()]),
+    )
+
+
+def test_inverse():
+    z = bq.BiQuaternionArray(data_x + np.array([10, 0, 0, 0, 0, 0, 0, 0]))
+    one = np.zeros((4, 8))
+    one[:, 0] = 1
+    nt.assert_allclose((z * z.inv()).data, one, atol=1e-12)
+    nt.assert_allclose((z / z).data, one, atol=1e-12)
+    with nt.assert_raises(ValueError):
+        bq.BiQuaternionArray([0, 0, 0, 0, 1, 2, 3, 4]).inv()
+
+
+def test_parts():
+    nt.assert_array_equal(x.primal().data[:, :4], data_x[:, :4])
+    nt.assert_array_equal(x.primal().data[:, 4:], 0)
+    nt.assert_array_equal(x.dual().data[:, :4], data_x[:, 4:])
+
+
+def test_define_algebra():
+    bq.define_algebra(1, -1, 1)
+    expected = [a * b for a, b in zip(x.to_biquaternions(), y.to_biquaternions())]
+    nt.assert_array_equal((x * y).data, _as_floats(expected))
+    bq.define_algebra(sy.Symbol("a"))
+    with nt.assert_raises(TypeError):
+        x * y
+    bq.define_algebra()
+
+
+def test_closed_form_quadrance():
+    algebra = bq.Algebra(1, -1, 2)
+    z = bq.BiQuaternionArray(data_x, algebra)
+    nt.assert_array_equal(z.quadrance().data, (z * z.conjugate()).data)
+    nt.assert_allclose((z.inv() * z).data[:, 0], 1)
+    nt.assert_allclose((z.inv() * z).data[:, 1:], 0, atol=1e-12)
+
+
+def test_structure_tensor_product():
+    from biquaternion_py.bq_array import _bq_mul
+
+    first = rng.normal(size=(3, 1, 8))
+    second = rng.normal(size=(5, 8))
+    tensor = bq.current_algebra().structure_tensor().reshape(8, 8, 8)
+    expected = np.einsum("...i,...j,ijk->...k", first, second, tensor)
+    nt.assert_allclose(_bq_mul(first, second), expected)
@@ -0,0 +1,44 @@
+import biquaternion_py as bq
+import numpy as np
+import numpy.testing as nt
+import pytest
+import sympy as sy
+
+t, phi = sy.symbols("t phi")
+
+
+def test_lambdify_poly():
+    poly = bq.Poly(
+        t**2 * bq.II + t * bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8]) - 3, t
+    )
+    func = poly.lambdify()
+    vals = np.linspace(-1, 1, 11)
+    out = func(vals)
+    assert out.shape == (11, 8)
+    for val, row in zip(vals, out):
+        nt.assert_allclose(row, [float(c) for c in poly.eval(val).coeffs])
+
+
+def test_lambdify_biquaternion():
+    quat = bq.BiQuaternion([sy.cos(phi), sy.sin(phi), 0, 0, t, 0, t * sy.cos(phi), 0])
+    func = quat.lambdify([phi, t])
+    out = func(np.array([0, np.pi / 2]), 2.0)
+    nt.assert_allclose(
+        out, [[1, 0, 0, 0, 2, 0, 2, 0], [0, 1, 0, 0, 2, 0, 0, 0]], atol=1e-15
+    )
+    assert func(0.0, 1.0).shape == (8,)
+
+
+def test_lambdify_cache():
+    bq.clear_lambdify_cache()
+    quat = bq.BiQuaternion([t, 1, 0, 0, 0, 0, 0, 0])
+    assert bq.lambdify_bq(quat) is bq.BiQuaternion([t, 1]).lambdify()
+    assert bq.lambdify_bq(quat) is not bq.lambdify_bq(quat, [t, phi])
+
+
+def test_lambdify_coefficient_symbols():
+    poly = bq.Poly(t * phi * bq.II + bq.JJ, t)
+    func = poly.lambdify()
+    nt.assert_allclose(func(2.0, 3.0), [0, 6, 1, 0, 0, 0, 0, 0])
+    with pytest.raises(ValueError):
+        poly.lambdify([t])
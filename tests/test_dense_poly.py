@@ -0,0 +1,80 @@
+import biquaternion_py as bq
+from biquaternion_py import DensePoly, Poly
+import numpy as np
+import sympy as sy
+
+t = sy.Symbol("t")
+a = sy.symbols("a:8")
+quat_1 = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+quat_2 = bq.BiQuaternion(a)
+
+
+def test_conversion():
+    poly = Poly(t**3 * quat_1 + t * quat_2 - 2, t)
+    dense = DensePoly.from_poly(poly)
+    assert dense.deg() == 3
+    assert dense.lcoeff() == quat_1
+    assert dense.coeff(2) == 0
+    assert dense.to_poly() == poly
+
+
+def test_arithmetic():
+    first = Poly(t**2 + t * quat_1 + quat_2, t)
+    second = Poly(t * quat_2 - quat_1, t)
+    dense_1 = DensePoly.from_poly(first)
+    dense_2 = DensePoly.from_poly(second)
+    assert (dense_1 * dense_2).to_poly() == first * second
+    assert (dense_2 * dense_1).to_poly() == second * first
+    assert (dense_1 - dense_2).to_poly() == first - second
+    assert (dense_2**3).to_poly() == second * second * second
+    assert (dense_1 + dense_1.conjugate() - DensePoly([0, 0, 2], t)).deg() == 1
+
+
+def test_leading_cancellation():
+    dense = DensePoly([quat_1, 1], t) - DensePoly([0, 1], t)
+    assert dense.deg() == 0
+    assert DensePoly([], t).deg() == 0
+
+
+def test_eval():
+    poly = Poly(t**2 * quat_1 + t * bq.II - 3, t)
+    dense = DensePoly.from_poly(poly)
+    assert dense.eval(bq.JJ) == poly.eval(bq.JJ)
+    assert dense.eval(bq.JJ, False) == poly.eval(bq.JJ, False)
+    vals = np.linspace(0, 1, 5)
+    np.testing.assert_allclose(dense.eval(vals), poly.eval(vals))
+
+
+def test_div():
+    first = DensePoly([quat_2, 0, bq.II, quat_1], t)
+    second = DensePoly([-quat_1, 1], t)
+    quot, rem = first.div(second)
+    assert rem.deg() == 0
+    assert (second * quot + rem).to_poly() == first.to_poly()
+    quot, rem = first.div(second, False)
+    assert (quot * second + rem).to_poly() == first.to_poly()
+
+
+def test_pseudo_div():
+    quat_3 = bq.BiQuaternion([2, -1, 0, 3, 1, 0, 0, 2])
+    first = DensePoly([quat_3, 0, bq.II * sy.Rational(1, 3), quat_1, sy.S.Half], t)
+    second = DensePoly([quat_3, quat_1 * sy.Rational(-1, 5), quat_3 + 1], t)
+    for right in (True, False):
+        scale, quot, rem = first.pseudo_div(second, right)
+        assert scale.mask & 0b11101110 == 0
+        assert rem.deg() < 2
+        assert all(
+            val.is_Integer for coeff in quot.coeffs + rem.coeffs for val in coeff.coeffs
+        )
+        product = second * quot if right else quot * second
+        assert (product + rem).to_poly() == (first * scale).to_poly()
+        assert bq.poly_div(first.to_poly(), second.to_poly(), t, right, True) == (
+            bq.poly_div(first.to_poly(), second.to_poly(), t, right)
+        )
+
+    poly = DensePoly([quat_1 * sy.Rational(2, 3), 4 * quat_3], t)
+    content, primitive = poly.primitive()
+    assert content == sy.Rational(2, 3)
+    assert primitive * content == poly
+    assert (second * first).exquo(second) == first
+    assert (first * second).exquo(second, False) == first
@@ -0,0 +1,65 @@
+import sympy as sy
+from sympy import QQ, ZZ
+from biquaternion_py import (
+    BiQuaternion,
+    DomainBiQuaternion,
+    DensePoly,
+    Poly,
+    Algebra,
+    rand_bq,
+    rand_line,
+    rand_rational,
+)
+
+t = sy.Symbol("t")
+
+
+def test_arithmetic():
+    first = rand_rational() + rand_line()
+    second = rand_bq()
+    dfirst, dsecond = DomainBiQuaternion(first), DomainBiQuaternion(second)
+    assert dfirst.domain in (ZZ, QQ)
+    assert (dfirst * dsecond).to_biquaternion() == first * second
+    assert (dfirst - dsecond).to_biquaternion() == first - second
+    assert (dfirst**3).to_biquaternion() == (first**3).apply_elementwise(sy.expand)
+    assert dfirst.quadrance().to_biquaternion() == first.quadrance()
+    assert (dfirst * dfirst.inv()) == 1
+    assert BiQuaternion(dfirst) == first
+    assert 2 * dfirst == dfirst + dfirst
+
+
+def test_domains():
+    quat = DomainBiQuaternion(2, 3)
+    assert quat.domain == ZZ
+    assert quat.inv().domain == QQ
+    assert quat.inv() == BiQuaternion(2, 3).inv()
+
+    root = DomainBiQuaternion(sy.sqrt(2), 1)
+    assert (root * root).to_biquaternion() == BiQuaternion(1, 2 * sy.sqrt(2))
+    assert (
+        root + DomainBiQuaternion(sy.Rational(1, 2))
+    ).scal == root.domain.from_sympy(sy.sqrt(2) + sy.Rational(1, 2))
+
+    dual = DomainBiQuaternion(1, 2, 0, 0, 3, algebra=Algebra(-1, -1, 1))
+    assert (dual * dual).to_biquaternion() == (
+        dual.to_biquaternion() * dual.to_biquaternion()
+    )
+
+
+def test_polynomial_coefficients():
+    poly = Poly(t - rand_bq(), t) * Poly(t - rand_bq(), t)
+    quat = DomainBiQuaternion.from_biquaternion(poly)
+    assert quat.domain in (ZZ[t], QQ[t])
+    assert quat.norm().to_poly() == poly.norm()
+
+
+def test_dense_poly():
+    polys = [DensePoly.from_poly(Poly(t - rand_bq(), t)) for _ in range(3)]
+    product = polys[0] * polys[1] * polys[2]
+    domain_polys = [poly.to_domain() for poly in polys]
+    domain_product = domain_polys[0] * domain_polys[1] * domain_polys[2]
+    assert domain_product.to_poly() == product.to_poly()
+    assert (domain_polys[0] ** 2).to_poly() == (polys[0] ** 2).to_poly()
+    quot, rem = domain_product.div(domain_polys[0])
+    assert rem.deg() == 0 and rem.lcoeff().mask == 0
+    assert (domain_polys[0] * quot).to_poly() == product.to_poly()
@@ -1,4 +1,5 @@
 import biquaternion_py as bq
+import numpy as np
 import numpy.testing as nt
 
 
@@ -15,3 +16,42 @@ def test_quat_to_pluecker():
 
     with nt.assert_raises(ValueError):
         bq.quat_to_pluecker(fail_quat)
+
+
+def test_line_to_pluecker():
+    assert bq.line_to_pluecker([1, 0, 0], [0, 1, 0]) == [1, 0, 0, 0, 0, -1]
+
+
+def test_batched_conversion():
+    directions = np.array([[1, 0, 0], [0, 2, 1], [1, 1, 1]])
+    points = np.array([[0, 1, 0], [3, 0, 0], [1, -2, 5]])
+    coords = bq.lines_to_pluecker(directions, points)
+    expected = [bq.line_to_pluecker(d, p) for d, p in zip(directions, points)]
+    nt.assert_array_equal(coords, expected)
+    assert bq.on_klein_quadric(coords).all()
+
+    quats = bq.pluecker_to_quat_array(coords)
+    assert quats.to_biquaternions()[1] == bq.pluecker_to_quat(coords[1])
+    back, valid = bq.quat_array_to_pluecker(quats)
+    assert valid.all()
+    nt.assert_array_equal(back, coords)
+
+    _, valid = bq.quat_array_to_pluecker([[0, 1, 2, 3, 5, 4, 5, 6], [0, 1, 0, 0] * 2])
+    assert not valid.any()
+
+
+def test_act_on_lines():
+    quat = bq.fiber_project(bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8]))
+    coords = bq.lines_to_pluecker([[1, 0, 0], [0, 2, 1]], [[0, 1, 0], [3, 0, 0]])
+    image, valid = bq.act_on_lines(quat, coords)
+    expected = [
+        [
+            float(val)
+            for val in bq.quat_to_pluecker(
+                bq.act_on_line(quat, bq.pluecker_to_quat(c.tolist()))
+            )
+        ]
+        for c in coords
+    ]
+    assert valid.all()
+    nt.assert_allclose(image, expected)
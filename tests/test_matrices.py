@@ -0,0 +1,42 @@
+import biquaternion_py as bq
+import numpy as np
+import numpy.testing as nt
+
+quat = bq.fiber_project(bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8]))
+
+
+def test_homogeneous_matrix():
+    matrix = bq.to_homogeneous_matrix(quat)
+    point = [1, -2, 0.5]
+    image = bq.quat_to_point(bq.act_on_point(quat, bq.point_to_quat(point)))
+    hom = matrix @ np.array([1, *point])
+    nt.assert_allclose(hom[1:] / hom[0], [float(val) for val in image])
+    nt.assert_allclose(matrix[0, 1:], [0, 0, 0])
+
+
+def test_rotation_matrix():
+    rot = bq.to_rotation_matrix(quat)
+    nt.assert_allclose(rot @ rot.T, np.eye(3), atol=1e-12)
+    nt.assert_allclose(np.linalg.det(rot), 1)
+
+
+def test_cache():
+    num = bq.NumBiQuaternion(quat)
+    assert bq.to_homogeneous_matrix(num) is bq.to_homogeneous_matrix(num)
+    sym = bq.BiQuaternion([1, 0, 0, 0, 0, 0, 0, 1])
+    first = bq.to_homogeneous_matrix(sym)
+    assert bq.to_homogeneous_matrix(sym) is first
+    sym.ek = 2
+    nt.assert_allclose(bq.to_homogeneous_matrix(sym)[3, 0], 2 * first[3, 0])
+
+
+def test_from_homogeneous_matrix():
+    poses = bq.BiQuaternionArray(
+        [quat.coeffs, [0, 0, 0, 1, 0, 1, 2, 0], [0.5, 0.5, -0.5, 0.5, 0, 0, 0, 0]]
+    )
+    poses = poses * bq.BiQuaternionArray([1, 0, 0, 0, 0, 1, 2, 3])
+    matrices = bq.to_homogeneous_matrix(poses)
+    assert matrices.shape == (3, 4, 4)
+    recovered = bq.from_homogeneous_matrix(3 * matrices)
+    normalized = matrices / matrices[:, :1, :1]
+    nt.assert_allclose(bq.to_homogeneous_matrix(recovered), normalized, atol=1e-12)
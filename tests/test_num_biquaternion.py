@@ -0,0 +1,72 @@
+import biquaternion_py as bq
+import numpy.testing as nt
+import sympy as sy
+
+a = bq.NumBiQuaternion(1, 2, 3, 4, 5, 6, 7, 8)
+b = bq.NumBiQuaternion([3, -1, 2, 0.5, -2, 1, 0, 4])
+sym_a = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+sym_b = bq.BiQuaternion([3, -1, 2, sy.Rational(1, 2), -2, 1, 0, 4])
+
+
+def test_conversion():
+    assert bq.NumBiQuaternion.from_biquaternion(sym_a) == a
+    assert a.to_biquaternion() == sym_a
+    assert bq.BiQuaternion(a) == sym_a
+    assert isinstance(a.scal, float)
+
+
+def test_multiplication():
+    assert a * b == sym_a * sym_b
+    assert b * a == sym_b * sym_a
+    assert isinstance(a * b, bq.NumBiQuaternion)
+    assert isinstance(a * sym_b, bq.BiQuaternion)
+    assert 2 * a == a * 2 == bq.NumBiQuaternion([2, 4, 6, 8, 10, 12, 14, 16])
+
+
+def test_addition():
+    assert a + b == sym_a + sym_b
+    assert a - b == sym_a - sym_b
+    assert 1 + a == a + 1 == bq.NumBiQuaternion([2, 2, 3, 4, 5, 6, 7, 8])
+
+
+def test_quadrance_and_inverse():
+    assert a.quadrance() == sym_a.quadrance()
+    nt.assert_allclose((b * b.inv()).coeffs, [1, 0, 0, 0, 0, 0, 0, 0], atol=1e-12)
+    nt.assert_allclose((b / b).coeffs, [1, 0, 0, 0, 0, 0, 0, 0], atol=1e-12)
+    with nt.assert_raises(ValueError):
+        bq.NumBiQuaternion([0, 0, 0, 0, 1, 2, 3, 4]).inv()
+
+
+def test_powers():
+    assert b**3 == b * b * b
+    nt.assert_allclose((b**-2 * b * b).coeffs, [1, 0, 0, 0, 0, 0, 0, 0], atol=1e-12)
+
+
+def test_parts():
+    assert a.primal() == bq.NumBiQuaternion([1, 2, 3, 4])
+    assert a.dual() == bq.NumBiQuaternion([5, 6, 7, 8])
+    assert a.conjugate() == sym_a.conjugate()
+    assert a.eps_conjugate() == sym_a.eps_conjugate()
+
+
+def test_act_on_point():
+    rot = bq.NumBiQuaternion([0, 0, 0, 1, 0, 0, 0, 0])
+    point = bq.NumBiQuaternion(bq.point_to_quat([1, 2, 3]))
+    image = bq.act_on_point(rot, point)
+    assert isinstance(image, bq.NumBiQuaternion)
+    assert bq.quat_to_point(image) == [-1, -2, 3]
+    assert bq.smart_act(rot, [1, 2, 3]) == [-1, -2, 3]
+
+
+def test_non_numeric_args():
+    with nt.assert_raises(TypeError):
+        bq.NumBiQuaternion([sy.Symbol("x")])
+    with nt.assert_raises(ValueError):
+        bq.NumBiQuaternion([1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+
+def test_sparse_multiplication():
+    point = bq.NumBiQuaternion([1, 0, 0, 0, 0, 1, 2, 3])
+    assert point.mask == 0b11100001
+    assert a * point == sym_a * point.to_biquaternion()
+    assert point * b == point.to_biquaternion() * sym_b
@@ -0,0 +1,25 @@
+import subprocess
+import sys
+import biquaternion_py as bq
+import biquaternion_py.numeric as bqn
+
+
+def test_numeric_without_sympy():
+    code = (
+        "import sys\n"
+        "import biquaternion_py.numeric as bqn\n"
+        "quat = bqn.NumBiQuaternion(1, 2, 3, 4)\n"
+        "quat * quat.inv() * 2.0\n"
+        "bqn.act_on_points(quat, [[1.0, 2.0, 3.0]])\n"
+        "assert 'sympy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes():
+    assert bqn.NumBiQuaternion is bq.NumBiQuaternion
+    assert "Poly" in dir(bq)
+    bq.define_algebra(-1, -1, 1)
+    assert bq.EE * bq.EE == 1
+    bq.define_algebra()
+    assert bq.EE * bq.EE == 0
@@ -1,5 +1,7 @@
 import biquaternion_py as bq
+import numpy as np
 import sympy as sy
+from concurrent.futures import ThreadPoolExecutor
 
 
 def test_factorization():
@@ -22,3 +24,196 @@ def test_factorization():
 
     print(poly == poly1 == poly2)
     assert poly == poly1 == poly2
+
+
+def test_numeric_factorization():
+    t = sy.symbols("t")
+    h1 = bq.rand_rational() + bq.rand_line()
+    h2 = bq.rand_rational() + bq.rand_line()
+    h3 = bq.rand_rational() + bq.rand_line()
+    poly = bq.Poly(2 * bq.II * (t - h1) * (t - h2) * (t - h3), t)
+
+    lead, roots, residual = bq.factorize_bq_poly_numeric(poly)
+    assert roots.shape == (3,)
+    assert residual < 1e-10
+    np.testing.assert_allclose(lead.data, [0, 2, 0, 0, 0, 0, 0, 0])
+    vals = np.linspace(-2, 2, 5)
+    product = lead
+    for root in roots:
+        product = product * (
+            bq.BiQuaternionArray(vals[:, None] * [1, 0, 0, 0, 0, 0, 0, 0]) - root
+        )
+    np.testing.assert_allclose(
+        product.data, poly.eval(vals), atol=1e-8 * np.abs(poly.eval(vals)).max()
+    )
+
+
+def test_numeric_factorization_batch():
+    t = sy.symbols("t")
+    polys = []
+    for _ in range(4):
+        h1 = bq.rand_rational() + bq.rand_line()
+        h2 = bq.rand_rational() + bq.rand_line()
+        coeffs = bq.Poly((t - h1) * (t - h2), t).all_indet_coeffs(t)
+        polys.append([[float(val) for val in coeff.coeffs] for coeff in coeffs])
+    lead, roots, residual = bq.factorize_bq_poly_numeric(np.array(polys))
+    assert lead.shape == (4,)
+    assert roots.shape == (4, 2)
+    assert np.all(residual < 1e-10)
+
+
+def test_all_factorizations():
+    t = sy.symbols("t")
+    h1 = bq.rand_rational() + bq.rand_line()
+    h2 = bq.rand_rational() + bq.rand_line()
+    h3 = bq.rand_rational() + bq.rand_line()
+    poly = bq.Poly((t - h1) * (t - h2) * (t - h3), t)
+    norm_poly = bq.Poly(poly.norm().poly.scal, *poly.indets)
+    _, facts = bq.irreducible_factors(norm_poly)
+
+    serial = list(bq.all_factorizations(poly, facts, max_workers=1))
+    parallel = list(bq.all_factorizations(poly, facts, max_workers=2))
+    assert len(serial) == len(parallel) == 6
+    for factorization in serial:
+        assert factorization in parallel
+        product = 1
+        for fac in factorization:
+            product *= fac
+        assert product == poly
+    assert bq.factorize_from_list(poly, facts) in serial
+
+
+def test_factorization_cache(tmp_path):
+    t, s = sy.symbols("t s")
+    h1 = bq.rand_rational() + bq.rand_line()
+    h2 = bq.rand_rational() + bq.rand_line()
+    poly = bq.Poly((t - h1) * (t - h2), t)
+    path = str(tmp_path / "factorizations.db")
+
+    cache = bq.FactorizationCache(maxsize=1, path=path)
+    factors = cache.factorize_bq_poly(poly)
+    assert factors[0] * factors[1] == poly
+    scaled = cache.factorize_bq_poly(bq.Poly(2 * bq.JJ * (s - h1) * (s - h2), s))
+    assert scaled[0] * scaled[1] == bq.Poly((s - h1) * (s - h2), s)
+    assert cache.stats["misses"] == 1 and cache.stats["hits"] == 1
+
+    norm = bq.Poly(poly.norm().poly.scal, t)
+    lcoeff, norm_factors = cache.irreducible_factors(3 * norm)
+    assert lcoeff == 3 and len(norm_factors) == 2
+    assert cache.stats["size"] == 1 and cache.stats["disk_size"] == 2
+    cache.close()
+
+    cache = bq.FactorizationCache(path=path)
+    assert cache.factorize_bq_poly(poly) == factors
+    assert cache.stats["disk_hits"] == 1 and cache.stats["misses"] == 0
+    cache.close()
+
+
+def test_factorization_cache_coefficient_symbols():
+    t, s = sy.symbols("t s")
+    cache = bq.FactorizationCache()
+    lcoeff, factors = cache.irreducible_factors(bq.Poly(2 * s**2 - 2 * t**2, s))
+    assert lcoeff == 2
+    assert sorted(str(fac.poly) for fac in factors) == ["s + t", "s - t"]
+    assert all(fac.indets == [s] for fac in factors)
+
+
+def test_factorization_cache_threads(tmp_path):
+    t = sy.symbols("t")
+    quats = [
+        bq.BiQuaternion([0, 1, 0, 0, 0, 0, 1, 2]),
+        bq.BiQuaternion([-3, 0, 1, 0, 0, 3, 0, 1]),
+        bq.BiQuaternion([3, 0, 0, 1, 0, 1, 1, 0]),
+    ]
+    polys = [
+        bq.Poly((t - quats[m]) * (t - quats[n]), t)
+        for m, n in [(0, 1), (1, 2), (0, 2), (1, 0)]
+    ]
+    cache = bq.FactorizationCache(path=str(tmp_path / "factorizations.db"))
+    cache.factorize_bq_poly(polys[0])
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(cache.factorize_bq_poly, polys + polys))
+    for poly, factors in zip(polys + polys, results):
+        assert factors[0] * factors[1] == poly
+    assert cache.stats["misses"] + cache.stats["hits"] == 9
+    assert cache.stats["disk_size"] == 4
+    cache.close()
+
+
+def test_reduce_poly():
+    t = sy.symbols("t")
+    h1 = bq.rand_rational() + bq.rand_line()
+    h2 = bq.rand_rational() + bq.rand_line()
+    poly = bq.Poly((t - h1) * (t - h2), t)
+    assert bq.max_real_poly_fact(poly) == 1
+    assert bq.is_poly_reduced(poly)
+
+    multiple = poly * bq.Poly(3 * t**2 + 3, t)
+    assert bq.max_real_poly_fact(multiple) == t**2 + 1
+    assert bq.gcd_conj_pd(multiple) == t**2 + 1
+    assert not bq.is_poly_reduced(multiple)
+    gcd, reduced = bq.reduce_poly(multiple)
+    assert gcd == t**2 + 1
+    assert reduced == 3 * poly
+    assert bq.is_poly_reduced(reduced)
+
+
+def test_irreducible_factors_multiplicities():
+    t = sy.symbols("t")
+    poly = bq.Poly(3 * (t**2 + 1) ** 2 * (t**2 + 2 * t + 5) * (t - 1) ** 3, t)
+    lcoeff, factors = bq.irreducible_factors(poly, multiplicities=True)
+    assert lcoeff == 3
+    assert sorted((str(fac.poly), mult) for fac, mult in factors) == [
+        ("t - 1", 3),
+        ("t**2 + 1", 2),
+        ("t**2 + 2*t + 5", 1),
+    ]
+    _, factors = bq.irreducible_factors(poly)
+    assert len(factors) == 6
+
+    _, factors = bq.irreducible_factors(bq.Poly(t**5 - 3 * t + 1, t))
+    assert [fac.deg(t) for fac in factors] == [1, 1, 1, 2]
+
+
+def test_numeric_factorization_equal_imaginary_parts():
+    # The roots of the norm are 0 +- i, -3 +- i and 3 +- i.
+    t = sy.symbols("t")
+    h1 = bq.BiQuaternion([0, 1, 0, 0, 0, 0, 1, 2])
+    h2 = bq.BiQuaternion([-3, 0, 1, 0, 0, 3, 0, 1])
+    h3 = bq.BiQuaternion([3, 0, 0, 1, 0, 1, 1, 0])
+    poly = bq.Poly((t - h1) * (t - h2) * (t - h3), t)
+    _, roots, residual = bq.factorize_bq_poly_numeric(poly)
+    assert residual < 1e-10
+    np.testing.assert_allclose(sorted(roots.data[:, 0]), [-3, 0, 3], atol=1e-10)
+
+
+def test_irreducible_factors_exact():
+    t = sy.symbols("t")
+    _, factors = bq.irreducible_factors(bq.Poly(t**4 + 1, t))
+    assert sorted(str(fac.poly) for fac in factors) == [
+        "t**2 + sqrt(2)*t + 1",
+        "t**2 - sqrt(2)*t + 1",
+    ]
+    _, factors = bq.irreducible_factors(bq.Poly(t**3 - 2, t))
+    assert factors[0] == bq.Poly(t - 2 ** sy.Rational(1, 3), t)
+    assert sy.expand(factors[0].poly * factors[1].poly) == t**3 - 2
+
+
+def test_irreducible_factors_inexact():
+    t = sy.symbols("t")
+    poly = bq.Poly((t - sy.Rational(1, 3)) ** 3 * (t**2 + 2), t)
+    _, factors = bq.irreducible_factors(poly, domain="RR", multiplicities=True)
+    assert sorted((fac.deg(t), mult) for fac, mult in factors) == [(1, 3), (2, 1)]
+
+
+def test_factorization_irreducible_quartic_norm():
+    t = sy.symbols("t")
+    # The norm t**4 + 2*t**3 + 12*t**2 + 4*t + 14 is irreducible over QQ.
+    primal = t**2 + (1 + 2 * bq.II - bq.JJ) * t + 3 + bq.JJ - 2 * bq.KK
+    trans = bq.II + 2 * bq.JJ + 3 * bq.KK
+    poly = bq.Poly((1 + bq.EE * trans) * primal * (1 - bq.EE * trans), t)
+    factors = bq.factorize_bq_poly(poly, tol=1e-20)
+    assert [fac.deg(t) for fac in factors] == [1, 1]
+    diff = (factors[0] * factors[1] - poly).expanded()
+    for coeff in diff.coeffs:
+        assert all(abs(val) < 1e-18 for val in sy.Poly(coeff, t).coeffs())
@@ -1,5 +1,8 @@
+import biquaternion_py as bq
 import biquaternion_py.polynomials as bp
 from biquaternion_py import Poly
+import numpy as np
+import pytest
 import sympy as sy
 
 t, s = sy.symbols("t s")
@@ -65,3 +68,87 @@ def test_eval_poly():
     assert sum(a) == q.eval((1), True)
     assert sum(a) + sum(b) == (p + q).eval([1, 1], False)
     assert sum(a) + sum(b) == (p + q).eval((1, 1), False)
+
+
+def test_powers():
+    h = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    p = Poly(t - h, t)
+    assert p**5 == p * p * p * p * p
+    assert p**1 == p
+    assert p**0 == Poly(1, t)
+    assert Poly(t + s, [t, s]) ** 3 == Poly(sy.expand((t + s) ** 3), [t, s])
+
+
+def test_eval_array():
+    quat = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    p = Poly(t**3 * quat + t * s * bq.II - 2, [t, s])
+    t_vals = np.linspace(-1, 1, 7)
+    out = p.eval([t_vals, np.array(2.0)])
+    assert out.shape == (7, 8)
+    for val, row in zip(t_vals, out):
+        expected = p.eval([sy.Rational(val), 2])
+        np.testing.assert_allclose(row, [float(c) for c in expected.coeffs])
+    assert Poly(quat, t).eval(np.zeros(3)).shape == (3, 8)
+
+
+def test_eval_left_right():
+    quat = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    p = Poly(t**2 * quat + t * bq.JJ, t)
+    assert p.eval(bq.II, True) == quat * bq.II * bq.II + bq.JJ * bq.II
+    assert p.eval(bq.II, False) == bq.II * bq.II * quat + bq.II * bq.JJ
+
+
+def test_cached_metadata():
+    quat = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    p = Poly(t**2 * quat + t * bq.II + 1, t)
+    q = Poly(t**3 - bq.JJ, t)
+    assert p.deg(t) == 2 and p.lcoeff(t) == quat
+    assert q.deg(t) == 3 and q.lcoeff(t) == 1
+    prod = p * q
+    assert prod._lead(t) == (5, quat)
+    assert prod.lcoeff(t) == Poly(prod.poly, t).lcoeff(t)
+    assert (p + q)._lead(t) == (3, 1)
+    assert (-p)._lead(t) == (2, -quat)
+    assert p.terms() == p.terms()
+    assert p.all_indet_coeffs(t) == [1, bq.II, quat]
+
+
+def test_zero_divisor_degree():
+    p = Poly(t * bq.EE + 1, t)
+    p.lcoeff(t)
+    prod = p * p
+    assert prod._lead(t) is None
+    assert prod.deg(t) == 1
+
+
+def test_poly_div():
+    quat_1 = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    quat_2 = bq.BiQuaternion([2, -1, 0, 3, 1, 0, 0, 2])
+    f = Poly(t**4 * quat_1 + t**2 * bq.II + t * quat_2 - 3, t)
+    g = Poly(t**2 * quat_2 + t * bq.JJ + 1, t)
+    quot, rem = bq.poly_div(f, g, t)
+    assert rem.deg(t) < 2
+    assert f == g * quot + rem
+    quot, rem = bq.poly_div(f, g, t, False)
+    assert rem.deg(t) < 2
+    assert f == quot * g + rem
+    assert bq.poly_div(f, g, t, False, fraction_free=True) == (quot, rem)
+    with pytest.raises(ValueError):
+        bq.poly_div(Poly(s * f.poly, t, s), g, t, fraction_free=True)
+
+
+def test_norm_poly():
+    quat_1 = bq.BiQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+    quat_2 = bq.BiQuaternion(list(a))
+    p = Poly(t**2 * quat_1 + s * t * quat_2 - 3, t, s)
+    norm = p.norm().expanded()
+    scal, eps = p.norm_poly()
+    assert sy.expand(scal.as_expr() - norm.scal) == 0
+    assert sy.expand(eps.as_expr() - norm.eps) == 0
+
+    with bq.use_algebra(bq.Algebra(-1, 2, 1)):
+        p = Poly(t * quat_1 + quat_2, t)
+        norm = p.norm().expanded()
+        scal, eps = p.norm_poly()
+    assert sy.expand(scal.as_expr() - norm.scal) == 0
+    assert sy.expand(eps.as_expr() - norm.eps) == 0
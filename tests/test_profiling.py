@@ -0,0 +1,26 @@
+import biquaternion_py as bq
+from biquaternion_py import profiling
+import sympy as sy
+
+
+def test_profile():
+    t = sy.Symbol("t")
+    poly = bq.Poly((t - bq.II) * (t - bq.JJ), t)
+    with profiling.profile() as stats:
+        bq.BiQuaternion([1, 2]) * bq.BiQuaternion([3, 4])
+        bq.poly_div(poly, bq.Poly(t - bq.JJ, t), t)
+    assert stats["BiQuaternion.__mul__"]["count"] >= 1
+    assert stats["poly_div"]["count"] == 1
+    assert stats["poly_div"]["time"] > 0
+    assert "poly_div" in profiling.summary(stats)
+
+
+def test_disabled():
+    profiling.reset()
+    bq.BiQuaternion([1, 2]) * bq.BiQuaternion([3, 4])
+    assert profiling.get_stats() == {}
+    profiling.enable()
+    bq.BiQuaternion([1, 2]).inv()
+    profiling.disable()
+    assert profiling.get_stats()["BiQuaternion.inv"]["count"] == 1
+    profiling.reset()